@@ -0,0 +1,2 @@
+"""Backtesting package - turns strategy signals into positions and performance."""
+from .vectorized import VectorizedBacktester
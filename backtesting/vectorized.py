@@ -0,0 +1,278 @@
+"""Vectorized single-asset backtester.
+
+Signals are turned into a position series by forward-filling the target
+position of each signal, and every result (equity, drawdown, costs, the
+trade list) is derived from that series with whole-array operations, so the
+cost grows linearly with the number of bars without a per-bar Python loop.
+"""
+import numpy as np
+import pandas as pd
+from typing import Dict
+from core.models import BacktestResult, SignalBatch, Signals, SignalType
+from core.exceptions import BacktestError
+from utils.logging import setup_logger
+
+logger = setup_logger(__name__)
+
+TRADE_COLUMNS = [
+    'entry_time', 'exit_time', 'direction', 'entry_price', 'exit_price',
+    'bars', 'gross_return', 'net_return', 'open',
+]
+
+
+def _forward_fill(values: np.ndarray, initial: float) -> np.ndarray:
+    """Replaces each NaN with the last non-NaN value before it, or `initial`."""
+    observed = ~np.isnan(values)
+    last = np.maximum.accumulate(np.where(observed, np.arange(len(values)), -1))
+    filled = values[np.maximum(last, 0)]
+    filled[last < 0] = initial
+    return filled
+
+
+def performance_stats(
+    equity: np.ndarray,
+    returns: np.ndarray,
+    drawdown: np.ndarray,
+    initial_capital: float,
+    periods_per_year: int,
+) -> Dict[str, float]:
+    """Return and risk statistics of an equity curve.
+
+    Args:
+        equity: Account value at each bar.
+        returns: The per-bar returns to measure volatility and Sharpe ratio on.
+        drawdown: Decline of `equity` from its running peak.
+        initial_capital: Account value before the first bar.
+        periods_per_year: Bars per year, used to annualize.
+
+    Returns:
+        Dict[str, float]: Bars, initial and final equity, total and annualized
+        return, annualized volatility, Sharpe ratio (zero risk-free rate) and
+        maximum drawdown.
+    """
+    n = len(equity)
+    final = float(equity[-1]) if n else initial_capital
+    volatility = float(returns.std(ddof=1)) if len(returns) > 1 else float('nan')
+    annualizer = np.sqrt(periods_per_year)
+    return {
+        'bars': n,
+        'initial_capital': initial_capital,
+        'final_equity': final,
+        'total_return': final / initial_capital - 1.0,
+        'annualized_return': (final / initial_capital) ** (periods_per_year / n) - 1.0 if n else 0.0,
+        'annualized_volatility': float(volatility * annualizer),
+        'sharpe_ratio': float(returns.mean() / volatility * annualizer) if volatility > 0 else float('nan'),
+        'max_drawdown': float(drawdown.min()) if n else 0.0,
+    }
+
+
+class VectorizedBacktester:
+    """Replays strategy signals on one asset's closing prices.
+
+    A BUY signal goes long with the whole account at the signal bar's close.
+    A SELL signal goes flat, or short when `allow_short` is set. The position
+    is kept until a signal changes it; HOLD signals and signals at timestamps
+    missing from the data are ignored. Every change of position pays
+    `fee_rate + slippage` on the traded value, so a long-to-short flip pays
+    twice.
+    """
+
+    def __init__(
+        self,
+        initial_capital: float = 10_000.0,
+        fee_rate: float = 0.0,
+        slippage: float = 0.0,
+        allow_short: bool = False,
+        periods_per_year: int = 252,
+    ):
+        """Initializes the backtester.
+
+        Args:
+            initial_capital: Account value before the first bar.
+            fee_rate: Commission as a fraction of the traded value.
+            slippage: Execution price impact as a fraction of the traded value.
+            allow_short: Whether SELL signals open a short position instead of closing to flat.
+            periods_per_year: Bars per year, used to annualize returns and volatility.
+
+        Raises:
+            ValueError: If a parameter is out of range.
+        """
+        if initial_capital <= 0:
+            raise ValueError(f"initial_capital must be positive, got {initial_capital}")
+        if fee_rate < 0 or slippage < 0:
+            raise ValueError("fee_rate and slippage must not be negative")
+        if fee_rate + slippage >= 0.5:
+            raise ValueError("fee_rate + slippage must be below 0.5")
+        if periods_per_year <= 0:
+            raise ValueError(f"periods_per_year must be positive, got {periods_per_year}")
+        self.initial_capital = float(initial_capital)
+        self.fee_rate = float(fee_rate)
+        self.slippage = float(slippage)
+        self.allow_short = allow_short
+        self.periods_per_year = periods_per_year
+
+    def target_positions(self, df: pd.DataFrame, signals: Signals, initial_position: float = 0.0) -> np.ndarray:
+        """Returns the position held after each bar's close.
+
+        Args:
+            df: The market data.
+            signals: The strategy signals.
+            initial_position: Position held until the first signal in `df`.
+
+        Returns:
+            np.ndarray: 1.0 long, -1.0 short or 0.0 flat for every bar.
+        """
+        batch = SignalBatch.from_signals(signals)
+        targets = np.full(len(df), np.nan)
+        rows = batch.positions(df.index)
+        exit_position = -1.0 if self.allow_short else 0.0
+        values = np.where(batch.mask(SignalType.BUY), 1.0,
+                          np.where(batch.mask(SignalType.SELL), exit_position, np.nan))
+        keep = (rows >= 0) & ~np.isnan(values)
+        # With several signals on one bar the last one wins.
+        targets[rows[keep]] = values[keep]
+        return _forward_fill(targets, initial_position)
+
+    def run(self, df: pd.DataFrame, signals: Signals, initial_position: float = 0.0) -> BacktestResult:
+        """Backtests the signals over the market data.
+
+        Args:
+            df: The market data, with a 'Close' column.
+            signals: The strategy signals. Signals outside `df` are ignored.
+            initial_position: Position the strategy is in before the first
+                bar, e.g. when `df` is a window of a longer series. The
+                account starts in cash and enters it at the first bar's close.
+
+        Returns:
+            BacktestResult: Equity curve, returns, drawdown, positions, trades and statistics.
+
+        Raises:
+            BacktestError: If the data has no 'Close' column.
+        """
+        return self.evaluate(df, self.target_positions(df, signals, initial_position))
+
+    def evaluate(self, df: pd.DataFrame, position: np.ndarray) -> BacktestResult:
+        """Backtests a position series over the market data.
+
+        The account starts in cash before the first bar.
+
+        Args:
+            df: The market data, with a 'Close' column.
+            position: Position held after each bar's close: 1.0 long,
+                -1.0 short or 0.0 flat.
+
+        Returns:
+            BacktestResult: Equity curve, returns, drawdown, positions, trades and statistics.
+
+        Raises:
+            BacktestError: If the data has no 'Close' column.
+        """
+        if 'Close' not in df.columns:
+            raise BacktestError("Backtest requires a 'Close' column")
+        close = df['Close'].to_numpy(dtype='float64', na_value=np.nan)
+        position = np.asarray(position, dtype='float64')
+        n = len(close)
+
+        # Bar i earns the position held after bar i-1 times its close-to-close
+        # return; bars without a valid return earn nothing.
+        market = np.zeros(n)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            market[1:] = close[1:] / close[:-1] - 1.0
+        market[~np.isfinite(market)] = 0.0
+        held = np.concatenate(([0.0], position[:-1]))
+        gross_factor = 1.0 + held * market
+
+        # A bar that loses the whole account, e.g. a short through a price
+        # rise of 100% or more, leaves zero equity: the position is closed
+        # at that bar and nothing more is traded.
+        wiped_out = np.flatnonzero(gross_factor <= 0.0)
+        if len(wiped_out):
+            bar = wiped_out[0]
+            logger.warning(f"Account wiped out at {df.index[bar]}; the position is closed")
+            position = position.copy()
+            position[bar:] = 0.0
+            held = np.concatenate(([0.0], position[:-1]))
+            gross_factor = np.maximum(1.0 + held * market, 0.0)
+
+        # Costs are charged at the close where the position changes.
+        turnover = np.abs(np.diff(position, prepend=0.0))
+        cost_factor = 1.0 - turnover * (self.fee_rate + self.slippage)
+        growth = gross_factor * cost_factor
+        equity = self.initial_capital * np.cumprod(growth)
+        traded_value = equity / cost_factor * turnover
+
+        drawdown = equity / np.maximum.accumulate(equity) - 1.0
+        with np.errstate(divide='ignore'):
+            log_growth = np.cumsum(np.log(gross_factor))
+        trades = self._trades(df.index, close, position, log_growth)
+
+        stats = self._stats(equity, growth - 1.0, gross_factor, drawdown, position, turnover, trades)
+        stats['fees_paid'] = float((traded_value * self.fee_rate).sum())
+        stats['slippage_paid'] = float((traded_value * self.slippage).sum())
+        logger.info(
+            f"Backtest: {stats['total_return']:.2%} total return, "
+            f"{stats['max_drawdown']:.2%} max drawdown, {stats['trades']} trades"
+        )
+
+        return BacktestResult(
+            equity=pd.Series(equity, index=df.index, name='equity'),
+            returns=pd.Series(growth - 1.0, index=df.index, name='returns'),
+            drawdown=pd.Series(drawdown, index=df.index, name='drawdown'),
+            positions=pd.Series(position, index=df.index, name='position'),
+            trades=trades,
+            stats=stats,
+        )
+
+    def _trades(self, index: pd.Index, close: np.ndarray, position: np.ndarray, log_growth: np.ndarray) -> pd.DataFrame:
+        """Builds the trade list: one trade per run of bars with the same non-zero position.
+
+        A trade's gross return is the compounded return of the bars it held,
+        so the trades reconcile with the equity curve; the net return also
+        pays the costs of entering and, if closed, exiting.
+        """
+        n = len(position)
+        changes = np.flatnonzero(np.diff(position, prepend=0.0))
+        segment_ends = np.append(changes[1:], n)
+        in_market = position[changes] != 0
+        entries, exits = changes[in_market], segment_ends[in_market]
+        is_open = exits == n
+        exits = np.minimum(exits, n - 1)
+
+        gross = np.expm1(log_growth[exits] - log_growth[entries])
+        rate = self.fee_rate + self.slippage
+        net = (1.0 + gross) * (1.0 - rate) * np.where(is_open, 1.0, 1.0 - rate) - 1.0
+        return pd.DataFrame({
+            'entry_time': index[entries],
+            'exit_time': index[exits],
+            'direction': position[entries].astype(np.int8),
+            'entry_price': close[entries],
+            'exit_price': close[exits],
+            'bars': exits - entries,
+            'gross_return': gross,
+            'net_return': net,
+            'open': is_open,
+        }, columns=TRADE_COLUMNS)
+
+    def _stats(
+        self,
+        equity: np.ndarray,
+        returns: np.ndarray,
+        gross_factor: np.ndarray,
+        drawdown: np.ndarray,
+        position: np.ndarray,
+        turnover: np.ndarray,
+        trades: pd.DataFrame,
+    ) -> Dict[str, float]:
+        """Computes the summary statistics of a backtest."""
+        n = len(equity)
+        # The first bar has no return.
+        stats = performance_stats(equity, returns[1:], drawdown, self.initial_capital, self.periods_per_year)
+        closed = trades.loc[~trades['open'], 'net_return']
+        stats.update({
+            'gross_total_return': float(np.prod(gross_factor)) - 1.0,
+            'trades': len(trades),
+            'win_rate': float((closed > 0).mean()) if len(closed) else float('nan'),
+            'exposure': float((position != 0).mean()) if n else 0.0,
+            'turnover': float(turnover.sum()),
+        })
+        return stats
@@ -0,0 +1,43 @@
+"""Benchmarks the vectorized backtester on SMA crossover signals.
+
+Run from the repository root::
+
+    python -m benchmarks.bench_backtest [--rows N] [--repeat R]
+
+The backtest is timed at every power of ten up to N one-minute bars, with
+fees, slippage and short selling enabled.
+"""
+import argparse
+import timeit
+import numpy as np
+import pandas as pd
+from backtesting import VectorizedBacktester
+from strategies.sma_crossover import SMACrossoverStrategy
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark the vectorized backtester.")
+    parser.add_argument("--rows", type=int, default=10_000_000, help="Largest input length.")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per measurement; the best is reported.")
+    args = parser.parse_args()
+
+    strategy = SMACrossoverStrategy()
+    backtester = VectorizedBacktester(fee_rate=0.001, slippage=0.0005, allow_short=True, periods_per_year=252 * 390)
+    rng = np.random.default_rng(0)
+
+    print(f"{'rows':>12}{'signals':>10}{'trades':>10}{'backtest ms':>14}")
+    rows = 10_000
+    while rows <= args.rows:
+        index = pd.date_range("2000-01-01", periods=rows, freq="min")
+        df = pd.DataFrame({'Close': 100 * np.exp(rng.normal(0, 1e-3, rows).cumsum())}, index=index)
+        indicators = {"SMA_10": df['Close'].rolling(10).mean(), "SMA_50": df['Close'].rolling(50).mean()}
+        signals = strategy.generate_signals(df, indicators)
+        result = backtester.run(df, signals)
+        seconds = min(timeit.repeat(lambda: backtester.run(df, signals), number=1, repeat=args.repeat))
+        print(f"{rows:>12,}{len(signals):>10,}{result.stats['trades']:>10,}{seconds * 1e3:>14.1f}")
+        del df, indicators, signals, result
+        rows *= 10
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+"""Benchmarks the indicator thread pool of `TradingEngine.analyze`.
+
+Run from the repository root::
+
+    python -m benchmarks.bench_indicator_threads [--rows N] [--repeat R] [--workers 1 2 4 8]
+
+Each row reports the best of R `analyze` calls, without a strategy, for one
+backend and `indicator_workers` setting, and the speedup over one worker.
+The gain depends on how much of each indicator runs in kernels that release
+the GIL, and on the number of cores.
+"""
+import argparse
+import timeit
+from typing import List
+import numpy as np
+import pandas as pd
+from core.abstractions import Indicator
+from engine import TradingEngine
+from indicators.moving_averages import ExponentialMovingAverage, SimpleMovingAverage
+from indicators.oscillators import RelativeStrengthIndex, StochasticOscillator
+from indicators.volatility import AverageTrueRange, BollingerBands, DonchianChannel
+
+
+def _indicators() -> List[Indicator]:
+    """Returns a configuration of independent indicators over several windows."""
+    indicators: List[Indicator] = []
+    for period in (10, 20, 50, 200):
+        indicators += [
+            SimpleMovingAverage(period=period), ExponentialMovingAverage(period=period),
+            RelativeStrengthIndex(period=period), StochasticOscillator(period=period),
+            BollingerBands(period=period), DonchianChannel(period=period), AverageTrueRange(period=period),
+        ]
+    return indicators
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark the indicator thread pool.")
+    parser.add_argument("--rows", type=int, default=1_000_000, help="Bars in the series.")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per measurement; the best is reported.")
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4, 8], help="indicator_workers settings.")
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    close = 100 * np.exp(rng.normal(0, 1e-3, args.rows).cumsum())
+    spread = rng.uniform(0, 0.1, args.rows)
+    index = pd.date_range("2000-01-01", periods=args.rows, freq="min")
+    df = pd.DataFrame({'High': close + spread, 'Low': close - spread, 'Close': close}, index=index)
+    indicators = _indicators()
+
+    print(f"{len(indicators)} indicators, {args.rows} bars")
+    print(f"{'backend':<10}{'workers':>8}{'ms':>10}{'speedup':>10}")
+    for backend in ("pandas", "numpy"):
+        baseline = None
+        for workers in args.workers:
+            engine = TradingEngine(None, indicators, None, indicator_backend=backend, indicator_workers=workers)
+            elapsed = min(timeit.repeat(lambda: engine.analyze(df), number=1, repeat=args.repeat)) * 1e3
+            baseline = baseline or elapsed
+            print(f"{backend:<10}{workers:>8}{elapsed:>10.1f}{baseline / elapsed:>9.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+"""Benchmarks `TradingEngine.run_many` against sequential `run` calls.
+
+Run from the repository root::
+
+    python -m benchmarks.bench_pipeline [--tickers N] [--latency S] [--rows R]
+
+The data source simulates a network fetch by sleeping `latency` seconds
+before returning a random series, and the visualizer sleeps `latency`
+seconds as well, so the benchmark measures how much of the I/O and the
+computation the pipeline overlaps rather than the machine's CPU count.
+"""
+import argparse
+import time
+import numpy as np
+import pandas as pd
+from core.models import DataFetchConfig
+from engine import TradingEngine
+from indicators.moving_averages import SimpleMovingAverage
+from indicators.oscillators import RelativeStrengthIndex
+from strategies.sma_crossover import SMACrossoverStrategy
+
+
+class SlowSource:
+    """Returns random bars after a fixed delay."""
+
+    def __init__(self, latency: float, rows: int):
+        self.latency = latency
+        self.rows = rows
+
+    def fetch_data(self, config: DataFetchConfig) -> pd.DataFrame:
+        time.sleep(self.latency)
+        rng = np.random.default_rng(abs(hash(config.ticker)) % 2**32)
+        index = pd.date_range("2000-01-01", periods=self.rows, freq="min")
+        return pd.DataFrame({'Close': 100 * np.exp(rng.normal(0, 1e-3, self.rows).cumsum())}, index=index)
+
+    def stats(self) -> dict:
+        return {}
+
+
+class SlowVisualizer:
+    """Stands in for chart rendering with a fixed delay."""
+
+    def __init__(self, latency: float):
+        self.latency = latency
+
+    def render(self, df, indicators, signals, output_path) -> None:
+        time.sleep(self.latency)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark the pipelined batch mode.")
+    parser.add_argument("--tickers", type=int, default=32, help="Configurations to run.")
+    parser.add_argument("--latency", type=float, default=0.2, help="Seconds per fetch and per render.")
+    parser.add_argument("--rows", type=int, default=100_000, help="Bars per ticker.")
+    parser.add_argument("--fetch-workers", type=int, default=8)
+    parser.add_argument("--compute-workers", type=int, default=2)
+    parser.add_argument("--render-workers", type=int, default=2)
+    args = parser.parse_args()
+
+    engine = TradingEngine(
+        SlowSource(args.latency, args.rows),
+        [SimpleMovingAverage(period=10), SimpleMovingAverage(period=50), RelativeStrengthIndex(period=14)],
+        SlowVisualizer(args.latency),
+        SMACrossoverStrategy(fast_ma_name="SMA_10", slow_ma_name="SMA_50"),
+    )
+    configs = [DataFetchConfig(ticker=f"T{i}") for i in range(args.tickers)]
+
+    started = time.perf_counter()
+    for config in configs:
+        engine.run(config, "unused.png")
+    sequential = time.perf_counter() - started
+
+    started = time.perf_counter()
+    count = sum(1 for _ in engine.run_many(
+        configs, fetch_workers=args.fetch_workers, compute_workers=args.compute_workers,
+        render_workers=args.render_workers,
+    ))
+    pipelined = time.perf_counter() - started
+
+    print(f"{'mode':>12}{'runs':>8}{'seconds':>10}{'runs/s':>10}")
+    print(f"{'sequential':>12}{len(configs):>8}{sequential:>10.2f}{len(configs) / sequential:>10.1f}")
+    print(f"{'run_many':>12}{count:>8}{pipelined:>10.2f}{count / pipelined:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+"""Benchmarks the rolling-window kernels against their pandas equivalents.
+
+Run from the repository root::
+
+    python -m benchmarks.bench_rolling [--rows N] [--repeat R]
+
+Each row reports the best of R runs for one kernel and window length. The
+kernels' cost does not depend on the window length.
+"""
+import argparse
+import timeit
+from typing import Callable, List, Tuple
+import numpy as np
+import pandas as pd
+from indicators import rolling
+
+WINDOWS = (5, 50, 500, 5000)
+
+
+def _cases(high: pd.Series, low: pd.Series, close: pd.Series, window: int) -> List[Tuple[str, Callable, Callable]]:
+    """Returns (name, kernel call, pandas call) triples for one window length."""
+    h, l, c = high.to_numpy(), low.to_numpy(), close.to_numpy()
+    prev = close.shift()
+    return [
+        ("max", lambda: rolling.rolling_max(c, window), lambda: close.rolling(window).max()),
+        ("min", lambda: rolling.rolling_min(c, window), lambda: close.rolling(window).min()),
+        ("std", lambda: rolling.rolling_std(c, window), lambda: close.rolling(window).std()),
+        ("true_range", lambda: rolling.true_range(h, l, c),
+         lambda: pd.concat([high - low, (high - prev).abs(), (low - prev).abs()], axis=1).max(axis=1)),
+    ]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark rolling kernels against pandas.")
+    parser.add_argument("--rows", type=int, default=1_000_000, help="Series length.")
+    parser.add_argument("--repeat", type=int, default=5, help="Runs per measurement; the best is reported.")
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    close = pd.Series(100 + rng.normal(0, 1, args.rows).cumsum())
+    spread = pd.Series(rng.uniform(0, 1, args.rows))
+    high, low = close + spread, close - spread
+
+    print(f"{'kernel':<12}{'window':>8}{'kernel ms':>12}{'pandas ms':>12}{'speedup':>10}")
+    for window in WINDOWS:
+        for name, kernel, reference in _cases(high, low, close, window):
+            if name == "true_range" and window != WINDOWS[0]:
+                continue
+            ours = min(timeit.repeat(kernel, number=1, repeat=args.repeat)) * 1e3
+            theirs = min(timeit.repeat(reference, number=1, repeat=args.repeat)) * 1e3
+            print(f"{name:<12}{window:>8}{ours:>12.2f}{theirs:>12.2f}{theirs / ours:>9.2f}x")
+
+
+if __name__ == "__main__":
+    main()
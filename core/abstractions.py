@@ -1,7 +1,8 @@
 from abc import ABC, abstractmethod
-from typing import Dict, Literal, List
+from typing import Any, Dict, Literal, List, Mapping, Optional, Sequence
 import pandas as pd
-from core.models import DataFetchConfig, Signal
+from core.models import DataFetchConfig, Signals, BatchFetchResult
+from core.graph import Node
 
 class DataSource(ABC):
     """Abstract base class for data sources."""
@@ -21,6 +22,44 @@ class DataSource(ABC):
         """
         pass
 
+    def fetch_many(self, configs: List[DataFetchConfig]) -> BatchFetchResult:
+        """Fetches market data for several tickers.
+
+        The default implementation calls `fetch_data` once per config.
+        Sources with a native batch API should override it.
+
+        Args:
+            configs: The data fetch configurations, one per ticker.
+
+        Returns:
+            BatchFetchResult: Fetched data and per-ticker errors. A failing
+            ticker does not abort the batch.
+        """
+        result = BatchFetchResult()
+        for config in configs:
+            try:
+                result.data[config.ticker] = self.fetch_data(config)
+            except Exception as e:
+                result.errors[config.ticker] = e
+        return result
+
+    @property
+    def batches_fetches(self) -> bool:
+        """Whether `fetch_many` needs fewer upstream requests than one per ticker.
+
+        True when a subclass overrides `fetch_many`; wrappers such as
+        `ConcurrentFetchExecutor` then hand it whole batches.
+        """
+        return type(self).fetch_many is not DataSource.fetch_many
+
+    def stats(self) -> Dict[str, Any]:
+        """Returns runtime statistics of the source (cache hits, fetch latency, ...).
+
+        Returns:
+            Dict[str, Any]: Source statistics; empty for sources that keep none.
+        """
+        return {}
+
 class Indicator(ABC):
     """Abstract base class for technical indicators."""
     
@@ -36,6 +75,29 @@ class Indicator(ABC):
         """Returns the type of the indicator."""
         pass
 
+    @property
+    def params(self) -> Dict[str, Any]:
+        """Returns the indicator's constructor parameters.
+
+        The default collects public instance attributes, which by convention
+        mirror the constructor arguments. Used to identify equivalent
+        indicator instances, e.g. for result caching.
+        """
+        return {k: v for k, v in sorted(vars(self).items()) if not k.startswith('_')}
+
+    def node(self) -> Optional[Node]:
+        """Describes the indicator as a computation graph node.
+
+        Indicators returning a node declare their inputs, letting the engine
+        deduplicate identical indicators and share intermediates (differences,
+        cumulative sums, gain/loss series) between them. The node must
+        compute the same values as `calculate`.
+
+        Returns:
+            Optional[Node]: The output node, or None to always use `calculate`.
+        """
+        return None
+
     @abstractmethod
     def calculate(self, df: pd.DataFrame) -> pd.Series:
         """Calculates the indicator values.
@@ -51,6 +113,84 @@ class Indicator(ABC):
         """
         pass
 
+    def calculate_numpy(self, df: pd.DataFrame, dtype: str = "float64") -> pd.Series:
+        """Calculates the indicator on raw NumPy arrays.
+
+        Avoids the per-call overhead of pandas rolling/ewm dispatch, which
+        dominates on short series. Results must match `calculate` up to
+        floating-point rounding (and float32 precision when requested). The
+        default falls back to `calculate`.
+
+        Args:
+            df: The market data.
+            dtype: Working array dtype, 'float64' or 'float32'.
+
+        Returns:
+            pd.Series: The calculated indicator values.
+
+        Raises:
+            IndicatorCalculationError: If calculation fails.
+        """
+        return self.calculate(df)
+
+    @classmethod
+    def calculate_grid(cls, df: pd.DataFrame, periods: Sequence[int]) -> pd.DataFrame:
+        """Calculates the indicator for several periods at once.
+
+        The default builds one instance per period, passing it as the
+        `period` constructor argument. Indicators with a multi-period kernel
+        override this to compute all periods in a single pass.
+
+        Args:
+            df: The market data.
+            periods: The periods to compute.
+
+        Returns:
+            pd.DataFrame: The columns of each single-period indicator, in period order.
+
+        Raises:
+            IndicatorCalculationError: If calculation fails.
+        """
+        columns = []
+        for period in periods:
+            indicator = cls(period=period)  # type: ignore[call-arg]
+            result = indicator.calculate(df)
+            # Multi-output indicators return a DataFrame of already named columns.
+            columns.append(result if isinstance(result, pd.DataFrame) else result.rename(indicator.name))
+        return pd.concat(columns, axis=1)
+
+class StreamingIndicator(ABC):
+    """Interface for indicators that can be updated one bar at a time.
+
+    After `init_state` has consumed the history, each `update` costs O(1)
+    regardless of history length, and the sequence of returned values
+    matches what `calculate` would produce over the extended history.
+    """
+
+    @abstractmethod
+    def init_state(self, history: pd.DataFrame) -> None:
+        """Initializes the incremental state from historical bars.
+
+        Args:
+            history: The market data seen so far (may be empty).
+
+        Raises:
+            IndicatorCalculationError: If required columns are missing.
+        """
+        pass
+
+    @abstractmethod
+    def update(self, bar: Mapping[str, float]) -> float:
+        """Consumes one new bar and returns the indicator value at that bar.
+
+        Args:
+            bar: The new bar, e.g. a dict or a DataFrame row with a 'Close' entry.
+
+        Returns:
+            float: The indicator value, NaN while warming up.
+        """
+        pass
+
 class Strategy(ABC):
     """Abstract base class for trading strategies."""
 
@@ -61,7 +201,7 @@ class Strategy(ABC):
         pass
 
     @abstractmethod
-    def generate_signals(self, df: pd.DataFrame, indicators: Dict[str, pd.Series]) -> List[Signal]:
+    def generate_signals(self, df: pd.DataFrame, indicators: Dict[str, pd.Series]) -> Signals:
         """Generates trading signals based on data and indicators.
 
         Args:
@@ -69,7 +209,8 @@ class Strategy(ABC):
             indicators: A dictionary of calculated indicators.
 
         Returns:
-            List[Signal]: A list of generated trading signals.
+            Signals: The generated trading signals, as a list of `Signal`
+            objects or a columnar `SignalBatch`.
         """
         pass
 
@@ -77,13 +218,13 @@ class Visualizer(ABC):
     """Abstract base class for data visualization."""
     
     @abstractmethod
-    def render(self, df: pd.DataFrame, indicators: Dict[str, pd.Series], signals: List[Signal], output_path: str) -> None:
+    def render(self, df: pd.DataFrame, indicators: Dict[str, pd.Series], signals: Signals, output_path: str) -> None:
         """Renders the analysis results to a file.
 
         Args:
             df: The market data.
             indicators: A dictionary of calculated indicators.
-            signals: A list of trading signals.
+            signals: The trading signals, as a list or a `SignalBatch`.
             output_path: The path to save the visualization.
 
         Raises:
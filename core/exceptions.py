@@ -6,6 +6,10 @@ class DataFetchError(TradingEngineError):
     """Raised when data fetching fails."""
     pass
 
+class TransientDataFetchError(DataFetchError):
+    """Raised when data fetching fails for a reason that may pass (network error, rate limit)."""
+    pass
+
 class IndicatorCalculationError(TradingEngineError):
     """Raised when indicator calculation fails."""
     pass
@@ -21,3 +25,7 @@ class ConfigurationError(TradingEngineError):
 class FactoryError(TradingEngineError):
     """Raised when component creation fails."""
     pass
+
+class BacktestError(TradingEngineError):
+    """Raised when a backtest cannot be run."""
+    pass
@@ -1,10 +1,23 @@
+import os
 from typing import Dict, Any, List, Optional
 from core.abstractions import DataSource, Indicator, Visualizer, Strategy
 from core.models import DataFetchConfig
 from core.exceptions import FactoryError, ConfigurationError
 from utils.decorators import get_indicator_class, get_visualizer_class, get_strategy_class
 from data_sources.yfinance_source import YFinanceDataSource
+from data_sources.bar_store import BarStore
 from data_sources.csv_source import CSVDataSource
+from data_sources.parquet_source import ParquetDataSource
+from data_sources.mmap_source import MemoryMappedDataSource
+from data_sources.executor import ConcurrentFetchExecutor
+from data_sources.cached_source import CachedDataSource
+from utils.cache import TTLCache
+from utils.metrics import MetricsExporter, create_exporter
+from indicators.grid import IndicatorGrid
+from backtesting import VectorizedBacktester
+from optimization.sweep import ParameterSweep, sweep_template
+from optimization.walk_forward import WalkForwardOptimizer
+from scanning import UniverseScanner
 
 class ComponentFactory:
     """Factory for creating trading engine components."""
@@ -67,13 +80,130 @@ class ComponentFactory:
 
         # In Phase 1, we don't have concrete implementations yet.
         # This will be expanded in Phase 2.
+        source: DataSource
         if source_type == 'yfinance':
-             return YFinanceDataSource()
+             store_dir = ds_config.get('store_dir')
+             source = YFinanceDataSource(store=BarStore(store_dir) if store_dir else None)
         elif source_type == 'csv':
-             return CSVDataSource()
+             source = CSVDataSource(csv_path=ds_config.get('csv_path', 'data/ohlcv.csv'))
+        elif source_type == 'parquet':
+             source = ParquetDataSource(root_dir=ds_config.get('root_dir', 'data/parquet'))
+        elif source_type == 'mmap':
+             source = MemoryMappedDataSource(root_dir=ds_config.get('root_dir', 'data/bars'))
         else:
             raise FactoryError(f"Unsupported data source type: '{source_type}'")
 
+        fetch_config = self.config.get('fetch')
+        if fetch_config:
+            source = ConcurrentFetchExecutor(
+                source,
+                max_workers=fetch_config.get('max_workers', 8),
+                rate_limit=fetch_config.get('rate_limit_per_second'),
+                max_retries=fetch_config.get('max_retries', 3),
+                backoff_base=fetch_config.get('backoff_seconds', 0.5),
+            )
+
+        cache_config = self.config.get('cache') or {}
+        if cache_config.get('enabled', False):
+            # Everything but the per-request fields identifies the source's settings.
+            namespace = "|".join(
+                f"{k}={v}" for k, v in sorted(ds_config.items())
+                if k not in ('ticker', 'interval', 'start_date', 'end_date')
+            )
+            source = CachedDataSource(
+                source,
+                self._create_cache(cache_config),
+                namespace=namespace,
+                mode=cache_config.get('mode', 'normal'),
+            )
+        return source
+
+    def _create_cache(self, cache_config: Dict[str, Any], subdir: str = "") -> TTLCache:
+        """Creates a cache from the `cache` configuration section.
+
+        Args:
+            cache_config: The `cache` configuration section.
+            subdir: Optional subdirectory of the configured cache directory.
+
+        Returns:
+            TTLCache: The cache instance.
+        """
+        max_disk_mb = cache_config.get('max_disk_mb')
+        cache_dir = cache_config.get('dir', '.cache')
+        return TTLCache(
+            os.path.join(cache_dir, subdir) if subdir else cache_dir,
+            cache_config.get('ttl_seconds', 3600),
+            memory_entries=cache_config.get('memory_entries', 128),
+            max_disk_bytes=int(max_disk_mb * 1024 * 1024) if max_disk_mb else None,
+            max_disk_entries=cache_config.get('max_disk_entries'),
+            compression=cache_config.get('compression'),
+        )
+
+    def create_indicator_cache(self) -> Optional[TTLCache]:
+        """Creates the indicator result cache.
+
+        Enabled by `cache.indicators: true`. Results are content-addressed, so
+        the cache mode only matters in that 'bypass' disables it.
+
+        Returns:
+            Optional[TTLCache]: The cache instance or None if not configured.
+        """
+        cache_config = self.config.get('cache') or {}
+        if not cache_config.get('enabled', False) or not cache_config.get('indicators', False):
+            return None
+        if cache_config.get('mode') == 'bypass':
+            return None
+        return self._create_cache(cache_config, subdir='indicators')
+
+    def create_engine_options(self) -> Dict[str, Any]:
+        """Creates the engine keyword options from the optional `engine` section.
+
+        Returns:
+            Dict[str, Any]: `indicator_backend` ('pandas' or 'numpy'),
+            `indicator_dtype` ('float64' or 'float32'), `indicator_workers`
+            (threads evaluating indicators, 1 for sequential) and
+            `track_memory` (record peak memory deltas in the metrics).
+
+        Raises:
+            ConfigurationError: If an option is not supported.
+        """
+        engine_config = self.config.get('engine') or {}
+        backend = engine_config.get('indicator_backend', 'pandas')
+        dtype = engine_config.get('indicator_dtype', 'float64')
+        if backend not in ('pandas', 'numpy'):
+            raise ConfigurationError(f"Unsupported indicator backend: '{backend}'")
+        if dtype not in ('float64', 'float32'):
+            raise ConfigurationError(f"Unsupported indicator dtype: '{dtype}'")
+        workers = engine_config.get('indicator_workers', 1)
+        if not isinstance(workers, int) or workers < 1:
+            raise ConfigurationError(f"'indicator_workers' must be a positive integer, got {workers!r}")
+        return {
+            'indicator_backend': backend,
+            'indicator_dtype': dtype,
+            'indicator_workers': workers,
+            'track_memory': bool(engine_config.get('track_memory', False)),
+        }
+
+    def create_metrics_exporter(self) -> Optional[MetricsExporter]:
+        """Creates the run metrics exporter from the optional `metrics` section.
+
+        Returns:
+            Optional[MetricsExporter]: The exporter, or None if not configured
+            or `enabled` is false.
+
+        Raises:
+            ConfigurationError: If the format is unknown or the path is missing.
+        """
+        metrics_config = self.config.get('metrics') or {}
+        if not metrics_config or not metrics_config.get('enabled', True):
+            return None
+        if 'path' not in metrics_config:
+            raise ConfigurationError("Metrics configuration missing 'path'.")
+        try:
+            return create_exporter(metrics_config.get('format', 'jsonl'), metrics_config['path'])
+        except ValueError as e:
+            raise ConfigurationError(str(e)) from e
+
     def create_indicators(self) -> List[Indicator]:
         """Creates the list of indicator instances.
 
@@ -93,14 +223,148 @@ class ComponentFactory:
             
             try:
                 ind_cls = get_indicator_class(name)
-                # Pass all other config parameters to the constructor
-                params = {k: v for k, v in ind_conf.items() if k != 'name'}
-                indicators.append(ind_cls(**params))
             except KeyError:
                 raise FactoryError(f"Indicator '{name}' is not registered.")
-        
+
+            # Pass all other config parameters to the constructor
+            params = {k: v for k, v in ind_conf.items() if k != 'name'}
+            if 'periods' in params:
+                periods = self._expand_periods(name, params.pop('periods'))
+                if params:
+                    raise FactoryError(f"Indicator '{name}' with 'periods' takes no other parameters, got {sorted(params)}.")
+                indicators.append(IndicatorGrid(ind_cls, periods))
+            else:
+                indicators.append(ind_cls(**params))
+
         return indicators
 
+    @staticmethod
+    def _expand_periods(name: str, spec: Any) -> List[int]:
+        """Expands a `periods` config entry into a list of periods.
+
+        Args:
+            name: The indicator name, for error messages.
+            spec: A list of periods, or a mapping with `start`, `stop` and an
+                optional `step` (default 1) describing an inclusive range.
+
+        Returns:
+            List[int]: The periods.
+
+        Raises:
+            FactoryError: If the entry is malformed.
+        """
+        if isinstance(spec, dict):
+            try:
+                periods = list(range(int(spec['start']), int(spec['stop']) + 1, int(spec.get('step', 1))))
+            except (KeyError, TypeError, ValueError) as e:
+                raise FactoryError(f"Indicator '{name}': invalid periods range {spec!r}") from e
+        elif isinstance(spec, (list, tuple)):
+            periods = list(spec)
+        else:
+            raise FactoryError(f"Indicator '{name}': 'periods' must be a list or a start/stop/step mapping.")
+        if not periods or not all(isinstance(p, int) and p >= 1 for p in periods):
+            raise FactoryError(f"Indicator '{name}': periods must be positive integers, got {spec!r}")
+        return periods
+
+    def create_backtester(self) -> Optional[VectorizedBacktester]:
+        """Creates the backtester from the optional `backtest` section.
+
+        Returns:
+            Optional[VectorizedBacktester]: The backtester, or None if the
+            section is missing or has `enabled: false`.
+
+        Raises:
+            ConfigurationError: If an option is unknown or out of range.
+        """
+        backtest_config = self.config.get('backtest')
+        if not backtest_config or not backtest_config.get('enabled', True):
+            return None
+        params = {k: v for k, v in backtest_config.items() if k != 'enabled'}
+        try:
+            return VectorizedBacktester(**params)
+        except (TypeError, ValueError) as e:
+            raise ConfigurationError(f"Invalid backtest configuration: {e}") from e
+
+    def create_sweep(self) -> Optional[ParameterSweep]:
+        """Creates the parameter sweep from the optional `sweep` section.
+
+        The rest of the configuration, with `sweep.overrides` applied, is the
+        template rendered for every combination of `sweep.parameters`.
+
+        Returns:
+            Optional[ParameterSweep]: The sweep, or None if not configured.
+
+        Raises:
+            ConfigurationError: If the section is invalid.
+        """
+        template, sweep_config = sweep_template(self.config)
+        if not sweep_config:
+            return None
+        parameters = sweep_config.get('parameters')
+        if not parameters:
+            raise ConfigurationError("Sweep configuration missing 'parameters'.")
+        return ParameterSweep(
+            template,
+            parameters,
+            workers=sweep_config.get('workers'),
+            rank_by=sweep_config.get('rank_by', 'sharpe_ratio'),
+            ascending=sweep_config.get('ascending', False),
+        )
+
+    def create_walk_forward(self) -> Optional[WalkForwardOptimizer]:
+        """Creates the walk-forward optimizer from the optional `walk_forward` section.
+
+        The parameter grid, overrides and ranking come from the `sweep`
+        section; `walk_forward` sets the window lengths and may override
+        `workers`.
+
+        Returns:
+            Optional[WalkForwardOptimizer]: The optimizer, or None if not configured.
+
+        Raises:
+            ConfigurationError: If either section is invalid.
+        """
+        wf_config = self.config.get('walk_forward')
+        if not wf_config:
+            return None
+        template, sweep_config = sweep_template(self.config)
+        template.pop('walk_forward', None)
+        parameters = sweep_config.get('parameters')
+        if not parameters:
+            raise ConfigurationError("Walk-forward requires 'sweep.parameters'.")
+        for key in ('train_bars', 'test_bars'):
+            if key not in wf_config:
+                raise ConfigurationError(f"Walk-forward configuration missing '{key}'.")
+        return WalkForwardOptimizer(
+            template,
+            parameters,
+            train_bars=wf_config['train_bars'],
+            test_bars=wf_config['test_bars'],
+            anchored=wf_config.get('anchored', False),
+            workers=wf_config.get('workers', sweep_config.get('workers')),
+            rank_by=sweep_config.get('rank_by', 'sharpe_ratio'),
+            ascending=sweep_config.get('ascending', False),
+        )
+
+    def create_scanner(self) -> UniverseScanner:
+        """Creates the universe scanner from the optional `scan` section.
+
+        Every ticker is analyzed with the rest of the configuration;
+        `data_source.ticker` is replaced per ticker.
+
+        Returns:
+            UniverseScanner: The scanner.
+
+        Raises:
+            ConfigurationError: If the section is invalid.
+        """
+        scan_config = self.config.get('scan') or {}
+        return UniverseScanner(
+            self.config,
+            workers=scan_config.get('workers'),
+            chunk_size=scan_config.get('chunk_size', 16),
+        )
+
     def create_strategy(self) -> Optional[Strategy]:
         """Creates the strategy instance.
 
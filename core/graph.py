@@ -0,0 +1,230 @@
+"""Computation graph for indicators with shared intermediates.
+
+Indicators describe their output as an expression of `Node`s (see
+`Indicator.node`). Nodes are immutable and compare by structure, so two
+indicators asking for `rolling_mean(column('Close'), 20)` produce equal nodes
+and `GraphEvaluator` computes that node, and every input it depends on,
+exactly once per data frame. Rolling means are derived from a shared
+NaN-aware cumulative sum of their input, so any number of SMA periods over
+the same column cost one cumulative sum plus one vectorized difference each.
+"""
+import threading
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Tuple
+import numpy as np
+import pandas as pd
+
+
+@dataclass(frozen=True)
+class Node:
+    """A node of the indicator computation graph.
+
+    Args:
+        op: Name of the operation, a key of the op registry.
+        inputs: Nodes whose results feed this operation.
+        params: Hashable operation parameters (e.g. a window length).
+    """
+    op: str
+    inputs: Tuple["Node", ...] = ()
+    params: Tuple[Any, ...] = ()
+    _hash: int = field(default=0, init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        # Graphs are hashed repeatedly while evaluating; cache the structural hash.
+        object.__setattr__(self, '_hash', hash((self.op, self.inputs, self.params)))
+
+    def __hash__(self) -> int:
+        return self._hash
+
+
+OpFunc = Callable[[Node, List[pd.Series], pd.DataFrame], pd.Series]
+_OP_REGISTRY: Dict[str, OpFunc] = {}
+
+
+def register_op(name: str) -> Callable[[OpFunc], OpFunc]:
+    """Decorator to register a graph operation.
+
+    Args:
+        name: The operation name used in `Node.op`.
+
+    Returns:
+        Callable: The decorator function.
+    """
+    def decorator(func: OpFunc) -> OpFunc:
+        _OP_REGISTRY[name] = func
+        return func
+    return decorator
+
+
+# --- Node constructors ---
+
+def column(name: str) -> Node:
+    """A column of the input frame."""
+    return Node('column', params=(name,))
+
+def diff(x: Node, periods: int = 1) -> Node:
+    """First difference of `x`."""
+    return Node('diff', (x,), (periods,))
+
+def gain(x: Node) -> Node:
+    """Positive part of `x`; NaN and non-positive values become 0."""
+    return Node('gain', (x,))
+
+def loss(x: Node) -> Node:
+    """Magnitude of the negative part of `x`; NaN and non-negative values become 0."""
+    return Node('loss', (x,))
+
+def cumsum(x: Node) -> Node:
+    """Cumulative sum of `x`, treating NaN as 0."""
+    return Node('cumsum', (x,))
+
+def nan_count(x: Node) -> Node:
+    """Cumulative count of NaN values in `x`."""
+    return Node('nan_count', (x,))
+
+def rolling_mean(x: Node, window: int) -> Node:
+    """Rolling mean of `x` over `window` rows, NaN until the window is full or while it holds a NaN."""
+    return Node('rolling_mean', (x, cumsum(x), nan_count(x)), (window,))
+
+def ewm_mean(x: Node, span: int) -> Node:
+    """Exponentially weighted mean of `x` (`adjust=False`)."""
+    return Node('ewm_mean', (x,), (span,))
+
+def rsi(avg_gain: Node, avg_loss: Node) -> Node:
+    """Relative strength index from average gain and loss series."""
+    return Node('rsi', (avg_gain, avg_loss))
+
+
+# --- Operations ---
+
+@register_op('column')
+def _column(node: Node, inputs: List[pd.Series], df: pd.DataFrame) -> pd.Series:
+    name = node.params[0]
+    if name not in df.columns:
+        raise KeyError(f"'{name}' column missing")
+    return df[name]
+
+@register_op('diff')
+def _diff(node: Node, inputs: List[pd.Series], df: pd.DataFrame) -> pd.Series:
+    return inputs[0].diff(node.params[0])
+
+@register_op('gain')
+def _gain(node: Node, inputs: List[pd.Series], df: pd.DataFrame) -> pd.Series:
+    x = inputs[0]
+    return x.where(x > 0, 0)
+
+@register_op('loss')
+def _loss(node: Node, inputs: List[pd.Series], df: pd.DataFrame) -> pd.Series:
+    x = inputs[0]
+    return -x.where(x < 0, 0)
+
+@register_op('cumsum')
+def _cumsum(node: Node, inputs: List[pd.Series], df: pd.DataFrame) -> pd.Series:
+    x = inputs[0]
+    values = np.nan_to_num(x.to_numpy(dtype='float64'), nan=0.0)
+    return pd.Series(np.cumsum(values), index=x.index, name=x.name)
+
+@register_op('nan_count')
+def _nan_count(node: Node, inputs: List[pd.Series], df: pd.DataFrame) -> pd.Series:
+    x = inputs[0]
+    return pd.Series(np.cumsum(np.isnan(x.to_numpy(dtype='float64'))), index=x.index, name=x.name)
+
+@register_op('rolling_mean')
+def _rolling_mean(node: Node, inputs: List[pd.Series], df: pd.DataFrame) -> pd.Series:
+    x, sums, nans = inputs
+    window = node.params[0]
+    cs = sums.to_numpy()
+    cn = nans.to_numpy()
+    out = np.full(len(cs), np.nan)
+    if window >= 1 and len(cs) >= window:
+        window_sums = cs[window - 1:] - np.concatenate(([0.0], cs[:-window]))
+        window_nans = cn[window - 1:] - np.concatenate(([0], cn[:-window]))
+        means = window_sums / window
+        means[window_nans > 0] = np.nan
+        out[window - 1:] = means
+    return pd.Series(out, index=x.index, name=x.name)
+
+@register_op('ewm_mean')
+def _ewm_mean(node: Node, inputs: List[pd.Series], df: pd.DataFrame) -> pd.Series:
+    return inputs[0].ewm(span=node.params[0], adjust=False).mean()
+
+@register_op('rsi')
+def _rsi(node: Node, inputs: List[pd.Series], df: pd.DataFrame) -> pd.Series:
+    avg_gain, avg_loss = inputs
+    rs = avg_gain / avg_loss
+    return 100 - (100 / (1 + rs))
+
+
+class GraphEvaluator:
+    """Evaluates graph nodes over one data frame, computing each distinct node once.
+
+    Safe to share between threads: a node requested concurrently is
+    computed by the first caller while the others wait for its result.
+    """
+
+    def __init__(self, df: pd.DataFrame):
+        """Initializes the evaluator.
+
+        Args:
+            df: The market data all nodes are evaluated against.
+        """
+        self.df = df
+        self._results: Dict[Node, pd.Series] = {}
+        self._pending: Dict[Node, threading.Event] = {}
+        self._errors: Dict[Node, BaseException] = {}
+        self._lock = threading.Lock()
+        self.requested = 0
+
+    @property
+    def computed(self) -> int:
+        """Number of distinct nodes computed so far."""
+        return len(self._results)
+
+    def evaluate(self, node: Node) -> pd.Series:
+        """Returns the result of a node, computing it and its inputs as needed.
+
+        Args:
+            node: The node to evaluate.
+
+        Returns:
+            pd.Series: The node's result.
+
+        Raises:
+            KeyError: If the node's operation is not registered or a column is missing.
+        """
+        with self._lock:
+            self.requested += 1
+            if node in self._results:
+                return self._results[node]
+            if node in self._errors:
+                raise self._errors[node]
+            event = self._pending.get(node)
+            owner = event is None
+            if owner:
+                event = self._pending[node] = threading.Event()
+
+        if not owner:
+            # Graphs are acyclic, so the owner never waits on this thread.
+            event.wait()  # type: ignore[union-attr]
+            with self._lock:
+                if node in self._errors:
+                    raise self._errors[node]
+                return self._results[node]
+
+        try:
+            if node.op not in _OP_REGISTRY:
+                raise KeyError(f"Graph operation '{node.op}' is not registered.")
+            inputs = [self.evaluate(child) for child in node.inputs]
+            result = _OP_REGISTRY[node.op](node, inputs, self.df)
+        except BaseException as e:
+            with self._lock:
+                self._errors[node] = e
+            raise
+        else:
+            with self._lock:
+                self._results[node] = result
+            return result
+        finally:
+            with self._lock:
+                del self._pending[node]
+            event.set()  # type: ignore[union-attr]
@@ -1,7 +1,8 @@
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Dict, Optional, Any, List
+from typing import Dict, Optional, Any, Iterable, Iterator, List, Sequence, Tuple, Union
 from enum import Enum, auto
+import numpy as np
 import pandas as pd
 
 class SignalType(Enum):
@@ -10,7 +11,7 @@ class SignalType(Enum):
     SELL = auto()
     HOLD = auto()
 
-@dataclass
+@dataclass(slots=True)
 class Signal:
     """Represents a trading signal.
 
@@ -25,6 +26,210 @@ class Signal:
     price: float
     description: str = ""
 
+def _timestamp_values(timestamps: Any) -> Tuple[np.ndarray, Any]:
+    """Converts timestamps (or other index labels) to a NumPy array and a timezone.
+
+    Timezone-aware datetimes are stored as naive UTC `datetime64[ns]` values
+    and the timezone is returned separately; other labels are stored as is.
+    """
+    index = pd.Index(timestamps)
+    if isinstance(index, pd.DatetimeIndex):
+        if index.tz is not None:
+            return index.tz_convert('UTC').tz_localize(None).to_numpy(), index.tz
+        return index.to_numpy(), None
+    if len(index) == 0:
+        return np.empty(0, dtype='datetime64[ns]'), None
+    return index.to_numpy(), None
+
+@dataclass(eq=False)
+class SignalBatch:
+    """Columnar collection of trading signals.
+
+    Stores one array per `Signal` field instead of one object per signal.
+    Descriptions are interned: each signal holds a code into the shared
+    `descriptions` table. A batch behaves like a read-only `List[Signal]`
+    (len, iteration, indexing, equality), materializing `Signal` objects on
+    access.
+
+    Args:
+        timestamps: Signal times as `datetime64[ns]` (naive UTC when `tz` is
+            set), or the index labels for data without a datetime index.
+        types: `SignalType` values as small integers.
+        prices: Signal prices.
+        description_codes: Position of each signal's description in `descriptions`.
+        descriptions: The distinct descriptions.
+        tz: Timezone of the timestamps, or None for naive timestamps.
+    """
+    timestamps: np.ndarray = field(default_factory=lambda: np.empty(0, dtype='datetime64[ns]'))
+    types: np.ndarray = field(default_factory=lambda: np.empty(0, dtype=np.int8))
+    prices: np.ndarray = field(default_factory=lambda: np.empty(0, dtype=np.float64))
+    description_codes: np.ndarray = field(default_factory=lambda: np.empty(0, dtype=np.int32))
+    descriptions: List[str] = field(default_factory=list)
+    tz: Any = None
+
+    def __post_init__(self):
+        lengths = {len(self.timestamps), len(self.types), len(self.prices), len(self.description_codes)}
+        if len(lengths) > 1:
+            raise ValueError("SignalBatch arrays must have the same length")
+
+    @classmethod
+    def from_arrays(
+        cls,
+        timestamps: Any,
+        types: Sequence[int],
+        prices: Sequence[float],
+        description_codes: Optional[Sequence[int]] = None,
+        descriptions: Sequence[str] = (),
+    ) -> "SignalBatch":
+        """Builds a batch from per-signal arrays.
+
+        Args:
+            timestamps: Signal times or index labels, e.g. a slice of the data's index.
+            types: `SignalType` values.
+            prices: Signal prices.
+            description_codes: Position of each description in `descriptions`;
+                None for signals without a description.
+            descriptions: The distinct descriptions.
+
+        Returns:
+            SignalBatch: The batch.
+        """
+        values, tz = _timestamp_values(timestamps)
+        types = np.asarray(types, dtype=np.int8)
+        descriptions = list(descriptions)
+        if description_codes is None:
+            description_codes = np.zeros(len(types), dtype=np.int32)
+            descriptions = descriptions or [""]
+        return cls(
+            timestamps=values,
+            types=types,
+            prices=np.asarray(prices, dtype=np.float64),
+            description_codes=np.asarray(description_codes, dtype=np.int32),
+            descriptions=descriptions,
+            tz=tz,
+        )
+
+    @classmethod
+    def from_signals(cls, signals: Iterable[Signal]) -> "SignalBatch":
+        """Converts signal objects into a batch.
+
+        Args:
+            signals: The signals.
+
+        Returns:
+            SignalBatch: The batch, with equal descriptions sharing one code.
+        """
+        if isinstance(signals, SignalBatch):
+            return signals
+        signals = list(signals)
+        codes: Dict[str, int] = {}
+        return cls.from_arrays(
+            [s.timestamp for s in signals],
+            [s.type.value for s in signals],
+            [s.price for s in signals],
+            [codes.setdefault(s.description, len(codes)) for s in signals],
+            list(codes),
+        )
+
+    @property
+    def index(self) -> pd.Index:
+        """The signal timestamps as an index, with the timezone restored."""
+        index = pd.Index(self.timestamps)
+        if self.tz is not None:
+            index = index.tz_localize('UTC').tz_convert(self.tz)
+        return index
+
+    def positions(self, index: pd.Index) -> np.ndarray:
+        """Returns the row position of each signal in the data index, or -1.
+
+        Timestamps missing from the index or duplicated in it get -1.
+
+        Args:
+            index: The index of the market data.
+
+        Returns:
+            np.ndarray: One row position per signal.
+        """
+        if index.is_unique:
+            return index.get_indexer(self.index)
+        unique = ~index.duplicated(keep=False)
+        rows = np.flatnonzero(unique)
+        if len(rows) == 0 or len(self) == 0:
+            return np.full(len(self), -1, dtype=np.intp)
+        found = index[unique].get_indexer(self.index)
+        return np.where(found >= 0, rows[found], -1)
+
+    def mask(self, signal_type: SignalType) -> np.ndarray:
+        """Returns a boolean mask of the signals of one type."""
+        return self.types == signal_type.value
+
+    def to_signals(self) -> List[Signal]:
+        """Materializes the batch as a list of `Signal` objects."""
+        return [
+            Signal(timestamp, SignalType(kind), price, self.descriptions[code])
+            for timestamp, kind, price, code in zip(
+                self.index, self.types.tolist(), self.prices.tolist(), self.description_codes.tolist()
+            )
+        ]
+
+    def __len__(self) -> int:
+        return len(self.types)
+
+    def __iter__(self) -> Iterator[Signal]:
+        return iter(self.to_signals())
+
+    def __getitem__(self, position: int) -> Signal:
+        return Signal(
+            self.index[position],
+            SignalType(int(self.types[position])),
+            float(self.prices[position]),
+            self.descriptions[self.description_codes[position]],
+        )
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, (SignalBatch, list)):
+            return self.to_signals() == list(other)
+        return NotImplemented
+
+@dataclass
+class BacktestResult:
+    """Outcome of replaying signals over market data.
+
+    Args:
+        equity: Account value at each bar's close, net of costs.
+        returns: Per-bar net return of the account.
+        drawdown: Decline of `equity` from its running peak, as a non-positive fraction.
+        positions: Position held after each bar's close: 1 long, -1 short, 0 flat.
+        trades: One row per trade with entry/exit time and price, direction,
+            bars held, gross and net return, and whether it is still open.
+        stats: Summary statistics (returns, risk, trade and cost figures).
+    """
+    equity: pd.Series
+    returns: pd.Series
+    drawdown: pd.Series
+    positions: pd.Series
+    trades: pd.DataFrame
+    stats: Dict[str, float] = field(default_factory=dict)
+
+@dataclass
+class WalkForwardResult:
+    """Outcome of a walk-forward optimization.
+
+    Args:
+        windows: One row per window with its train/test bounds, the chosen
+            parameters, their in-sample score and out-of-sample statistics.
+        equity: Out-of-sample account value, stitched across test windows.
+        returns: Per-bar out-of-sample returns.
+        stats: Return and risk statistics of the stitched equity.
+    """
+    windows: pd.DataFrame
+    equity: pd.Series
+    returns: pd.Series
+    stats: Dict[str, float] = field(default_factory=dict)
+
+# What strategies return and visualizers accept.
+Signals = Union[List[Signal], SignalBatch]
+
 @dataclass
 class DataFetchConfig:
     """Configuration for data fetching.
@@ -47,11 +252,25 @@ class AnalysisResult:
     Args:
         data: The raw market data.
         indicators: A dictionary of calculated indicators.
+        signals: The generated signals, as a list or a `SignalBatch`.
+        backtest: The backtest of the signals, if the engine has a backtester.
         metadata: Additional metadata about the analysis.
         timestamp: The timestamp of the analysis.
     """
     data: pd.DataFrame
     indicators: Dict[str, pd.Series] = field(default_factory=dict)
-    signals: List[Signal] = field(default_factory=list)
+    signals: Signals = field(default_factory=list)
+    backtest: Optional[BacktestResult] = None
     metadata: Dict[str, Any] = field(default_factory=dict)
     timestamp: datetime = field(default_factory=datetime.now)
+
+@dataclass
+class BatchFetchResult:
+    """Result of fetching several tickers in one batch.
+
+    Args:
+        data: Fetched market data keyed by ticker.
+        errors: Per-ticker fetch errors for tickers that could not be fetched.
+    """
+    data: Dict[str, pd.DataFrame] = field(default_factory=dict)
+    errors: Dict[str, Exception] = field(default_factory=dict)
@@ -1,3 +1,8 @@
 """Data sources package."""
+from .bar_store import BarStore
 from .yfinance_source import YFinanceDataSource
 from .csv_source import CSVDataSource
+from .parquet_source import ParquetDataSource, convert_csv_to_parquet
+from .mmap_source import MemoryMappedDataSource, write_mmap_bars
+from .executor import ConcurrentFetchExecutor, TokenBucket
+from .cached_source import CachedDataSource
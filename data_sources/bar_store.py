@@ -0,0 +1,167 @@
+import json
+import os
+import pandas as pd
+from typing import List, Optional, Tuple
+from utils.logging import setup_logger
+
+logger = setup_logger(__name__)
+
+# A half-open [start, end) date range, as 'YYYY-MM-DD' strings.
+DateRange = Tuple[str, str]
+
+
+def merge_ranges(ranges: List[DateRange]) -> List[DateRange]:
+    """Merges overlapping or adjacent half-open date ranges.
+
+    Args:
+        ranges: The ranges to merge.
+
+    Returns:
+        List[DateRange]: Sorted, non-overlapping ranges.
+    """
+    merged: List[List[str]] = []
+    for start, end in sorted(ranges):
+        if start >= end:
+            continue
+        if merged and start <= merged[-1][1]:
+            merged[-1][1] = max(merged[-1][1], end)
+        else:
+            merged.append([start, end])
+    return [(start, end) for start, end in merged]
+
+
+def subtract_ranges(target: DateRange, covered: List[DateRange]) -> List[DateRange]:
+    """Returns the parts of `target` not covered by any range in `covered`.
+
+    Args:
+        target: The requested half-open range.
+        covered: Ranges already held.
+
+    Returns:
+        List[DateRange]: The missing sub-ranges, in order.
+    """
+    start, end = target
+    missing = []
+    cursor = start
+    for c_start, c_end in merge_ranges(covered):
+        if c_end <= cursor or c_start >= end:
+            continue
+        if c_start > cursor:
+            missing.append((cursor, c_start))
+        cursor = max(cursor, c_end)
+        if cursor >= end:
+            break
+    if cursor < end:
+        missing.append((cursor, end))
+    return missing
+
+
+class BarStore:
+    """Local on-disk store of OHLCV bars that tracks which date ranges it holds.
+
+    Each (ticker, interval) series is kept as one pickled DataFrame plus a JSON
+    manifest listing the half-open [start, end) date ranges that have been
+    downloaded, including ranges that legitimately contained no bars
+    (weekends, holidays).
+    """
+
+    def __init__(self, root_dir: str = ".cache/bars"):
+        """Initializes the bar store.
+
+        Args:
+            root_dir: Directory to keep series and manifests in.
+        """
+        self.root_dir = root_dir
+        os.makedirs(root_dir, exist_ok=True)
+
+    def _paths(self, ticker: str, interval: str) -> Tuple[str, str]:
+        """Returns the data and manifest paths of a series."""
+        base = os.path.join(self.root_dir, f"{ticker}_{interval}")
+        return f"{base}.pickle", f"{base}.json"
+
+    def coverage(self, ticker: str, interval: str) -> List[DateRange]:
+        """Returns the date ranges held for a series.
+
+        Args:
+            ticker: The ticker symbol.
+            interval: The bar interval.
+
+        Returns:
+            List[DateRange]: Sorted, merged ranges.
+        """
+        _, manifest_path = self._paths(ticker, interval)
+        if not os.path.exists(manifest_path):
+            return []
+        with open(manifest_path) as f:
+            return [tuple(r) for r in json.load(f)['ranges']]  # type: ignore[misc]
+
+    def missing_ranges(self, ticker: str, interval: str, start: str, end: str) -> List[DateRange]:
+        """Computes the sub-ranges of [start, end) not yet held.
+
+        Args:
+            ticker: The ticker symbol.
+            interval: The bar interval.
+            start: Inclusive start date (YYYY-MM-DD).
+            end: Exclusive end date (YYYY-MM-DD).
+
+        Returns:
+            List[DateRange]: The ranges that still need to be downloaded.
+        """
+        return subtract_ranges((start, end), self.coverage(ticker, interval))
+
+    def _read(self, ticker: str, interval: str) -> Optional[pd.DataFrame]:
+        """Reads the full stored series, if any."""
+        data_path, _ = self._paths(ticker, interval)
+        if not os.path.exists(data_path):
+            return None
+        return pd.read_pickle(data_path)
+
+    def merge(self, ticker: str, interval: str, df: pd.DataFrame, covered: DateRange) -> None:
+        """Merges newly downloaded bars into the store.
+
+        Rows already present with the same timestamp are replaced by the new
+        ones. The range is recorded as covered even if `df` is empty.
+
+        Args:
+            ticker: The ticker symbol.
+            interval: The bar interval.
+            df: The downloaded bars.
+            covered: The half-open date range the download spanned.
+        """
+        data_path, manifest_path = self._paths(ticker, interval)
+        existing = self._read(ticker, interval)
+        if existing is not None and not df.empty:
+            combined = pd.concat([existing, df])
+            combined = combined[~combined.index.duplicated(keep='last')].sort_index()
+        elif existing is not None:
+            combined = existing
+        else:
+            combined = df.sort_index()
+
+        tmp_path = f"{data_path}.tmp"
+        combined.to_pickle(tmp_path)
+        os.replace(tmp_path, data_path)
+
+        ranges = merge_ranges(self.coverage(ticker, interval) + [covered])
+        tmp_path = f"{manifest_path}.tmp"
+        with open(tmp_path, 'w') as f:
+            json.dump({'ticker': ticker, 'interval': interval, 'ranges': ranges}, f)
+        os.replace(tmp_path, manifest_path)
+
+    def load(self, ticker: str, interval: str, start: str, end: str) -> pd.DataFrame:
+        """Loads stored bars within [start, end).
+
+        Args:
+            ticker: The ticker symbol.
+            interval: The bar interval.
+            start: Inclusive start date (YYYY-MM-DD).
+            end: Exclusive end date (YYYY-MM-DD).
+
+        Returns:
+            pd.DataFrame: The stored bars in range (possibly empty).
+        """
+        df = self._read(ticker, interval)
+        if df is None:
+            return pd.DataFrame()
+        mask = (df.index >= pd.Timestamp(start)) & (df.index < pd.Timestamp(end))
+        return df[mask]
@@ -0,0 +1,156 @@
+import hashlib
+from dataclasses import replace
+from datetime import datetime
+from typing import Any, Dict, List
+import pandas as pd
+from core.abstractions import DataSource
+from core.models import DataFetchConfig, BatchFetchResult
+from utils.cache import TTLCache
+from utils.logging import setup_logger
+
+logger = setup_logger(__name__)
+
+
+def normalize_fetch_config(config: DataFetchConfig) -> DataFetchConfig:
+    """Returns a canonical copy of a fetch config suitable for cache keys.
+
+    An open-ended `end_date` is resolved to today's date, so a cached
+    "up to now" result is not served on later days.
+
+    Args:
+        config: The data fetch configuration.
+
+    Returns:
+        DataFetchConfig: The normalized configuration.
+    """
+    return replace(config, end_date=config.end_date or datetime.now().strftime('%Y-%m-%d'))
+
+
+class CachedDataSource(DataSource):
+    """Wraps a data source with a TTL cache keyed on the normalized fetch config."""
+
+    def __init__(self, source: DataSource, cache: TTLCache, namespace: str = "", mode: str = "normal"):
+        """Initializes the caching layer.
+
+        Args:
+            source: The data source to wrap.
+            cache: The cache backend.
+            namespace: Extra key component identifying the source's settings
+                (e.g. its type and file path), so different sources never share entries.
+            mode: 'normal' reads and writes the cache, 'refresh' skips reads
+                but stores fresh results, 'bypass' disables the cache entirely.
+        """
+        if mode not in ('normal', 'refresh', 'bypass'):
+            raise ValueError(f"Unknown cache mode: '{mode}'")
+        self.source = source
+        self.cache = cache
+        self.namespace = namespace or type(source).__name__
+        self.mode = mode
+        self.hits = 0
+        self.misses = 0
+
+    def cache_key(self, config: DataFetchConfig) -> str:
+        """Builds the cache key of a fetch config.
+
+        Args:
+            config: The data fetch configuration (normalized or not).
+
+        Returns:
+            str: A filename-safe hex digest.
+        """
+        config = normalize_fetch_config(config)
+        key_string = "|".join([
+            self.namespace, config.ticker.upper(), config.interval, str(config.start_date), str(config.end_date)
+        ])
+        return hashlib.md5(key_string.encode('utf-8')).hexdigest()
+
+    def _lookup(self, key: str) -> Any:
+        """Reads a cache entry honoring the cache mode and updates counters."""
+        if self.mode != 'normal':
+            self.misses += 1
+            return None
+        value = self.cache.get(key)
+        if value is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return value
+
+    def fetch_data(self, config: DataFetchConfig) -> pd.DataFrame:
+        """Fetches market data, serving it from the cache when possible.
+
+        Args:
+            config: The data fetch configuration.
+
+        Returns:
+            pd.DataFrame: The fetched market data.
+
+        Raises:
+            DataFetchError: If the wrapped source fails.
+        """
+        if self.mode == 'bypass':
+            return self.source.fetch_data(config)
+
+        config = normalize_fetch_config(config)
+        key = self.cache_key(config)
+        if self.mode == 'refresh':
+            self.misses += 1
+            df = self.source.fetch_data(config)
+            self.cache.set(key, df)
+            return df
+
+        # Concurrent callers (threads or processes) for the same key share one upstream fetch.
+        produced = False
+
+        def produce() -> pd.DataFrame:
+            nonlocal produced
+            produced = True
+            return self.source.fetch_data(config)
+
+        df = self.cache.get_or_compute(key, produce)
+        if produced:
+            self.misses += 1
+        else:
+            self.hits += 1
+            logger.info(f"Cache hit for {config.ticker} ({config.interval})")
+        return df
+
+    def fetch_many(self, configs: List[DataFetchConfig]) -> BatchFetchResult:
+        """Serves cached tickers and fetches the rest through the wrapped source's batch API.
+
+        Args:
+            configs: The data fetch configurations, one per ticker.
+
+        Returns:
+            BatchFetchResult: Fetched data and per-ticker errors.
+        """
+        if self.mode == 'bypass':
+            return self.source.fetch_many(configs)
+
+        result = BatchFetchResult()
+        pending: List[DataFetchConfig] = []
+        for config in map(normalize_fetch_config, configs):
+            cached = self._lookup(self.cache_key(config))
+            if cached is not None:
+                result.data[config.ticker] = cached
+            else:
+                pending.append(config)
+
+        if pending:
+            fetched = self.source.fetch_many(pending)
+            for config in pending:
+                if config.ticker in fetched.data:
+                    self.cache.set(self.cache_key(config), fetched.data[config.ticker])
+            result.data.update(fetched.data)
+            result.errors.update(fetched.errors)
+        return result
+
+    def stats(self) -> Dict[str, Any]:
+        """Returns cache counters merged with the wrapped source's statistics.
+
+        Returns:
+            Dict[str, Any]: Statistics with a 'cache' entry.
+        """
+        stats = dict(self.source.stats())
+        stats['cache'] = {'hits': self.hits, 'misses': self.misses, 'mode': self.mode, 'store': self.cache.stats()}
+        return stats
@@ -1,14 +1,19 @@
 import pandas as pd
 import os
+from typing import List
 from core.abstractions import DataSource
-from core.models import DataFetchConfig
+from core.models import DataFetchConfig, BatchFetchResult
 from core.exceptions import DataFetchError
 from utils.logging import setup_logger
 
 logger = setup_logger(__name__)
 
 class CSVDataSource(DataSource):
-    """Data source implementation using CSV files."""
+    """Data source implementation using CSV files.
+
+    The file may hold a single series, or several when it has a `Ticker`
+    column; in that case rows are selected by the requested ticker.
+    """
 
     def __init__(self, csv_path: str = "data/ohlcv.csv"):
         """Initializes the CSV data source.
@@ -18,6 +23,45 @@ class CSVDataSource(DataSource):
         """
         self.csv_path = csv_path
 
+    def _load(self) -> pd.DataFrame:
+        """Reads and normalizes the whole CSV file.
+
+        Returns:
+            pd.DataFrame: The file contents indexed by Date.
+
+        Raises:
+            DataFetchError: If file not found or columns missing.
+        """
+        logger.info(f"Loading data from {self.csv_path}...")
+
+        if not os.path.exists(self.csv_path):
+            raise DataFetchError(f"CSV file not found: {self.csv_path}")
+
+        df = pd.read_csv(self.csv_path)
+
+        # Normalize column names to title case to match expected format
+        df.columns = [c.title() for c in df.columns]
+
+        required_cols = ['Date', 'Open', 'High', 'Low', 'Close', 'Volume']
+        missing_cols = [col for col in required_cols if col not in df.columns]
+
+        if missing_cols:
+            raise DataFetchError(f"Missing columns in CSV: {missing_cols}")
+
+        # Set Date as index
+        df['Date'] = pd.to_datetime(df['Date'])
+        df.set_index('Date', inplace=True)
+        return df
+
+    @staticmethod
+    def _filter_dates(df: pd.DataFrame, config: DataFetchConfig) -> pd.DataFrame:
+        """Filters rows to the configured date range."""
+        if config.start_date:
+            df = df[df.index >= pd.to_datetime(config.start_date)]
+        if config.end_date:
+            df = df[df.index <= pd.to_datetime(config.end_date)]
+        return df
+
     def fetch_data(self, config: DataFetchConfig) -> pd.DataFrame:
         """Fetches market data from a CSV file.
 
@@ -31,31 +75,13 @@ class CSVDataSource(DataSource):
             DataFetchError: If file not found or columns missing.
         """
         try:
-            logger.info(f"Loading data from {self.csv_path}...")
-            
-            if not os.path.exists(self.csv_path):
-                raise DataFetchError(f"CSV file not found: {self.csv_path}")
-
-            df = pd.read_csv(self.csv_path)
-            
-            # Normalize column names to title case to match expected format
-            df.columns = [c.title() for c in df.columns]
-            
-            required_cols = ['Date', 'Open', 'High', 'Low', 'Close', 'Volume']
-            missing_cols = [col for col in required_cols if col not in df.columns]
-            
-            if missing_cols:
-                raise DataFetchError(f"Missing columns in CSV: {missing_cols}")
-
-            # Set Date as index
-            df['Date'] = pd.to_datetime(df['Date'])
-            df.set_index('Date', inplace=True)
-            
+            df = self._load()
+
+            if 'Ticker' in df.columns:
+                df = df[df['Ticker'] == config.ticker].drop(columns='Ticker')
+
             # Filter by date if provided in config
-            if config.start_date:
-                df = df[df.index >= pd.to_datetime(config.start_date)]
-            if config.end_date:
-                df = df[df.index <= pd.to_datetime(config.end_date)]
+            df = self._filter_dates(df, config)
 
             logger.info(f"Successfully loaded {len(df)} rows from CSV")
             return df
@@ -63,3 +89,36 @@ class CSVDataSource(DataSource):
         except Exception as e:
             logger.error(f"Failed to load data from CSV: {e}")
             raise DataFetchError(f"Failed to load data from CSV: {e}") from e
+
+    def fetch_many(self, configs: List[DataFetchConfig]) -> BatchFetchResult:
+        """Fetches several tickers from a multi-ticker CSV file in one pass.
+
+        Args:
+            configs: The data fetch configurations, one per ticker.
+
+        Returns:
+            BatchFetchResult: Fetched data and per-ticker errors.
+        """
+        result = BatchFetchResult()
+        try:
+            df = self._load()
+        except Exception as e:
+            logger.error(f"Failed to load data from CSV: {e}")
+            error = DataFetchError(f"Failed to load data from CSV: {e}")
+            result.errors = {config.ticker: error for config in configs}
+            return result
+
+        if 'Ticker' not in df.columns:
+            # Single-series file: every config reads the same rows.
+            groups = {config.ticker: df for config in configs}
+        else:
+            groups = {str(t): g.drop(columns='Ticker') for t, g in df.groupby('Ticker', sort=False)}
+
+        for config in configs:
+            if config.ticker not in groups:
+                result.errors[config.ticker] = DataFetchError(f"No data found for {config.ticker} in {self.csv_path}")
+                continue
+            result.data[config.ticker] = self._filter_dates(groups[config.ticker], config)
+
+        logger.info(f"Loaded {len(result.data)} of {len(configs)} tickers from CSV")
+        return result
@@ -0,0 +1,335 @@
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Tuple, Type
+import pandas as pd
+from core.abstractions import DataSource
+from core.models import DataFetchConfig, BatchFetchResult
+from core.exceptions import DataFetchError, TransientDataFetchError
+from utils.logging import setup_logger
+
+logger = setup_logger(__name__)
+
+
+class TokenBucket:
+    """Thread-safe token-bucket rate limiter."""
+
+    def __init__(
+        self,
+        rate: float,
+        capacity: Optional[float] = None,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        """Initializes the bucket full.
+
+        Args:
+            rate: Tokens added per second.
+            capacity: Maximum burst size. Defaults to `max(1, rate)`.
+            clock: Monotonic clock in seconds; replaceable in tests.
+            sleep: Function that waits a number of seconds; replaceable in tests.
+        """
+        if rate <= 0:
+            raise ValueError("Token bucket rate must be positive")
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else max(1.0, rate)
+        self.clock = clock
+        self.sleep = sleep
+        self._tokens = self.capacity
+        self._updated = clock()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> float:
+        """Blocks until a token is available and consumes it.
+
+        A caller that finds the bucket empty reserves the next token (the
+        balance goes negative) and sleeps until it has been refilled, so
+        waiting callers are served in order.
+
+        Returns:
+            float: Seconds spent waiting.
+        """
+        with self._lock:
+            now = self.clock()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= 1
+            delay = -self._tokens / self.rate if self._tokens < 0 else 0.0
+        if delay:
+            self.sleep(delay)
+        return delay
+
+
+class FetchStats:
+    """Thread-safe per-request latency and retry statistics."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.latencies: List[float] = []
+        self.attempts = 0
+        self.retries = 0
+        self.failures = 0
+
+    def record(self, latency: float, attempts: int, failed: bool) -> None:
+        """Records one completed request.
+
+        Args:
+            latency: Wall time of the request including retries and waits.
+            attempts: Number of attempts made.
+            failed: Whether the request ultimately failed.
+        """
+        with self._lock:
+            self.latencies.append(latency)
+            self.attempts += attempts
+            self.retries += attempts - 1
+            self.failures += int(failed)
+
+    def summary(self) -> Dict[str, Any]:
+        """Returns aggregate statistics.
+
+        Returns:
+            Dict[str, Any]: Request count, retries, failures and latency percentiles in seconds.
+        """
+        with self._lock:
+            latencies = sorted(self.latencies)
+            summary: Dict[str, Any] = {
+                'requests': len(latencies),
+                'attempts': self.attempts,
+                'retries': self.retries,
+                'failures': self.failures,
+            }
+        if latencies:
+            summary.update({
+                'latency_mean': sum(latencies) / len(latencies),
+                'latency_p50': latencies[len(latencies) // 2],
+                'latency_p95': latencies[min(len(latencies) - 1, int(len(latencies) * 0.95))],
+                'latency_max': latencies[-1],
+            })
+        return summary
+
+
+# Errors worth retrying: network failures, timeouts and rate limits. The
+# HTTP clients yfinance uses raise `OSError` subclasses; its rate limit error
+# does not. Anything else (an unknown ticker, a validation failure) fails the
+# same way on every attempt.
+TRANSIENT_ERRORS: Tuple[Type[BaseException], ...] = (OSError, TimeoutError, TransientDataFetchError)
+try:
+    from requests.exceptions import RequestException
+    TRANSIENT_ERRORS += (RequestException,)
+except ImportError:  # pragma: no cover - requests is a yfinance dependency
+    pass
+try:
+    from curl_cffi.requests.exceptions import RequestException as CurlRequestException
+    TRANSIENT_ERRORS += (CurlRequestException,)
+except ImportError:  # pragma: no cover - curl_cffi is a yfinance dependency
+    pass
+try:
+    from yfinance.exceptions import YFRateLimitError
+    TRANSIENT_ERRORS += (YFRateLimitError,)
+except ImportError:  # pragma: no cover - older yfinance
+    pass
+
+# `OSError`s that no retry fixes, checked before `retry_on`.
+PERMANENT_ERRORS: Tuple[Type[BaseException], ...] = (
+    FileNotFoundError, IsADirectoryError, NotADirectoryError, PermissionError,
+)
+
+
+class ConcurrentFetchExecutor(DataSource):
+    """Wraps a data source with bounded concurrency, rate limiting and retries.
+
+    `fetch_data` retries the wrapped source with exponential backoff and
+    full jitter. `fetch_many` hands the whole batch to the wrapped source's
+    own `fetch_many` when it batches requests (e.g. one `yf.download` per
+    chunk), retrying only the tickers that failed; otherwise it runs one
+    `fetch_data` per ticker on a thread pool capped at `max_workers`. Every
+    upstream call, single or batched, takes one token from a shared bucket,
+    so the upstream request rate stays bounded regardless of concurrency.
+    """
+
+    def __init__(
+        self,
+        source: DataSource,
+        max_workers: int = 8,
+        rate_limit: Optional[float] = None,
+        burst: Optional[float] = None,
+        max_retries: int = 3,
+        backoff_base: float = 0.5,
+        backoff_max: float = 30.0,
+        retry_on: Tuple[Type[BaseException], ...] = TRANSIENT_ERRORS,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        """Initializes the executor.
+
+        Args:
+            source: The data source to wrap.
+            max_workers: Maximum number of concurrent fetches.
+            rate_limit: Maximum upstream requests per second, or None for no limit.
+            burst: Token bucket capacity. Defaults to `max(1, rate_limit)`.
+            max_retries: Retries after the first failed attempt.
+            backoff_base: Base delay in seconds for exponential backoff.
+            backoff_max: Upper bound on a single backoff delay.
+            retry_on: Exception types that trigger a retry. An error is also
+                retried when one of these caused it, so a `DataFetchError`
+                raised from a connection error counts as transient.
+            clock: Monotonic clock in seconds; replaceable in tests.
+            sleep: Function that waits a number of seconds; replaceable in tests.
+        """
+        self.source = source
+        self.max_workers = max_workers
+        self.bucket = TokenBucket(rate_limit, burst, clock=clock, sleep=sleep) if rate_limit else None
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.retry_on = retry_on
+        self.clock = clock
+        self.sleep = sleep
+        self.fetch_stats = FetchStats()
+
+    @property
+    def batches_fetches(self) -> bool:
+        """Whether the wrapped source batches its fetches."""
+        return self.source.batches_fetches
+
+    def _backoff(self, attempt: int) -> float:
+        """Returns the full-jitter backoff delay before retry number `attempt`."""
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * (2 ** attempt)))
+
+    def _is_transient(self, error: BaseException) -> bool:
+        """Returns whether `error` or an exception in its cause chain is retryable.
+
+        The chain is walked from the outermost error; a permanent error
+        (e.g. a missing file) found first makes the whole chain permanent.
+        """
+        seen = set()
+        current: Optional[BaseException] = error
+        while current is not None and id(current) not in seen:
+            if isinstance(current, PERMANENT_ERRORS):
+                return False
+            if isinstance(current, self.retry_on):
+                return True
+            seen.add(id(current))
+            current = current.__cause__ or current.__context__
+        return False
+
+    @staticmethod
+    def _as_fetch_error(ticker: str, error: Exception) -> DataFetchError:
+        """Returns `error` as a `DataFetchError`."""
+        if isinstance(error, DataFetchError):
+            return error
+        wrapped = DataFetchError(f"Failed to fetch data for {ticker}: {error}")
+        wrapped.__cause__ = error
+        return wrapped
+
+    def fetch_data(self, config: DataFetchConfig) -> pd.DataFrame:
+        """Fetches market data from the wrapped source, retrying transient errors.
+
+        Args:
+            config: The data fetch configuration.
+
+        Returns:
+            pd.DataFrame: The fetched market data.
+
+        Raises:
+            DataFetchError: If the error is permanent or every attempt fails.
+        """
+        started = self.clock()
+        attempt = 0
+        while True:
+            attempt += 1
+            if self.bucket:
+                self.bucket.acquire()
+            try:
+                df = self.source.fetch_data(config)
+                self.fetch_stats.record(self.clock() - started, attempt, failed=False)
+                return df
+            except Exception as e:
+                if not self._is_transient(e) or attempt > self.max_retries:
+                    self.fetch_stats.record(self.clock() - started, attempt, failed=True)
+                    logger.error(f"Giving up on {config.ticker} after {attempt} attempt(s): {e}")
+                    raise self._as_fetch_error(config.ticker, e)
+                delay = self._backoff(attempt - 1)
+                logger.warning(f"Fetch for {config.ticker} failed (attempt {attempt}): {e}; retrying in {delay:.2f}s")
+                self.sleep(delay)
+
+    def fetch_many(self, configs: List[DataFetchConfig]) -> BatchFetchResult:
+        """Fetches several tickers, batched when the wrapped source supports it.
+
+        Args:
+            configs: The data fetch configurations, one per ticker.
+
+        Returns:
+            BatchFetchResult: Fetched data and per-ticker errors, in input order.
+        """
+        if self.source.batches_fetches:
+            result = self._fetch_batched(configs)
+            mode = "in batches"
+        else:
+            result = self._fetch_concurrently(configs)
+            mode = "concurrently"
+        # Restore input order; retried tickers complete late.
+        result.data = {c.ticker: result.data[c.ticker] for c in configs if c.ticker in result.data}
+        result.errors = {c.ticker: result.errors[c.ticker] for c in configs if c.ticker in result.errors}
+        logger.info(f"Fetched {len(result.data)} of {len(configs)} tickers {mode}: {self.fetch_stats.summary()}")
+        return result
+
+    def _fetch_batched(self, configs: List[DataFetchConfig]) -> BatchFetchResult:
+        """Fetches through the wrapped source's `fetch_many`, one token per batch, retrying failed tickers."""
+        result = BatchFetchResult()
+        started = self.clock()
+        pending = list(configs)
+        attempt = 0
+        while pending:
+            attempt += 1
+            if self.bucket:
+                self.bucket.acquire()
+            try:
+                batch = self.source.fetch_many(pending)
+            except Exception as e:
+                batch = BatchFetchResult(errors={config.ticker: e for config in pending})
+
+            retry: List[DataFetchConfig] = []
+            for config in pending:
+                ticker = config.ticker
+                if ticker in batch.data:
+                    result.data[ticker] = batch.data[ticker]
+                    self.fetch_stats.record(self.clock() - started, attempt, failed=False)
+                    continue
+                error = batch.errors.get(ticker) or DataFetchError(f"No data returned for {ticker}")
+                if self._is_transient(error) and attempt <= self.max_retries:
+                    retry.append(config)
+                    continue
+                result.errors[ticker] = self._as_fetch_error(ticker, error)
+                self.fetch_stats.record(self.clock() - started, attempt, failed=True)
+                logger.error(f"Giving up on {ticker} after {attempt} attempt(s): {error}")
+
+            if retry:
+                delay = self._backoff(attempt - 1)
+                logger.warning(f"Batch fetch failed for {len(retry)} ticker(s) (attempt {attempt}); retrying in {delay:.2f}s")
+                self.sleep(delay)
+            pending = retry
+        return result
+
+    def _fetch_concurrently(self, configs: List[DataFetchConfig]) -> BatchFetchResult:
+        """Runs one `fetch_data` per config on the thread pool."""
+        result = BatchFetchResult()
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            futures = [(config.ticker, pool.submit(self.fetch_data, config)) for config in configs]
+            for ticker, future in futures:
+                try:
+                    result.data[ticker] = future.result()
+                except Exception as e:
+                    result.errors[ticker] = e
+        return result
+
+    def stats(self) -> Dict[str, Any]:
+        """Returns fetch latency statistics merged with the wrapped source's statistics.
+
+        Returns:
+            Dict[str, Any]: Statistics with a 'fetch' entry.
+        """
+        stats = dict(self.source.stats())
+        stats['fetch'] = self.fetch_stats.summary()
+        return stats
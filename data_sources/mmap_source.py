@@ -0,0 +1,191 @@
+import json
+import os
+import numpy as np
+import pandas as pd
+from typing import Any, Dict, Tuple
+from core.abstractions import DataSource
+from core.models import DataFetchConfig
+from core.exceptions import DataFetchError
+from utils.logging import setup_logger
+
+logger = setup_logger(__name__)
+
+HEADER_FILE = "header.json"
+TIMESTAMP_FILE = "timestamp.npy"
+FORMAT_VERSION = 1
+
+# Fixed-width on-disk dtype for each stored column.
+COLUMN_DTYPES = {
+    'Open': 'float64',
+    'High': 'float64',
+    'Low': 'float64',
+    'Close': 'float64',
+    'Volume': 'float64',
+}
+
+
+def _series_dir(root_dir: str, ticker: str, interval: str) -> str:
+    """Returns the directory holding the arrays of one series."""
+    return os.path.join(root_dir, f"{ticker}_{interval}")
+
+
+def _save_array(path: str, values: np.ndarray) -> None:
+    """Writes an `.npy` file by replacing it rather than overwriting it in place."""
+    with open(path + '.tmp', 'wb') as f:
+        np.save(f, values)
+    os.replace(path + '.tmp', path)
+
+
+def write_mmap_bars(df: pd.DataFrame, root_dir: str, ticker: str, interval: str = "1d") -> str:
+    """Writes an OHLCV DataFrame in the memory-mapped binary bar format.
+
+    Each column is stored as its own fixed-width `.npy` array next to an
+    int64 nanosecond timestamp array and a JSON sidecar header. An existing
+    series with the same ticker and interval is replaced file by file, so
+    arrays already mapped by a reader keep their old contents.
+
+    Args:
+        df: OHLCV data indexed by a DatetimeIndex.
+        root_dir: Root directory of the bar store.
+        ticker: The ticker symbol.
+        interval: The bar interval.
+
+    Returns:
+        str: The directory the series was written to.
+
+    Raises:
+        DataFetchError: If the frame is missing columns or has a non-datetime index.
+    """
+    missing_cols = [col for col in COLUMN_DTYPES if col not in df.columns]
+    if missing_cols:
+        raise DataFetchError(f"Missing columns for binary bar store: {missing_cols}")
+    if not isinstance(df.index, pd.DatetimeIndex):
+        raise DataFetchError("Binary bar store requires a DatetimeIndex")
+
+    df = df.sort_index()
+    series_dir = _series_dir(root_dir, ticker, interval)
+    os.makedirs(series_dir, exist_ok=True)
+
+    timestamps = df.index.tz_localize(None) if df.index.tz is not None else df.index
+    _save_array(os.path.join(series_dir, TIMESTAMP_FILE), timestamps.asi8.astype('int64'))
+    for col, dtype in COLUMN_DTYPES.items():
+        _save_array(os.path.join(series_dir, f"{col.lower()}.npy"), df[col].to_numpy(dtype=dtype))
+
+    header = {
+        'version': FORMAT_VERSION,
+        'ticker': ticker,
+        'interval': interval,
+        'length': len(df),
+        'columns': COLUMN_DTYPES,
+        'first': str(timestamps[0]) if len(df) else None,
+        'last': str(timestamps[-1]) if len(df) else None,
+    }
+    # The header is replaced last; readers reopen a series when it changes.
+    header_path = os.path.join(series_dir, HEADER_FILE)
+    with open(header_path + '.tmp', 'w') as f:
+        json.dump(header, f, indent=2)
+    os.replace(header_path + '.tmp', header_path)
+
+    logger.info(f"Wrote {len(df)} bars for {ticker} ({interval}) to {series_dir}")
+    return series_dir
+
+
+class MemoryMappedDataSource(DataSource):
+    """Data source serving OHLCV bars from memory-mapped NumPy arrays.
+
+    Arrays are opened read-only with `mmap_mode='r'`, so multiple processes
+    reading the same series share the OS page cache. `fetch_data` binary
+    searches the timestamp array and returns a DataFrame whose columns are
+    views onto the mapped files; the returned frame is therefore read-only.
+
+    Opened series are cached per instance and reopened when their header
+    file changes, i.e. after `write_mmap_bars` rewrote them.
+    """
+
+    def __init__(self, root_dir: str = "data/bars"):
+        """Initializes the memory-mapped data source.
+
+        Args:
+            root_dir: Root directory of the bar store.
+        """
+        self.root_dir = root_dir
+        self._series: Dict[Tuple[str, str], Tuple[Tuple[int, int], np.ndarray, Dict[str, np.ndarray]]] = {}
+
+    def _open(self, ticker: str, interval: str) -> Tuple[np.ndarray, Dict[str, np.ndarray]]:
+        """Maps the arrays of a series, reusing previously opened maps.
+
+        Args:
+            ticker: The ticker symbol.
+            interval: The bar interval.
+
+        Returns:
+            Tuple of the timestamp array and a mapping of column name to array.
+
+        Raises:
+            DataFetchError: If the series is missing or its header is invalid.
+        """
+        key = (ticker, interval)
+        series_dir = _series_dir(self.root_dir, ticker, interval)
+        header_path = os.path.join(series_dir, HEADER_FILE)
+        try:
+            stat = os.stat(header_path)
+        except FileNotFoundError:
+            self._series.pop(key, None)
+            raise DataFetchError(f"No binary bar data for {ticker} ({interval}) in {self.root_dir}")
+        # The header is replaced on every rewrite, so its inode and mtime identify a version.
+        version = (stat.st_ino, stat.st_mtime_ns)
+        cached = self._series.get(key)
+        if cached is not None and cached[0] == version:
+            return cached[1], cached[2]
+
+        with open(header_path) as f:
+            header: Dict[str, Any] = json.load(f)
+        if header.get('version') != FORMAT_VERSION:
+            raise DataFetchError(f"Unsupported binary bar format version: {header.get('version')}")
+
+        timestamps = np.load(os.path.join(series_dir, TIMESTAMP_FILE), mmap_mode='r')
+        columns = {
+            col: np.load(os.path.join(series_dir, f"{col.lower()}.npy"), mmap_mode='r')
+            for col in header['columns']
+        }
+        if any(len(arr) != header['length'] for arr in columns.values()) or len(timestamps) != header['length']:
+            raise DataFetchError(f"Binary bar arrays for {ticker} ({interval}) do not match header length")
+
+        self._series[key] = (version, timestamps, columns)
+        return timestamps, columns
+
+    def fetch_data(self, config: DataFetchConfig) -> pd.DataFrame:
+        """Fetches a zero-copy view of the bars within the configured range.
+
+        Args:
+            config: The data fetch configuration.
+
+        Returns:
+            pd.DataFrame: Read-only OHLCV data indexed by a DatetimeIndex.
+
+        Raises:
+            DataFetchError: If the series is missing, unreadable or has no
+                bars in the range.
+        """
+        try:
+            timestamps, columns = self._open(config.ticker, config.interval)
+
+            lo, hi = 0, len(timestamps)
+            if config.start_date:
+                lo = int(np.searchsorted(timestamps, pd.Timestamp(config.start_date).value, side='left'))
+            if config.end_date:
+                hi = int(np.searchsorted(timestamps, pd.Timestamp(config.end_date).value, side='right'))
+            if hi <= lo:
+                raise DataFetchError(f"No data found for {config.ticker} in requested range")
+
+            index = pd.DatetimeIndex(timestamps[lo:hi].view('datetime64[ns]'), name='Date')
+            df = pd.DataFrame({col: arr[lo:hi] for col, arr in columns.items()}, index=index, copy=False)
+
+            logger.info(f"Mapped {len(df)} bars for {config.ticker} ({config.interval})")
+            return df
+
+        except DataFetchError:
+            raise
+        except Exception as e:
+            logger.error(f"Failed to map binary bars for {config.ticker}: {e}")
+            raise DataFetchError(f"Failed to map binary bars for {config.ticker}: {e}") from e
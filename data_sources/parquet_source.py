@@ -0,0 +1,185 @@
+import os
+import pandas as pd
+from typing import List, Optional, Tuple
+from core.abstractions import DataSource
+from core.models import DataFetchConfig
+from core.exceptions import DataFetchError
+from data_sources.csv_source import CSVDataSource
+from utils.logging import setup_logger
+
+logger = setup_logger(__name__)
+
+OHLCV_COLUMNS = ['Open', 'High', 'Low', 'Close', 'Volume']
+
+# Partition granularities and the strftime pattern used for the `period=` directory.
+_PERIOD_FORMATS = {
+    'year': '%Y',
+    'month': '%Y-%m',
+}
+
+
+def _partition_dir(root_dir: str, ticker: str, interval: str) -> str:
+    """Returns the directory holding all period partitions of one series."""
+    return os.path.join(root_dir, f"ticker={ticker}", f"interval={interval}")
+
+
+def _period_bounds(period: str) -> Tuple[pd.Timestamp, pd.Timestamp]:
+    """Returns the [start, end) time range covered by a `period=` partition name.
+
+    Args:
+        period: The partition value, either 'YYYY' or 'YYYY-MM'.
+
+    Returns:
+        Tuple of the inclusive start and exclusive end timestamps.
+    """
+    if len(period) == 4:
+        start = pd.Timestamp(year=int(period), month=1, day=1)
+        return start, start + pd.DateOffset(years=1)
+    start = pd.Timestamp(f"{period}-01")
+    return start, start + pd.DateOffset(months=1)
+
+
+class ParquetDataSource(DataSource):
+    """Data source reading a columnar Parquet store partitioned by ticker/interval/period.
+
+    The store layout is::
+
+        <root_dir>/ticker=<TICKER>/interval=<INTERVAL>/period=<YYYY or YYYY-MM>/data.parquet
+
+    Only the partitions overlapping the requested date range are opened, only
+    the OHLCV columns are read, and the date bounds are pushed down to the
+    Parquet reader so row groups outside the range are skipped.
+    """
+
+    def __init__(self, root_dir: str = "data/parquet", columns: Optional[List[str]] = None):
+        """Initializes the Parquet data source.
+
+        Args:
+            root_dir: Root directory of the partitioned store.
+            columns: Columns to read. Defaults to Open/High/Low/Close/Volume.
+        """
+        self.root_dir = root_dir
+        self.columns = columns or list(OHLCV_COLUMNS)
+
+    def _select_partitions(self, config: DataFetchConfig) -> List[str]:
+        """Lists the partition files overlapping the configured date range.
+
+        Args:
+            config: The data fetch configuration.
+
+        Returns:
+            List[str]: Sorted partition file paths.
+
+        Raises:
+            DataFetchError: If the series is not present in the store.
+        """
+        series_dir = _partition_dir(self.root_dir, config.ticker, config.interval)
+        if not os.path.isdir(series_dir):
+            raise DataFetchError(f"No Parquet data for {config.ticker} ({config.interval}) in {self.root_dir}")
+
+        start = pd.to_datetime(config.start_date) if config.start_date else None
+        end = pd.to_datetime(config.end_date) if config.end_date else None
+
+        paths = []
+        for entry in sorted(os.listdir(series_dir)):
+            if not entry.startswith("period="):
+                continue
+            period_start, period_end = _period_bounds(entry[len("period="):])
+            if start is not None and period_end <= start:
+                continue
+            if end is not None and period_start > end:
+                continue
+            path = os.path.join(series_dir, entry, "data.parquet")
+            if os.path.exists(path):
+                paths.append(path)
+        return paths
+
+    def fetch_data(self, config: DataFetchConfig) -> pd.DataFrame:
+        """Fetches market data from the partitioned Parquet store.
+
+        Args:
+            config: The data fetch configuration.
+
+        Returns:
+            pd.DataFrame: The fetched market data indexed by a DatetimeIndex.
+
+        Raises:
+            DataFetchError: If the series is missing or cannot be read.
+        """
+        try:
+            paths = self._select_partitions(config)
+            logger.info(f"Loading {config.ticker} from {len(paths)} Parquet partition(s)...")
+
+            filters = []
+            if config.start_date:
+                filters.append(('Date', '>=', pd.to_datetime(config.start_date)))
+            if config.end_date:
+                filters.append(('Date', '<=', pd.to_datetime(config.end_date)))
+
+            frames = [
+                pd.read_parquet(path, columns=['Date'] + self.columns, filters=filters or None)
+                for path in paths
+            ]
+            frames = [f for f in frames if not f.empty]
+            if not frames:
+                raise DataFetchError(f"No data found for {config.ticker} in requested range")
+
+            df = pd.concat(frames, ignore_index=True)
+            df['Date'] = pd.to_datetime(df['Date'])
+            df.set_index('Date', inplace=True)
+            df.sort_index(inplace=True)
+
+            logger.info(f"Successfully loaded {len(df)} rows from Parquet")
+            return df
+
+        except DataFetchError:
+            raise
+        except Exception as e:
+            logger.error(f"Failed to load data from Parquet: {e}")
+            raise DataFetchError(f"Failed to load data from Parquet: {e}") from e
+
+
+def convert_csv_to_parquet(
+    csv_path: str,
+    root_dir: str,
+    ticker: str,
+    interval: str = "1d",
+    partition_by: str = "year",
+) -> List[str]:
+    """Converts an OHLCV CSV file into the partitioned Parquet layout.
+
+    The CSV is parsed with the same normalization as `CSVDataSource`, then
+    written as one file per period partition. Existing partitions for the
+    same periods are overwritten.
+
+    Args:
+        csv_path: Path to the source CSV file.
+        root_dir: Root directory of the Parquet store.
+        ticker: Ticker the CSV contains.
+        interval: Bar interval of the CSV data.
+        partition_by: Partition granularity, 'year' or 'month'.
+
+    Returns:
+        List[str]: Paths of the written partition files.
+
+    Raises:
+        DataFetchError: If the CSV cannot be read or the partitioning is unknown.
+    """
+    if partition_by not in _PERIOD_FORMATS:
+        raise DataFetchError(f"Unsupported partitioning '{partition_by}', expected one of {list(_PERIOD_FORMATS)}")
+
+    df = CSVDataSource(csv_path).fetch_data(DataFetchConfig(ticker=ticker, interval=interval))
+    df = df[OHLCV_COLUMNS].sort_index()
+    series_dir = _partition_dir(root_dir, ticker, interval)
+
+    written = []
+    periods = df.index.strftime(_PERIOD_FORMATS[partition_by])
+    for period, part in df.groupby(periods, sort=True):
+        part_dir = os.path.join(series_dir, f"period={period}")
+        os.makedirs(part_dir, exist_ok=True)
+        path = os.path.join(part_dir, "data.parquet")
+        part.rename_axis('Date').reset_index().to_parquet(path, index=False)
+        written.append(path)
+
+    logger.info(f"Wrote {len(written)} Parquet partition(s) for {ticker} to {series_dir}")
+    return written
@@ -1,17 +1,205 @@
+import logging
 import yfinance as yf
 import pandas as pd
+from contextlib import contextmanager
 from datetime import datetime, timedelta
-from typing import Optional, cast
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple, cast
 from core.abstractions import DataSource
-from core.models import DataFetchConfig
-from core.exceptions import DataFetchError
+from core.models import DataFetchConfig, BatchFetchResult
+from core.exceptions import DataFetchError, TransientDataFetchError
+from data_sources.bar_store import BarStore
 from utils.logging import setup_logger
 
 logger = setup_logger(__name__)
 
+# `yf.download` logs per-ticker failures instead of raising them, as e.g.
+# "['AAPL', 'MSFT']: YFRateLimitError('Too Many Requests...')". Messages
+# containing one of these mark a failure worth retrying.
+TRANSIENT_MARKERS = ('YFRateLimitError', 'Too Many Requests', 'Timeout', 'timed out', 'ConnectionError', 'CurlError')
+
+
+class _DownloadErrors(logging.Handler):
+    """Collects the errors yfinance logs during a download."""
+
+    def __init__(self):
+        super().__init__(logging.ERROR)
+        self.messages: List[str] = []
+
+    def emit(self, record: logging.LogRecord) -> None:
+        self.messages.append(record.getMessage())
+
+    def transient(self, ticker: str) -> Optional[str]:
+        """Returns the logged transient error naming `ticker`, if any."""
+        for message in self.messages:
+            if f"'{ticker.upper()}'" in message and any(marker in message for marker in TRANSIENT_MARKERS):
+                return message
+        return None
+
+
+@contextmanager
+def _capture_download_errors() -> Iterator[_DownloadErrors]:
+    """Collects the errors the yfinance logger reports within the block."""
+    handler = _DownloadErrors()
+    yf_logger = logging.getLogger('yfinance')
+    yf_logger.addHandler(handler)
+    try:
+        yield handler
+    finally:
+        yf_logger.removeHandler(handler)
+
+
+def _no_data_error(ticker: str, errors: _DownloadErrors) -> DataFetchError:
+    """Returns the error for a ticker that came back empty: transient if yfinance logged a transient failure for it."""
+    message = errors.transient(ticker)
+    if message is not None:
+        return TransientDataFetchError(f"Failed to fetch data for {ticker}: {message}")
+    return DataFetchError(f"No data found for {ticker}")
+
 class YFinanceDataSource(DataSource):
     """Data source implementation using yfinance."""
 
+    def __init__(
+        self,
+        store: Optional[BarStore] = None,
+        downloader: Optional[Callable[..., Any]] = None,
+        chunk_size: int = 100,
+    ):
+        """Initializes the yfinance data source.
+
+        Args:
+            store: Optional local bar store. When set, only date ranges the
+                store does not already hold are downloaded.
+            downloader: Optional replacement for `yf.download`, mainly for
+                offline testing.
+            chunk_size: Maximum number of tickers per `yf.download` call in `fetch_many`.
+        """
+        self.store = store
+        self.downloader = downloader
+        self.chunk_size = chunk_size
+
+    @staticmethod
+    def _resolve_dates(config: DataFetchConfig) -> Tuple[str, str]:
+        """Resolves open-ended config dates to concrete YYYY-MM-DD strings."""
+        start_date = config.start_date
+        end_date = config.end_date
+
+        # Default to last 90 days if not specified
+        if not start_date:
+            start_date = (datetime.now() - timedelta(days=90)).strftime('%Y-%m-%d')
+        if not end_date:
+            end_date = datetime.now().strftime('%Y-%m-%d')
+        return start_date, end_date
+
+    @staticmethod
+    def _normalize(df: pd.DataFrame) -> pd.DataFrame:
+        """Selects the OHLCV columns and strips the index timezone.
+
+        Args:
+            df: Raw single-ticker data returned by yfinance.
+
+        Returns:
+            pd.DataFrame: Data with columns ['Open', 'High', 'Low', 'Close', 'Volume'].
+
+        Raises:
+            DataFetchError: If required columns are missing.
+        """
+        # Ensure columns exist and are properly named
+        required_cols = ['Open', 'High', 'Low', 'Close', 'Volume']
+
+        # Handle MultiIndex columns if they exist (yfinance update)
+        if isinstance(df.columns, pd.MultiIndex):
+             df.columns = df.columns.get_level_values(0)
+
+        # Check if columns are present
+        missing_cols = [col for col in required_cols if col not in df.columns]
+        if missing_cols:
+             raise DataFetchError(f"Missing columns in fetched data: {missing_cols}")
+
+        df = df[required_cols]
+
+        # Ensure index is timezone-naive DatetimeIndex
+        if isinstance(df.index, pd.DatetimeIndex) and df.index.tz is not None:
+            df.index = df.index.tz_localize(None)
+
+        return df
+
+    def _download(self, ticker: str, start_date: str, end_date: str, interval: str) -> pd.DataFrame:
+        """Downloads and normalizes bars for a single date range.
+
+        Args:
+            ticker: The ticker symbol.
+            start_date: Inclusive start date (YYYY-MM-DD).
+            end_date: Exclusive end date (YYYY-MM-DD).
+            interval: The bar interval.
+
+        Returns:
+            pd.DataFrame: Bars with columns ['Open', 'High', 'Low', 'Close', 'Volume'],
+            or an empty DataFrame if the range holds no data.
+
+        Raises:
+            DataFetchError: If the downloaded data is missing required columns.
+            TransientDataFetchError: If yfinance reported a network error or
+                rate limit instead of data.
+        """
+        downloader = self.downloader or yf.download
+
+        # yfinance' download may return a DataFrame or None; cast to help
+        # static checkers understand the expected type.
+        with _capture_download_errors() as errors:
+            df = cast(Optional[pd.DataFrame], downloader(
+                ticker,
+                start=start_date,
+                end=end_date,
+                interval=interval,
+                progress=False
+            ))
+
+        if df is None or df.empty:
+            message = errors.transient(ticker)
+            if message is not None:
+                raise TransientDataFetchError(f"Failed to fetch data for {ticker}: {message}")
+            return pd.DataFrame()
+
+        return self._normalize(df)
+
+    def _fetch_incremental(self, config: DataFetchConfig, start_date: str, end_date: str) -> pd.DataFrame:
+        """Downloads only the ranges missing from the store and serves the rest from disk.
+
+        Args:
+            config: The data fetch configuration.
+            start_date: Inclusive start date (YYYY-MM-DD).
+            end_date: Exclusive end date (YYYY-MM-DD).
+
+        Returns:
+            pd.DataFrame: The requested bars.
+        """
+        store = cast(BarStore, self.store)
+        # Never mark today (or the future) as covered: today's bar is still forming.
+        today = datetime.now().strftime('%Y-%m-%d')
+
+        gaps = store.missing_ranges(config.ticker, config.interval, start_date, end_date)
+        logger.info(f"{len(gaps)} missing range(s) for {config.ticker} in local store")
+
+        uncached = []
+        for gap_start, gap_end in gaps:
+            df = self._download(config.ticker, gap_start, gap_end, config.interval)
+            covered_end = min(gap_end, today)
+            if df.empty:
+                head, tail = df, df
+            else:
+                head = df[df.index < pd.Timestamp(covered_end)]
+                tail = df[df.index >= pd.Timestamp(covered_end)]
+            if gap_start < covered_end:
+                store.merge(config.ticker, config.interval, head, (gap_start, covered_end))
+            if not tail.empty:
+                uncached.append(tail)
+
+        df = store.load(config.ticker, config.interval, start_date, end_date)
+        if uncached:
+            df = pd.concat([df] + uncached) if not df.empty else pd.concat(uncached)
+            df = df[~df.index.duplicated(keep='last')].sort_index()
+        return df
+
     def fetch_data(self, config: DataFetchConfig) -> pd.DataFrame:
         """Fetches market data using yfinance.
 
@@ -26,50 +214,106 @@ class YFinanceDataSource(DataSource):
         """
         try:
             logger.info(f"Fetching data for {config.ticker}...")
-            
-            start_date = config.start_date
-            end_date = config.end_date
-            
-            # Default to last 90 days if not specified
-            if not start_date:
-                start_date = (datetime.now() - timedelta(days=90)).strftime('%Y-%m-%d')
-            if not end_date:
-                end_date = datetime.now().strftime('%Y-%m-%d')
-
-            # yfinance' download may return a DataFrame or None; cast to help
-            # static checkers understand the expected type.
-            df = cast(Optional[pd.DataFrame], yf.download(
-                config.ticker,
-                start=start_date,
-                end=end_date,
-                interval=config.interval,
-                progress=False
-            ))
 
-            if df is None or df.empty:
+            start_date, end_date = self._resolve_dates(config)
+
+            if self.store is not None:
+                df = self._fetch_incremental(config, start_date, end_date)
+            else:
+                df = self._download(config.ticker, start_date, end_date, config.interval)
+
+            if df.empty:
                 raise DataFetchError(f"No data found for {config.ticker}")
 
-            # Ensure columns exist and are properly named
-            required_cols = ['Open', 'High', 'Low', 'Close', 'Volume']
-            
-            # Handle MultiIndex columns if they exist (yfinance update)
-            if isinstance(df.columns, pd.MultiIndex):
-                 df.columns = df.columns.get_level_values(0)
-            
-            # Check if columns are present
-            missing_cols = [col for col in required_cols if col not in df.columns]
-            if missing_cols:
-                 raise DataFetchError(f"Missing columns in fetched data: {missing_cols}")
-
-            df = df[required_cols]
-            
-            # Ensure index is timezone-naive DatetimeIndex
-            if isinstance(df.index, pd.DatetimeIndex) and df.index.tz is not None:
-                df.index = df.index.tz_localize(None)
-            
             logger.info(f"Successfully fetched {len(df)} rows for {config.ticker}")
             return df
 
         except Exception as e:
             logger.error(f"Failed to fetch data for {config.ticker}: {e}")
             raise DataFetchError(f"Failed to fetch data for {config.ticker}: {e}") from e
+
+    @staticmethod
+    def _split_ticker(df: pd.DataFrame, ticker: str) -> pd.DataFrame:
+        """Extracts one ticker's columns from a multi-ticker download.
+
+        Args:
+            df: The MultiIndex-column frame returned by `yf.download`.
+            ticker: The ticker to extract.
+
+        Returns:
+            pd.DataFrame: The ticker's columns, or an empty DataFrame if absent.
+        """
+        if not isinstance(df.columns, pd.MultiIndex):
+            return df
+        for level in range(df.columns.nlevels):
+            if ticker in df.columns.get_level_values(level):
+                return df.xs(ticker, axis=1, level=level).dropna(how='all')
+        return pd.DataFrame()
+
+    @property
+    def batches_fetches(self) -> bool:
+        """Batched only without a bar store, which fetches ticker by ticker."""
+        return self.store is None
+
+    def fetch_many(self, configs: List[DataFetchConfig]) -> BatchFetchResult:
+        """Fetches several tickers with batched `yf.download` calls.
+
+        Configs sharing the same interval and date range are downloaded
+        together, `chunk_size` tickers per request, and the MultiIndex result
+        is split back into one normalized DataFrame per ticker. With a bar
+        store configured, each ticker is fetched incrementally instead.
+
+        Args:
+            configs: The data fetch configurations, one per ticker.
+
+        Returns:
+            BatchFetchResult: Fetched data and per-ticker errors.
+        """
+        if self.store is not None:
+            return super().fetch_many(configs)
+
+        result = BatchFetchResult()
+        downloader = self.downloader or yf.download
+
+        groups: Dict[Tuple[str, str, str], List[str]] = {}
+        for config in configs:
+            start_date, end_date = self._resolve_dates(config)
+            groups.setdefault((config.interval, start_date, end_date), []).append(config.ticker)
+
+        for (interval, start_date, end_date), tickers in groups.items():
+            for i in range(0, len(tickers), self.chunk_size):
+                chunk = tickers[i:i + self.chunk_size]
+                logger.info(f"Fetching batch of {len(chunk)} tickers ({interval}, {start_date}..{end_date})...")
+                try:
+                    with _capture_download_errors() as errors:
+                        raw = cast(Optional[pd.DataFrame], downloader(
+                            chunk,
+                            start=start_date,
+                            end=end_date,
+                            interval=interval,
+                            group_by='ticker',
+                            progress=False
+                        ))
+                except Exception as e:
+                    logger.error(f"Batch download failed: {e}")
+                    for ticker in chunk:
+                        error = DataFetchError(f"Failed to fetch data for {ticker}: {e}")
+                        error.__cause__ = e
+                        result.errors[ticker] = error
+                    continue
+
+                for ticker in chunk:
+                    try:
+                        if raw is None or raw.empty:
+                            raise _no_data_error(ticker, errors)
+                        df = self._split_ticker(raw, ticker)
+                        if df.empty:
+                            raise _no_data_error(ticker, errors)
+                        result.data[ticker] = self._normalize(df.copy())
+                    except DataFetchError as e:
+                        result.errors[ticker] = e
+                    except Exception as e:
+                        result.errors[ticker] = DataFetchError(f"Failed to fetch data for {ticker}: {e}")
+
+        logger.info(f"Fetched {len(result.data)} of {len(configs)} tickers ({len(result.errors)} errors)")
+        return result
@@ -1,13 +1,92 @@
-from typing import List, Optional
+import copy
+import hashlib
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor, wait
+from contextlib import ExitStack, contextmanager
+import pandas as pd
+from typing import Any, Callable, Deque, Dict, Iterable, Iterator, List, Optional, Tuple, Union
 from core.abstractions import DataSource, Indicator, Visualizer, Strategy
-from core.models import DataFetchConfig, AnalysisResult
-from core.exceptions import TradingEngineError, DataFetchError, IndicatorCalculationError, VisualizationError
+from core.graph import GraphEvaluator, Node
+from core.models import DataFetchConfig, AnalysisResult, Signals
+from core.exceptions import TradingEngineError, DataFetchError, IndicatorCalculationError, VisualizationError, BacktestError
+from backtesting import VectorizedBacktester
+from utils.cache import TTLCache, frame_fingerprint
 from utils.logging import setup_logger
+from utils.metrics import Metrics, MetricsExporter, MetricsRecorder
+from utils.profiling import StageProfiler
+
+# Indicators return a Series; multi-period grids return one column per period.
+IndicatorOutput = Union[pd.Series, pd.DataFrame]
+
+INDICATOR_BACKENDS = ("pandas", "numpy")
+INDICATOR_DTYPES = ("float64", "float32")
+
+# Engine and visualizer of the current `run_many` worker process.
+_pipeline_worker: Dict[str, Any] = {}
+
+
+def _init_pipeline_worker(name: str, component: Any) -> None:
+    """Pool initializer: keeps a pipeline component for the lifetime of the worker process."""
+    _pipeline_worker[name] = component
+
+
+def _fetch_stage(data_source: DataSource, config: DataFetchConfig, track_memory: bool) -> Tuple[pd.DataFrame, Metrics]:
+    """Pipeline task: fetches one configuration, returning the data and the fetch metrics."""
+    recorder = MetricsRecorder(track_memory)
+    with recorder.measure('stages', 'fetch'):
+        df = data_source.fetch_data(config)
+    return df, recorder.groups['stages']['fetch']
+
+
+def _compute_stage(engine: Optional["TradingEngine"], df: pd.DataFrame) -> AnalysisResult:
+    """Pipeline task: analyzes one frame.
+
+    In a worker process the result is returned without its data, which the
+    caller already holds, so the frame is not pickled back.
+    """
+    if engine is None:
+        result = _pipeline_worker['engine'].analyze(df)
+        result.data = None
+        return result
+    return engine.analyze(df)
+
+
+def _render_stage(visualizer: Optional[Visualizer], result: AnalysisResult, output_path: str, track_memory: bool) -> Metrics:
+    """Pipeline task: renders one analysis, with the worker process's visualizer if none is given.
+
+    Returns:
+        Metrics: The render metrics.
+    """
+    if visualizer is None:
+        visualizer = _pipeline_worker['visualizer']
+    with MetricsRecorder(track_memory) as recorder:
+        try:
+            with recorder.measure('stages', 'render'):
+                visualizer.render(result.data, result.indicators, result.signals, output_path)
+        except Exception as e:
+            raise VisualizationError(f"Failed to render visualization: {e}") from e
+    return recorder.groups['stages']['render']
+
 
 class TradingEngine:
     """Orchestrates the trading analysis pipeline."""
 
-    def __init__(self, data_source: DataSource, indicators: List[Indicator], visualizer: Visualizer, strategy: Optional[Strategy] = None):
+    def __init__(
+        self,
+        data_source: DataSource,
+        indicators: List[Indicator],
+        visualizer: Visualizer,
+        strategy: Optional[Strategy] = None,
+        indicator_cache: Optional[TTLCache] = None,
+        indicator_backend: str = "pandas",
+        indicator_dtype: str = "float64",
+        indicator_workers: int = 1,
+        backtester: Optional[VectorizedBacktester] = None,
+        track_memory: bool = False,
+        metrics_exporter: Optional[MetricsExporter] = None,
+        profiler: Optional[StageProfiler] = None,
+    ):
         """Initializes the trading engine with dependencies.
 
         Args:
@@ -15,13 +94,280 @@ class TradingEngine:
             indicators: A list of indicator components.
             visualizer: The visualizer component.
             strategy: The strategy component (optional).
+            indicator_cache: Cache for indicator results (optional). Entries
+                are keyed on the indicator class, its parameters and a
+                fingerprint of the input data.
+            indicator_backend: 'pandas' to evaluate indicators through the
+                computation graph and pandas, or 'numpy' to run them on raw
+                arrays via `Indicator.calculate_numpy`.
+            indicator_dtype: Array dtype of the NumPy backend, 'float64' or 'float32'.
+            indicator_workers: Threads evaluating independent indicators
+                concurrently; 1 evaluates them sequentially. Pandas and NumPy
+                release the GIL in most of their kernels.
+            backtester: Backtests the strategy's signals after they are
+                generated (optional; requires a strategy).
+            track_memory: Also record the peak memory delta of every stage
+                and indicator in the metrics (see `utils.metrics`); this
+                traces allocations and slows the run down.
+            metrics_exporter: Exports the metrics of every `run` and
+                `run_many` result (optional).
+            profiler: Collects call profiles and allocation sites of every
+                stage of `run` and `analyze` (optional; not used by the
+                workers of `run_many`).
+
+        Raises:
+            ValueError: If the backend or dtype is not supported.
         """
+        if indicator_backend not in INDICATOR_BACKENDS:
+            raise ValueError(f"Unsupported indicator backend '{indicator_backend}', expected one of {INDICATOR_BACKENDS}")
+        if indicator_dtype not in INDICATOR_DTYPES:
+            raise ValueError(f"Unsupported indicator dtype '{indicator_dtype}', expected one of {INDICATOR_DTYPES}")
+        if indicator_workers < 1:
+            raise ValueError(f"indicator_workers must be at least 1, got {indicator_workers}")
         self.data_source = data_source
         self.indicators = indicators
         self.visualizer = visualizer
         self.strategy = strategy
+        self.indicator_cache = indicator_cache
+        self.indicator_backend = indicator_backend
+        self.indicator_dtype = indicator_dtype
+        self.indicator_workers = indicator_workers
+        self.backtester = backtester
+        self.track_memory = track_memory
+        self.metrics_exporter = metrics_exporter
+        self.profiler = profiler
         self.logger = setup_logger(__name__)
 
+    @staticmethod
+    def _indicator_identity(indicator: Indicator) -> str:
+        """Identifies an indicator by its class and parameters.
+
+        Args:
+            indicator: The indicator.
+
+        Returns:
+            str: Equal for indicators that compute the same values.
+        """
+        cls = type(indicator)
+        return f"{cls.__module__}.{cls.__qualname__}|{indicator.params!r}"
+
+    def _indicator_cache_key(self, indicator: Indicator, fingerprint: str) -> str:
+        """Builds the content-addressed cache key of an indicator result.
+
+        The key includes the backend and dtype, whose results may differ in
+        the last bits.
+
+        Args:
+            indicator: The indicator.
+            fingerprint: Fingerprint of the input data.
+
+        Returns:
+            str: A filename-safe hex digest.
+        """
+        backend = f"{self.indicator_backend}:{self.indicator_dtype}"
+        key_string = f"{self._indicator_identity(indicator)}|{backend}|{fingerprint}"
+        return hashlib.md5(key_string.encode('utf-8')).hexdigest()
+
+    def _calculate_indicator(
+        self,
+        indicator: Indicator,
+        df: pd.DataFrame,
+        fingerprint: Optional[str],
+        evaluator: GraphEvaluator,
+    ) -> IndicatorOutput:
+        """Calculates one indicator.
+
+        With the pandas backend, indicators that declare a graph node are
+        evaluated through the shared evaluator, so intermediates common to
+        several indicators are computed once; others fall back to
+        `calculate`. The NumPy backend calls `calculate_numpy`. Results go
+        through the indicator cache when configured.
+        """
+        node = indicator.node()
+
+        def compute() -> IndicatorOutput:
+            if self.indicator_backend == "numpy":
+                return indicator.calculate_numpy(df, self.indicator_dtype)
+            if isinstance(node, Node):
+                return evaluator.evaluate(node)
+            return indicator.calculate(df)
+
+        if self.indicator_cache is None or fingerprint is None:
+            return compute()
+        key = self._indicator_cache_key(indicator, fingerprint)
+        return self.indicator_cache.get_or_compute(key, compute)
+
+    @staticmethod
+    def _store_result(results: Dict[str, pd.Series], name: str, result: IndicatorOutput) -> None:
+        """Adds an indicator result, unpacking multi-period grids into one entry per column."""
+        if isinstance(result, pd.DataFrame):
+            for column in result.columns:
+                results[column] = result[column]
+        else:
+            results[name] = result
+
+    def _calculate_indicators(
+        self,
+        df: pd.DataFrame,
+        fingerprint: Optional[str],
+        evaluator: GraphEvaluator,
+        recorder: MetricsRecorder,
+    ) -> Tuple[Dict[str, pd.Series], Dict[str, IndicatorOutput], Dict[str, float]]:
+        """Calculates all indicators, on a thread pool when `indicator_workers > 1`.
+
+        Duplicate indicators are calculated once. Results are collected in
+        configuration order, so `indicator_results` ordering and the
+        indicator reported on failure do not depend on scheduling.
+
+        Returns:
+            Tuple of the indicator results by name, the results by indicator
+            identity, and the calculation time in seconds per indicator name.
+
+        Raises:
+            IndicatorCalculationError: For the first indicator, in configuration
+                order, whose calculation fails.
+        """
+        distinct: Dict[str, Indicator] = {}
+        for indicator in self.indicators:
+            distinct.setdefault(self._indicator_identity(indicator), indicator)
+
+        def timed(indicator: Indicator) -> IndicatorOutput:
+            self.logger.info(f"Calculating {indicator.name}...")
+            with recorder.measure('indicators', indicator.name):
+                return self._calculate_indicator(indicator, df, fingerprint, evaluator)
+
+        pool = None
+        futures: Dict[str, Future] = {}
+        if self.indicator_workers > 1 and len(distinct) > 1:
+            pool = ThreadPoolExecutor(max_workers=min(self.indicator_workers, len(distinct)))
+            futures = {identity: pool.submit(timed, indicator) for identity, indicator in distinct.items()}
+
+        indicator_results: Dict[str, pd.Series] = {}
+        computed: Dict[str, IndicatorOutput] = {}
+        try:
+            for indicator in self.indicators:
+                identity = self._indicator_identity(indicator)
+                if identity in computed:
+                    self.logger.info(f"Reusing {indicator.name} (duplicate indicator)")
+                    self._store_result(indicator_results, indicator.name, computed[identity])
+                    continue
+                try:
+                    result = futures[identity].result() if pool else timed(indicator)
+                except Exception as e:
+                    self.logger.error(f"Error calculating {indicator.name}: {e}")
+                    raise IndicatorCalculationError(f"Failed to calculate {indicator.name}: {e}") from e
+                computed[identity] = result
+                self._store_result(indicator_results, indicator.name, result)
+        finally:
+            if pool:
+                pool.shutdown(wait=True, cancel_futures=True)
+        timings = {name: metrics['wall_seconds'] for name, metrics in recorder.groups['indicators'].items()}
+        return indicator_results, computed, timings
+
+    @contextmanager
+    def _stage(self, recorder: MetricsRecorder, name: str, cpu_clock: Callable[[], float] = time.thread_time) -> Iterator[None]:
+        """Measures a pipeline stage, and profiles it when a profiler is set."""
+        with recorder.measure('stages', name, cpu_clock):
+            if self.profiler is None:
+                yield
+            else:
+                with self.profiler.stage(name):
+                    yield
+
+    def analyze(self, df: pd.DataFrame, evaluator: Optional[GraphEvaluator] = None) -> AnalysisResult:
+        """Calculates indicators, generates signals and backtests them on given data.
+
+        This is `run` without fetching and rendering, so `data_source` and
+        `visualizer` are not used.
+
+        Args:
+            df: The market data.
+            evaluator: Graph evaluator over `df` to share graph nodes with
+                earlier analyses of the same data (optional). Its node counts
+                in the metadata are then cumulative.
+
+        Returns:
+            AnalysisResult: Indicators, signals, backtest and metadata. The
+            'metrics' entry holds the wall time, CPU time and (with
+            `track_memory`) peak memory delta per stage and per indicator.
+
+        Raises:
+            IndicatorCalculationError: If any indicator calculation fails
+            TradingEngineError: If the strategy fails
+            BacktestError: If the backtest fails
+        """
+        with MetricsRecorder(self.track_memory) as recorder:
+            result = self._analyze(df, evaluator, recorder)
+        result.metadata["metrics"] = recorder.as_dict()
+        return result
+
+    def _analyze(self, df: pd.DataFrame, evaluator: Optional[GraphEvaluator], recorder: MetricsRecorder) -> AnalysisResult:
+        """Runs the analysis stages, measuring each of them into `recorder`."""
+        # 1. Calculate Indicators
+        self.logger.info("Calculating indicators...")
+        fingerprint = frame_fingerprint(df) if self.indicator_cache is not None else None
+        if evaluator is None:
+            evaluator = GraphEvaluator(df)
+        # Indicators on several threads are charged to the process CPU clock.
+        cpu_clock = time.process_time if self.indicator_workers > 1 else time.thread_time
+        with self._stage(recorder, 'indicators', cpu_clock):
+            indicator_results, computed, timings = self._calculate_indicators(df, fingerprint, evaluator, recorder)
+        indicator_wall = recorder.groups['stages']['indicators']['wall_seconds']
+
+        # 2. Generate Signals
+        signals: Signals = []
+        if self.strategy:
+            self.logger.info(f"Executing strategy {self.strategy.name}...")
+            try:
+                with self._stage(recorder, 'strategy'):
+                    signals = self.strategy.generate_signals(df, indicator_results)
+                self.logger.info(f"Generated {len(signals)} signals.")
+            except Exception as e:
+                self.logger.error(f"Error executing strategy: {e}")
+                raise TradingEngineError(f"Failed to execute strategy: {e}") from e
+
+        # 3. Backtest Signals
+        backtest = None
+        if self.strategy and self.backtester:
+            self.logger.info("Backtesting signals...")
+            try:
+                with self._stage(recorder, 'backtest'):
+                    backtest = self.backtester.run(df, signals)
+            except Exception as e:
+                self.logger.error(f"Error running backtest: {e}")
+                raise BacktestError(f"Failed to run backtest: {e}") from e
+
+        metadata = {
+            "indicator_graph": {
+                "indicators": len(self.indicators),
+                "distinct_indicators": len(computed),
+                "nodes_requested": evaluator.requested,
+                "nodes_computed": evaluator.computed,
+            },
+        }
+        metadata["indicator_timing"] = {
+            "workers": self.indicator_workers,
+            "wall_seconds": indicator_wall,
+            # Sum of per-indicator latencies. With several workers these
+            # overlap (and include time waiting for the GIL or a shared
+            # graph node); compare wall_seconds across worker counts.
+            "total_seconds": sum(timings.values()),
+            "per_indicator": timings,
+        }
+        metadata["indicator_graph"]["backend"] = f"{self.indicator_backend}:{self.indicator_dtype}"
+        if self.indicator_cache is not None:
+            metadata["indicator_cache"] = self.indicator_cache.stats()
+        if backtest is not None:
+            metadata["backtest"] = backtest.stats
+
+        return AnalysisResult(
+            data=df,
+            indicators=indicator_results,
+            signals=signals,
+            backtest=backtest,
+            metadata=metadata
+        )
+
     def run(self, config: DataFetchConfig, output_path: str) -> AnalysisResult:
         """Execute the complete analysis pipeline.
         
@@ -30,63 +376,252 @@ class TradingEngine:
             output_path: Path to save visualization
             
         Returns:
-            AnalysisResult containing all data and metadata
+            AnalysisResult containing all data and metadata. The 'metrics'
+            entry covers the fetch, indicators, strategy, backtest and
+            render stages and every indicator.
             
         Raises:
             DataFetchError: If data fetching fails
             IndicatorCalculationError: If any indicator calculation fails
+            BacktestError: If the backtest fails
             VisualizationError: If rendering fails
         """
         self.logger.info(f"Starting analysis for {config.ticker}")
         
         try:
-            # 1. Fetch Data
-            self.logger.info("Fetching market data...")
-            df = self.data_source.fetch_data(config)
-            self.logger.info(f"Fetched {len(df)} rows of data.")
-
-            # 2. Calculate Indicators
-            self.logger.info("Calculating indicators...")
-            indicator_results = {}
-            for indicator in self.indicators:
-                self.logger.info(f"Calculating {indicator.name}...")
-                try:
-                    series = indicator.calculate(df)
-                    indicator_results[indicator.name] = series
-                except Exception as e:
-                    self.logger.error(f"Error calculating {indicator.name}: {e}")
-                    raise IndicatorCalculationError(f"Failed to calculate {indicator.name}: {e}") from e
+            with MetricsRecorder(self.track_memory) as recorder:
+                # 1. Fetch Data
+                self.logger.info("Fetching market data...")
+                with self._stage(recorder, 'fetch'):
+                    df = self.data_source.fetch_data(config)
+                self.logger.info(f"Fetched {len(df)} rows of data.")
+
+                # 2. Indicators, Signals and Backtest
+                result = self._analyze(df, None, recorder)
 
-            # 3. Generate Signals
-            signals = []
-            if self.strategy:
-                self.logger.info(f"Executing strategy {self.strategy.name}...")
+                # 3. Render Visualization
+                self.logger.info(f"Rendering visualization to {output_path}...")
                 try:
-                    signals = self.strategy.generate_signals(df, indicator_results)
-                    self.logger.info(f"Generated {len(signals)} signals.")
+                    with self._stage(recorder, 'render'):
+                        self.visualizer.render(df, result.indicators, result.signals, output_path)
                 except Exception as e:
-                    self.logger.error(f"Error executing strategy: {e}")
-                    raise TradingEngineError(f"Failed to execute strategy: {e}") from e
-
-            # 4. Render Visualization
-            self.logger.info(f"Rendering visualization to {output_path}...")
-            try:
-                self.visualizer.render(df, indicator_results, signals, output_path)
-            except Exception as e:
-                self.logger.error(f"Error rendering visualization: {e}")
-                raise VisualizationError(f"Failed to render visualization: {e}") from e
+                    self.logger.error(f"Error rendering visualization: {e}")
+                    raise VisualizationError(f"Failed to render visualization: {e}") from e
 
             self.logger.info("Analysis completed successfully.")
-            
-            return AnalysisResult(
-                data=df,
-                indicators=indicator_results,
-                signals=signals,
-                metadata={"ticker": config.ticker, "interval": config.interval}
-            )
+            result.metadata["metrics"] = recorder.as_dict()
+            self._add_run_metadata(config, result)
+            self._export_metrics(result)
+            return result
 
         except TradingEngineError:
             raise
         except Exception as e:
             self.logger.error(f"Unexpected error in trading engine: {e}")
             raise TradingEngineError(f"An unexpected error occurred: {e}") from e
+
+    def _add_run_metadata(self, config: DataFetchConfig, result: AnalysisResult) -> None:
+        """Prefixes the analysis metadata with the run's ticker, interval and data source statistics."""
+        result.metadata = {
+            "ticker": config.ticker,
+            "interval": config.interval,
+            "data_source": self.data_source.stats(),
+            **result.metadata,
+        }
+
+    def _export_metrics(self, result: AnalysisResult) -> None:
+        """Exports a run's metrics, if an exporter is configured. Export failures are logged, not raised."""
+        if self.metrics_exporter is None:
+            return
+        try:
+            self.metrics_exporter.export(result)
+        except Exception as e:
+            self.logger.error(f"Error exporting metrics: {e}")
+
+    def run_many(
+        self,
+        configs: Iterable[DataFetchConfig],
+        output_path: str = "results/outputs/{ticker}_{interval}.png",
+        fetch_workers: int = 4,
+        compute_workers: int = 1,
+        render_workers: int = 1,
+        queue_size: int = 2,
+        processes: bool = True,
+        return_exceptions: bool = False,
+    ) -> Iterator[AnalysisResult]:
+        """Runs the pipeline for many configurations, overlapping fetch, compute and render.
+
+        Each stage has its own pool: fetches run on threads, so network
+        waits overlap; analysis (indicators, strategy, backtest) and
+        rendering run on separate process pools, whose workers receive the
+        engine's components once, when they start. A stage only starts a
+        task when one of its workers is free and the queue in front of the
+        next stage has room for the result, so at most
+        `fetch_workers + compute_workers + render_workers + 2 * queue_size`
+        frames are held at a time. Configurations are read lazily, and
+        nothing new is started while the caller is not consuming results.
+
+        Args:
+            configs: The data fetch configurations; any iterable, consumed lazily.
+            output_path: Chart path, formatted with the configuration's
+                `ticker` and `interval`. Unused without a visualizer, in
+                which case nothing is rendered.
+            fetch_workers: Concurrent fetches.
+            compute_workers: Analysis worker processes.
+            render_workers: Rendering worker processes.
+            queue_size: Results that may wait between two stages.
+            processes: Run analysis and rendering on process pools. If False,
+                they run on threads of this process (rendering on one
+                thread, as matplotlib's pyplot is not thread-safe) and the
+                components need not be picklable.
+            return_exceptions: Yield the error of a failed configuration in
+                place of its result, instead of raising it.
+
+        Yields:
+            AnalysisResult: One per configuration, in completion order. Its
+            metadata starts with the ticker and interval and has the stage
+            metrics, as in `run`; stage times are measured in the worker
+            that ran the stage and exclude time spent queued.
+
+        Raises:
+            ValueError: If a worker count or `queue_size` is not positive.
+            TradingEngineError: For the first failed configuration, unless
+                `return_exceptions` is set. Its message starts with the ticker.
+        """
+        for name, value in (('fetch_workers', fetch_workers), ('compute_workers', compute_workers),
+                            ('render_workers', render_workers), ('queue_size', queue_size)):
+            if value < 1:
+                raise ValueError(f"{name} must be at least 1, got {value}")
+        render = self.visualizer is not None
+        if not processes:
+            render_workers = 1
+
+        with ExitStack() as stack:
+            # Keeps memory tracing on across the stages' threads for the whole run.
+            stack.enter_context(MetricsRecorder(self.track_memory))
+            fetch_pool = stack.enter_context(ThreadPoolExecutor(max_workers=fetch_workers))
+            compute_pool, compute_engine = self._pipeline_pool(stack, processes, compute_workers, 'engine')
+            render_pool, visualizer = (
+                self._pipeline_pool(stack, processes, render_workers, 'visualizer') if render else (None, None)
+            )
+            # Cancel queued tasks when the caller stops early or a failure is raised.
+            for pool in (fetch_pool, compute_pool, render_pool):
+                if pool is not None:
+                    stack.callback(pool.shutdown, wait=True, cancel_futures=True)
+
+            pending = iter(configs)
+            exhausted = False
+            fetching: Dict[Future, DataFetchConfig] = {}
+            computing: Dict[Future, Tuple[DataFetchConfig, pd.DataFrame, Metrics]] = {}
+            rendering: Dict[Future, Tuple[DataFetchConfig, AnalysisResult]] = {}
+            fetched: Deque[Tuple[DataFetchConfig, pd.DataFrame, Metrics]] = deque()
+            computed: Deque[Tuple[DataFetchConfig, AnalysisResult]] = deque()
+            finished: Deque[Union[AnalysisResult, TradingEngineError]] = deque()
+            started = time.perf_counter()
+            completed = 0
+
+            while True:
+                # Start downstream stages first, so their queues drain before upstream refills them.
+                while render and computed and len(rendering) < render_workers:
+                    config, result = computed.popleft()
+                    path = output_path.format(ticker=config.ticker, interval=config.interval)
+                    future = render_pool.submit(_render_stage, visualizer, result, path, self.track_memory)
+                    rendering[future] = (config, result)
+                while fetched and self._has_room(computing, computed, compute_workers, queue_size):
+                    config, df, fetch_metrics = fetched.popleft()
+                    computing[compute_pool.submit(_compute_stage, compute_engine, df)] = (config, df, fetch_metrics)
+                while not exhausted and self._has_room(fetching, fetched, fetch_workers, queue_size):
+                    config = next(pending, None)
+                    if config is None:
+                        exhausted = True
+                        break
+                    fetching[fetch_pool.submit(_fetch_stage, self.data_source, config, self.track_memory)] = config
+
+                while finished:
+                    item = finished.popleft()
+                    completed += 1
+                    if isinstance(item, TradingEngineError):
+                        if not return_exceptions:
+                            raise item
+                    else:
+                        self._export_metrics(item)
+                    yield item
+
+                in_flight = [*fetching, *computing, *rendering]
+                if not in_flight:
+                    # Queued items are started on the next pass; otherwise everything is done.
+                    if exhausted and not fetched and not computed:
+                        break
+                    continue
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    if future in fetching:
+                        config = fetching.pop(future)
+                        if self._collect(future, config, finished, "fetch"):
+                            df, fetch_metrics = future.result()
+                            self.logger.info(f"Fetched {len(df)} rows for {config.ticker}.")
+                            fetched.append((config, df, fetch_metrics))
+                    elif future in computing:
+                        config, df, fetch_metrics = computing.pop(future)
+                        if self._collect(future, config, finished, "analysis"):
+                            result = future.result()
+                            if result.data is None:
+                                result.data = df
+                            metrics = result.metadata["metrics"]
+                            metrics["stages"] = {"fetch": fetch_metrics, **metrics["stages"]}
+                            self._add_run_metadata(config, result)
+                            if render:
+                                computed.append((config, result))
+                            else:
+                                finished.append(result)
+                    else:
+                        config, result = rendering.pop(future)
+                        if self._collect(future, config, finished, "rendering"):
+                            result.metadata["metrics"]["stages"]["render"] = future.result()
+                            finished.append(result)
+
+            elapsed = time.perf_counter() - started
+            self.logger.info(f"Pipelined {completed} runs in {elapsed:.2f}s ({completed / elapsed:.1f} runs/s)")
+
+    def _pipeline_pool(self, stack: ExitStack, processes: bool, workers: int, name: str) -> Tuple[Executor, Any]:
+        """Creates a compute or render pool for `run_many`.
+
+        Returns:
+            Tuple of the pool and the component to pass to its tasks: None
+            for a process pool, whose workers receive the component once in
+            their initializer, or the component itself for a thread pool.
+        """
+        if name == 'engine':
+            # Workers analyze only, so they get the engine without its I/O components.
+            component = copy.copy(self)
+            component.data_source = component.visualizer = component.profiler = None
+        else:
+            component = self.visualizer
+        if not processes:
+            return stack.enter_context(ThreadPoolExecutor(max_workers=workers)), component
+        pool = ProcessPoolExecutor(max_workers=workers, initializer=_init_pipeline_worker, initargs=(name, component))
+        return stack.enter_context(pool), None
+
+    @staticmethod
+    def _has_room(in_flight: Dict[Future, Any], queue: Deque, workers: int, queue_size: int) -> bool:
+        """Whether a stage may start a task: a worker is free and its output queue can take the result."""
+        return len(in_flight) < workers and len(in_flight) + len(queue) < workers + queue_size
+
+    def _collect(self, future: Future, config: DataFetchConfig, finished: Deque, stage: str) -> bool:
+        """Checks a finished pipeline task, queueing its error as the configuration's outcome.
+
+        Returns:
+            bool: True if the task succeeded.
+        """
+        error = future.exception()
+        if error is None:
+            return True
+        self.logger.error(f"Error in {stage} for {config.ticker}: {error}")
+        cls = type(error) if isinstance(error, TradingEngineError) else TradingEngineError
+        try:
+            wrapped = cls(f"{config.ticker}: {error}")
+        except Exception:
+            wrapped = TradingEngineError(f"{config.ticker}: {error}")
+        wrapped.__cause__ = error
+        finished.append(wrapped)
+        return False
@@ -1,3 +1,4 @@
 """Indicators package - imports trigger decorator registration."""
 from .moving_averages import *
 from .oscillators import *
+from .volatility import *
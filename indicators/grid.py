@@ -0,0 +1,124 @@
+from typing import Callable, List, Literal, Sequence, Type
+import numpy as np
+import pandas as pd
+from core.abstractions import Indicator
+from core.exceptions import IndicatorCalculationError
+from utils.logging import setup_logger
+
+logger = setup_logger(__name__)
+
+Kernel = Callable[[np.ndarray, Sequence[int]], np.ndarray]
+
+
+def kernel_frame(df: pd.DataFrame, periods: Sequence[int], kernel: Kernel, prefix: str) -> pd.DataFrame:
+    """Runs a multi-period kernel over the Close column.
+
+    Args:
+        df: The market data.
+        periods: The periods to compute.
+        kernel: A function from `indicators.kernels`.
+        prefix: Indicator name prefix; columns are named `<prefix>_<period>`.
+
+    Returns:
+        pd.DataFrame: One column per period, indexed like `df`.
+
+    Raises:
+        IndicatorCalculationError: If the Close column is missing or the periods are invalid.
+    """
+    if 'Close' not in df.columns:
+        raise IndicatorCalculationError(f"{prefix}: 'Close' column missing")
+    try:
+        values = kernel(df['Close'].to_numpy(dtype='float64'), periods)
+    except ValueError as e:
+        raise IndicatorCalculationError(f"{prefix} grid calculation failed: {e}") from e
+    return pd.DataFrame(values, index=df.index, columns=[f"{prefix}_{p}" for p in periods])
+
+
+def kernel_series(df: pd.DataFrame, period: int, kernel: Kernel, name: str, dtype: str = "float64") -> pd.Series:
+    """Runs a kernel for one period over the Close column.
+
+    The Close column is converted to a contiguous array once and the result
+    is wrapped into a Series only at the end.
+
+    Args:
+        df: The market data.
+        period: The indicator period.
+        kernel: A function from `indicators.kernels`.
+        name: Indicator name, for error messages.
+        dtype: Working array dtype, 'float64' or 'float32'.
+
+    Returns:
+        pd.Series: The indicator values, indexed and named like the Close column.
+
+    Raises:
+        IndicatorCalculationError: If the Close column is missing or the period is invalid.
+    """
+    if 'Close' not in df.columns:
+        raise IndicatorCalculationError(f"{name}: 'Close' column missing")
+    close = df['Close']
+    try:
+        values = kernel(np.ascontiguousarray(close.to_numpy(dtype=dtype)), [period])
+    except ValueError as e:
+        raise IndicatorCalculationError(f"{name} calculation failed: {e}") from e
+    return pd.Series(values[:, 0], index=df.index, name=close.name)
+
+
+def column_values(df: pd.DataFrame, columns: Sequence[str], name: str) -> List[np.ndarray]:
+    """Returns columns of the market data as contiguous float64 arrays.
+
+    Args:
+        df: The market data.
+        columns: The required column names.
+        name: Indicator name, for error messages.
+
+    Returns:
+        List[np.ndarray]: One array per column, in the requested order.
+
+    Raises:
+        IndicatorCalculationError: If a column is missing.
+    """
+    missing = [c for c in columns if c not in df.columns]
+    if missing:
+        raise IndicatorCalculationError(f"{name}: {', '.join(repr(c) for c in missing)} column(s) missing")
+    return [np.ascontiguousarray(df[c].to_numpy(dtype='float64')) for c in columns]
+
+
+class IndicatorGrid(Indicator):
+    """One indicator evaluated for several periods in a single call.
+
+    Created by the factory for indicator configs with a `periods` list.
+    `calculate` returns a DataFrame with one column per period, named like
+    the corresponding single-period indicator (e.g. `SMA_20`), which the
+    engine unpacks into individual indicator results.
+    """
+
+    def __init__(self, indicator_cls: Type[Indicator], periods: Sequence[int]):
+        """Initializes the grid.
+
+        Args:
+            indicator_cls: The indicator class; must accept a `period` argument.
+            periods: The periods to compute.
+
+        Raises:
+            ValueError: If no periods are given.
+        """
+        if not periods:
+            raise ValueError("IndicatorGrid requires at least one period")
+        self.indicator_cls = indicator_cls
+        self.periods: List[int] = list(periods)
+        first = indicator_cls(period=self.periods[0])  # type: ignore[call-arg]
+        last = indicator_cls(period=self.periods[-1])  # type: ignore[call-arg]
+        self._name = first.name if len(self.periods) == 1 else f"{first.name}..{last.name}"
+        self._type = first.type
+        logger.debug(f"Initialized {self.name} with {len(self.periods)} periods")
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+    @property
+    def type(self) -> Literal["overlay", "oscillator"]:
+        return self._type
+
+    def calculate(self, df: pd.DataFrame) -> pd.DataFrame:  # type: ignore[override]
+        return self.indicator_cls.calculate_grid(df, self.periods)
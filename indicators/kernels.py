@@ -0,0 +1,197 @@
+"""NumPy kernels computing an indicator for many periods in one pass.
+
+Each kernel takes a 1D array and a list of periods and returns a 2D array
+of shape (len(values), len(periods)), column `j` holding the indicator for
+`periods[j]`. Results match the pandas implementations of the
+single-period indicators, including their NaN handling.
+
+Kernels compute in float64 unless given a float32 array, in which case
+inputs, outputs and per-step arithmetic stay float32; cumulative sums are
+always accumulated in float64 since their rounding error grows with the
+series length.
+"""
+from functools import lru_cache
+from typing import Sequence, Tuple
+import numpy as np
+
+# Time steps per block in the blocked EWM recurrence: larger blocks mean
+# fewer sequential carry steps but O(spans * block^2) more flops.
+_EWM_BLOCK = 64
+
+
+def _as_values(values: Sequence[float]) -> np.ndarray:
+    """Returns the values as a contiguous 1D float32 or float64 array."""
+    x = np.asarray(values)
+    x = np.ascontiguousarray(x, dtype=np.float32 if x.dtype == np.float32 else np.float64)
+    if x.ndim != 1:
+        raise ValueError("Kernel input must be one-dimensional")
+    return x
+
+
+def _as_periods(periods: Sequence[int]) -> np.ndarray:
+    """Validates periods and returns them as an int64 array."""
+    p = np.asarray(periods, dtype=np.int64)
+    if p.ndim != 1 or len(p) == 0:
+        raise ValueError("At least one period is required")
+    if (p < 1).any():
+        raise ValueError(f"Periods must be positive, got {list(periods)}")
+    return p
+
+
+def rolling_mean_grid(values: Sequence[float], windows: Sequence[int]) -> np.ndarray:
+    """Rolling means for several window lengths off one cumulative sum.
+
+    Matches `Series.rolling(window).mean()`: NaN until the window is full and
+    while the window holds a NaN.
+
+    Args:
+        values: The input series.
+        windows: The window lengths.
+
+    Returns:
+        np.ndarray: Array of shape (len(values), len(windows)).
+    """
+    x = _as_values(values)
+    w = _as_periods(windows)
+    missing = np.isnan(x)
+    sums = np.concatenate(([0.0], np.cumsum(np.where(missing, 0.0, x), dtype=np.float64)))
+    nans = np.concatenate(([0], np.cumsum(missing)))
+
+    # One period at a time off the shared sums: temporaries stay O(n)
+    # instead of O(n * len(windows)) index arrays and masks.
+    out = np.full((len(x), len(w)), np.nan, dtype=x.dtype)
+    for j, window in enumerate(w.tolist()):
+        if window > len(x):
+            continue
+        mean = (sums[window:] - sums[:-window]) / window
+        mean[nans[window:] - nans[:-window] > 0] = np.nan
+        out[window - 1:, j] = mean
+    return out
+
+
+@lru_cache(maxsize=64)
+def _ewm_block_weights(alphas: Tuple[float, ...], dtype: str) -> Tuple[np.ndarray, np.ndarray]:
+    """Returns the in-block weights and carry factors for the given smoothing factors.
+
+    Cached because the same spans are typically evaluated over many series.
+    """
+    alpha = np.array(alphas, dtype=dtype)
+    decay = 1 - alpha
+    k = np.arange(_EWM_BLOCK)
+    lag = k[None, :] - k[:, None]
+    powers = decay[None, :] ** k[:, None]
+    # weights[j, k, p]: weight of the block's j-th input in its k-th output.
+    weights = (powers * alpha[None, :])[np.maximum(lag, 0)]
+    weights[lag < 0] = 0
+    weights = weights.reshape(_EWM_BLOCK, _EWM_BLOCK * len(alpha))
+    carry = powers * decay[None, :]
+    weights.flags.writeable = False
+    carry.flags.writeable = False
+    return weights, carry
+
+
+def _ewm_blocked(x: np.ndarray, alpha: np.ndarray) -> np.ndarray:
+    """EWM recurrence over gap-free data, solved in blocks of `_EWM_BLOCK` steps.
+
+    Within a block starting at `s`, `y[s+k] = d^(k+1) y[s-1] + sum_j a d^(k-j) x[s+j]`
+    with `d = 1 - a`. The sums for every block and span come out of a single
+    matrix product; only the carries `y[s-1]` need a short sequential scan
+    over blocks.
+    """
+    n, spans = len(x), len(alpha)
+    weights, carry = _ewm_block_weights(tuple(alpha.tolist()), x.dtype.str)
+
+    rest = x[1:]
+    blocks = -(-len(rest) // _EWM_BLOCK)
+    padded = np.zeros(blocks * _EWM_BLOCK, dtype=x.dtype)
+    padded[:len(rest)] = rest
+    y = padded.reshape(blocks, _EWM_BLOCK) @ weights
+    y = y.reshape(blocks, _EWM_BLOCK, spans)
+
+    # prev[b] is the mean just before block b starts.
+    prev = np.empty((blocks, spans), dtype=x.dtype)
+    last = np.full(spans, x[0])
+    for b in range(blocks):
+        prev[b] = last
+        last = y[b, -1] + carry[-1] * last
+    y += carry[None, :, :] * prev[:, None, :]
+
+    out = np.empty((n, spans), dtype=x.dtype)
+    out[0] = x[0]
+    out[1:] = y.reshape(blocks * _EWM_BLOCK, spans)[:len(rest)]
+    return out
+
+
+def _ewm_stepwise(x: np.ndarray, alpha: np.ndarray) -> np.ndarray:
+    """EWM recurrence one step at a time, vectorized across spans.
+
+    Mirrors pandas' handling of missing values (`ignore_na=False`): a NaN
+    repeats the previous output and decays the old mean's weight.
+    """
+    out = np.empty((len(x), len(alpha)), dtype=x.dtype)
+    weighted = np.full(len(alpha), x[0])
+    old_weight = np.ones(len(alpha), dtype=x.dtype)
+    decay = 1 - alpha
+    out[0] = weighted
+    for t in range(1, len(x)):
+        old_weight *= decay
+        value = x[t]
+        if not np.isnan(value):
+            weighted = (old_weight * weighted + alpha * value) / (old_weight + alpha)
+            old_weight[:] = 1.0
+        out[t] = weighted
+    return out
+
+
+def ewm_mean_grid(values: Sequence[float], spans: Sequence[int]) -> np.ndarray:
+    """Exponentially weighted means for several spans in one pass over time.
+
+    Matches `Series.ewm(span=span, adjust=False).mean()`.
+
+    Args:
+        values: The input series.
+        spans: The EWM spans.
+
+    Returns:
+        np.ndarray: Array of shape (len(values), len(spans)).
+    """
+    x = _as_values(values)
+    alpha = (2.0 / (_as_periods(spans) + 1.0)).astype(x.dtype)
+    out = np.full((len(x), len(alpha)), np.nan, dtype=x.dtype)
+    observed = np.flatnonzero(~np.isnan(x))
+    if len(observed) == 0:
+        return out
+    # Output is NaN up to the first observation, which seeds the mean.
+    first = observed[0]
+    tail = x[first:]
+    if np.isnan(tail).any():
+        out[first:] = _ewm_stepwise(tail, alpha)
+    else:
+        out[first:] = _ewm_blocked(tail, alpha)
+    return out
+
+
+def rsi_grid(values: Sequence[float], periods: Sequence[int]) -> np.ndarray:
+    """Relative strength index for several periods sharing one gain/loss pass.
+
+    Matches `RelativeStrengthIndex.calculate`: simple rolling means of gains
+    and losses, with NaN differences counted as neither.
+
+    Args:
+        values: The close prices.
+        periods: The RSI periods.
+
+    Returns:
+        np.ndarray: Array of shape (len(values), len(periods)).
+    """
+    x = _as_values(values)
+    delta = np.empty_like(x)
+    delta[:1] = np.nan
+    delta[1:] = np.diff(x)
+    with np.errstate(invalid='ignore'):
+        gain = np.where(delta > 0, delta, 0).astype(x.dtype, copy=False)
+        loss = np.where(delta < 0, -delta, 0).astype(x.dtype, copy=False)
+    avg_gain = rolling_mean_grid(gain, periods)
+    avg_loss = rolling_mean_grid(loss, periods)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return 100 - (100 / (1 + avg_gain / avg_loss))
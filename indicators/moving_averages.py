@@ -1,20 +1,25 @@
 import pandas as pd
-from core.abstractions import Indicator
+from core.abstractions import Indicator, StreamingIndicator
 from core.exceptions import IndicatorCalculationError
+from core import graph
 from utils.decorators import register_indicator
 from utils.logging import setup_logger
-from typing import Literal
+from indicators.streaming import RollingMeanState, EwmState, close_values, bar_close
+from indicators.grid import kernel_frame, kernel_series
+from indicators import kernels
+from typing import Literal, Mapping, Optional, Sequence
 
 logger = setup_logger(__name__)
 
 @register_indicator("SMA")
-class SimpleMovingAverage(Indicator):
+class SimpleMovingAverage(Indicator, StreamingIndicator):
     """Simple Moving Average indicator."""
 
     def __init__(self, period: int = 20):
         self.period = period
         self._name = f"SMA_{period}"
         self._type: Literal["overlay", "oscillator"] = "overlay"
+        self._state: Optional[RollingMeanState] = None
         logger.debug(f"Initialized {self.name}")
 
     @property
@@ -33,14 +38,36 @@ class SimpleMovingAverage(Indicator):
         except Exception as e:
             raise IndicatorCalculationError(f"{self.name} calculation failed: {e}") from e
 
+    def calculate_numpy(self, df: pd.DataFrame, dtype: str = "float64") -> pd.Series:
+        return kernel_series(df, self.period, kernels.rolling_mean_grid, self.name, dtype)
+
+    @classmethod
+    def calculate_grid(cls, df: pd.DataFrame, periods: Sequence[int]) -> pd.DataFrame:
+        return kernel_frame(df, periods, kernels.rolling_mean_grid, "SMA")
+
+    def node(self) -> graph.Node:
+        return graph.rolling_mean(graph.column('Close'), self.period)
+
+    def init_state(self, history: pd.DataFrame) -> None:
+        # Only the last `period` closes affect future values.
+        closes = close_values(history, self.name)
+        self._state = RollingMeanState(self.period)
+        self._state.extend(closes.iloc[-self.period:].tolist())
+
+    def update(self, bar: Mapping[str, float]) -> float:
+        if self._state is None:
+            self._state = RollingMeanState(self.period)
+        return self._state.push(bar_close(bar, self.name))
+
 @register_indicator("EMA")
-class ExponentialMovingAverage(Indicator):
+class ExponentialMovingAverage(Indicator, StreamingIndicator):
     """Exponential Moving Average indicator."""
 
     def __init__(self, period: int = 20):
         self.period = period
         self._name = f"EMA_{period}"
         self._type: Literal["overlay", "oscillator"] = "overlay"
+        self._state: Optional[EwmState] = None
         logger.debug(f"Initialized {self.name}")
 
     @property
@@ -58,3 +85,32 @@ class ExponentialMovingAverage(Indicator):
             return df['Close'].ewm(span=self.period, adjust=False).mean()
         except Exception as e:
             raise IndicatorCalculationError(f"{self.name} calculation failed: {e}") from e
+
+    def calculate_numpy(self, df: pd.DataFrame, dtype: str = "float64") -> pd.Series:
+        return kernel_series(df, self.period, kernels.ewm_mean_grid, self.name, dtype)
+
+    @classmethod
+    def calculate_grid(cls, df: pd.DataFrame, periods: Sequence[int]) -> pd.DataFrame:
+        return kernel_frame(df, periods, kernels.ewm_mean_grid, "EMA")
+
+    def node(self) -> graph.Node:
+        return graph.ewm_mean(graph.column('Close'), self.period)
+
+    def init_state(self, history: pd.DataFrame) -> None:
+        # The recurrence only needs the last mean and how many NaNs followed
+        # the last observation, which decay the old mean's weight.
+        closes = close_values(history, self.name)
+        self._state = EwmState(self.period)
+        if closes.empty:
+            return
+        observed = closes.notna().to_numpy()
+        if not observed.any():
+            return
+        trailing_nans = len(observed) - 1 - int(observed.nonzero()[0][-1])
+        self._state.weighted = float(self.calculate(history).iloc[-1])
+        self._state.old_weight = (1.0 - self._state.alpha) ** trailing_nans
+
+    def update(self, bar: Mapping[str, float]) -> float:
+        if self._state is None:
+            self._state = EwmState(self.period)
+        return self._state.push(bar_close(bar, self.name))
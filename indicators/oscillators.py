@@ -1,20 +1,29 @@
+import math
 import pandas as pd
-from core.abstractions import Indicator
+from core.abstractions import Indicator, StreamingIndicator
 from core.exceptions import IndicatorCalculationError
+from core import graph
 from utils.decorators import register_indicator
 from utils.logging import setup_logger
-from typing import Literal
+from indicators.streaming import RollingMeanState, close_values, bar_close
+from indicators.grid import kernel_frame, kernel_series, column_values
+from indicators import kernels, rolling
+import numpy as np
+from typing import Literal, Mapping, Optional, Sequence
 
 logger = setup_logger(__name__)
 
 @register_indicator("RSI")
-class RelativeStrengthIndex(Indicator):
+class RelativeStrengthIndex(Indicator, StreamingIndicator):
     """Relative Strength Index indicator."""
 
     def __init__(self, period: int = 14):
         self.period = period
         self._name = f"RSI_{period}"
         self._type: Literal["overlay", "oscillator"] = "oscillator"
+        self._gains: Optional[RollingMeanState] = None
+        self._losses: Optional[RollingMeanState] = None
+        self._prev_close = math.nan
         logger.debug(f"Initialized {self.name}")
 
     @property
@@ -39,3 +48,82 @@ class RelativeStrengthIndex(Indicator):
             return rsi
         except Exception as e:
             raise IndicatorCalculationError(f"{self.name} calculation failed: {e}") from e
+
+    def calculate_numpy(self, df: pd.DataFrame, dtype: str = "float64") -> pd.Series:
+        return kernel_series(df, self.period, kernels.rsi_grid, self.name, dtype)
+
+    @classmethod
+    def calculate_grid(cls, df: pd.DataFrame, periods: Sequence[int]) -> pd.DataFrame:
+        return kernel_frame(df, periods, kernels.rsi_grid, "RSI")
+
+    def node(self) -> graph.Node:
+        delta = graph.diff(graph.column('Close'))
+        return graph.rsi(
+            graph.rolling_mean(graph.gain(delta), self.period),
+            graph.rolling_mean(graph.loss(delta), self.period),
+        )
+
+    def init_state(self, history: pd.DataFrame) -> None:
+        # The last `period` deltas need the last `period + 1` closes.
+        closes = close_values(history, self.name)
+        self._gains = RollingMeanState(self.period)
+        self._losses = RollingMeanState(self.period)
+        self._prev_close = math.nan
+        for close in closes.iloc[-(self.period + 1):].tolist():
+            self._push(close)
+
+    def update(self, bar: Mapping[str, float]) -> float:
+        if self._gains is None:
+            self._gains = RollingMeanState(self.period)
+            self._losses = RollingMeanState(self.period)
+        return self._push(bar_close(bar, self.name))
+
+    def _push(self, close: float) -> float:
+        """Advances the gain/loss windows by one close and returns the RSI."""
+        delta = close - self._prev_close
+        self._prev_close = close
+        # Matches calculate(): NaN deltas count as neither gain nor loss.
+        avg_gain = self._gains.push(delta if delta > 0 else 0.0)  # type: ignore[union-attr]
+        avg_loss = self._losses.push(-delta if delta < 0 else 0.0)  # type: ignore[union-attr]
+        if math.isnan(avg_gain) or math.isnan(avg_loss):
+            return math.nan
+        if avg_loss == 0:
+            return 100.0 if avg_gain > 0 else math.nan
+        return 100 - (100 / (1 + avg_gain / avg_loss))
+
+@register_indicator("STOCH")
+class StochasticOscillator(Indicator):
+    """Stochastic Oscillator.
+
+    %K is the close's position within the high-low range of the last
+    `period` bars, in percent; %D is its `d_period` simple moving average.
+    `calculate` returns a DataFrame with `<name>_k` and `<name>_d` columns.
+    """
+
+    def __init__(self, period: int = 14, d_period: int = 3):
+        self.period = period
+        self.d_period = d_period
+        self._name = f"STOCH_{period}"
+        self._type: Literal["overlay", "oscillator"] = "oscillator"
+        logger.debug(f"Initialized {self.name}")
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+    @property
+    def type(self) -> Literal["overlay", "oscillator"]:
+        return self._type
+
+    def calculate(self, df: pd.DataFrame) -> pd.DataFrame:  # type: ignore[override]
+        try:
+            high, low, close = column_values(df, ['High', 'Low', 'Close'], self.name)
+            highest = rolling.rolling_max(high, self.period)
+            lowest = rolling.rolling_min(low, self.period)
+            # A flat range (0 / 0) is undefined, as in pandas.
+            with np.errstate(divide='ignore', invalid='ignore'):
+                k = 100 * (close - lowest) / (highest - lowest)
+            d = kernels.rolling_mean_grid(k, [self.d_period])[:, 0]
+            return pd.DataFrame({f"{self.name}_k": k, f"{self.name}_d": d}, index=df.index)
+        except Exception as e:
+            raise IndicatorCalculationError(f"{self.name} calculation failed: {e}") from e
@@ -0,0 +1,153 @@
+"""Linear-time rolling-window kernels shared by the channel and volatility indicators.
+
+Every kernel costs O(n) in the series length regardless of the window
+length and matches the corresponding pandas `rolling(window)` call with the
+default `min_periods`: the output is NaN until the window is full and while
+the window holds a NaN.
+"""
+from typing import Sequence, Tuple
+import numpy as np
+
+def _as_values(values: Sequence[float]) -> np.ndarray:
+    """Returns the values as a contiguous 1D float64 array."""
+    x = np.ascontiguousarray(values, dtype=np.float64)
+    if x.ndim != 1:
+        raise ValueError("Kernel input must be one-dimensional")
+    return x
+
+
+def _check_window(window: int) -> None:
+    """Raises ValueError for non-positive windows."""
+    if window < 1:
+        raise ValueError(f"Window must be positive, got {window}")
+
+
+def _rolling_extreme(values: Sequence[float], window: int, op: np.ufunc, identity: float) -> np.ndarray:
+    """Rolling max or min using the van Herk/Gil-Werman block decomposition.
+
+    The series is cut into blocks of `window` values. Every window spans the
+    tail of one block and the head of the next, so its extreme is `op` of a
+    suffix accumulation and a prefix accumulation: three vectorized passes in
+    total. This is the array form of the monotonic-deque algorithm, with the
+    same O(n) bound but no per-element Python loop.
+    """
+    x = _as_values(values)
+    _check_window(window)
+    n = len(x)
+    out = np.full(n, np.nan)
+    if n < window:
+        return out
+    # Padding with the identity leaves the accumulations of real values unchanged.
+    padded = np.concatenate((x, np.full(-n % window, identity))).reshape(-1, window)
+    prefix = op.accumulate(padded, axis=1).ravel()
+    suffix = op.accumulate(padded[:, ::-1], axis=1)[:, ::-1].ravel()
+    # NaN propagates through op, so any NaN in a window yields NaN as in pandas.
+    out[window - 1:] = op(suffix[:n - window + 1], prefix[window - 1:n])
+    return out
+
+
+def rolling_max(values: Sequence[float], window: int) -> np.ndarray:
+    """Rolling maximum, matching `Series.rolling(window).max()`."""
+    return _rolling_extreme(values, window, np.maximum, -np.inf)
+
+
+def rolling_min(values: Sequence[float], window: int) -> np.ndarray:
+    """Rolling minimum, matching `Series.rolling(window).min()`."""
+    return _rolling_extreme(values, window, np.minimum, np.inf)
+
+
+def _block_moments(blocks: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Running means and sums of squared deviations along each row.
+
+    Rows are shifted by their own mean before accumulating, so the
+    cancellation in `M2 = sum(d^2) - sum(d)^2 / k` is bounded by the spread
+    inside one block rather than by the level of the series. NaN propagates
+    to every later position of its row.
+    """
+    observed = ~np.isnan(blocks)
+    if observed.all():
+        centers = blocks.mean(axis=1, keepdims=True)
+    else:
+        counts = observed.sum(axis=1, keepdims=True)
+        centers = np.where(observed, blocks, 0.0).sum(axis=1, keepdims=True) / np.maximum(counts, 1)
+    d = blocks - centers
+    inv_k = 1.0 / np.arange(1, blocks.shape[1] + 1)
+    s = np.cumsum(d, axis=1)
+    m2 = np.cumsum(np.square(d, out=d), axis=1)
+    s *= inv_k
+    # M2 = sum(d^2) - k * mean(d)^2, with s now holding mean(d).
+    m2 -= np.square(s) * np.arange(1, blocks.shape[1] + 1)
+    np.maximum(m2, 0.0, out=m2)
+    s += centers
+    return s, m2
+
+
+def rolling_var(values: Sequence[float], window: int, ddof: int = 1) -> np.ndarray:
+    """Rolling variance, matching `Series.rolling(window).var(ddof=ddof)`.
+
+    Uses the same block decomposition as `rolling_max`: each window is the
+    suffix of one block plus the prefix of the next, and the running mean
+    and M2 of both parts are combined with the parallel (Chan et al.) form
+    of Welford's update, `M2 = M2_a + M2_b + delta^2 * n_a * n_b / n`.
+
+    Args:
+        values: The input series.
+        window: The window length.
+        ddof: Delta degrees of freedom; 1 for the sample variance, 0 for population.
+
+    Returns:
+        np.ndarray: The rolling variance, NaN where undefined.
+    """
+    x = _as_values(values)
+    _check_window(window)
+    n = len(x)
+    out = np.full(n, np.nan)
+    if n < window or window <= ddof:
+        return out
+    if window == 1:
+        # A single value has zero spread; skip the update and its rounding.
+        out[~np.isnan(x)] = 0.0
+        return out
+
+    # Padding never falls inside a complete window, so its value is irrelevant.
+    blocks = np.concatenate((x, np.zeros(-n % window))).reshape(-1, window)
+    prefix_mean, prefix_m2 = (a.ravel() for a in _block_moments(blocks))
+    suffix_mean, suffix_m2 = (a[:, ::-1].ravel() for a in _block_moments(blocks[:, ::-1]))
+
+    # Window i covers suffix position i (n_a values) and prefix position i + window - 1.
+    count = n - window + 1
+    n_a = np.tile(np.arange(window, 0, -1, dtype=np.float64), len(blocks))[:count]
+    n_b = window - n_a
+    a_mean, a_m2 = suffix_mean[:count], suffix_m2[:count]
+    # Windows aligned with a block are covered by the suffix alone, for which n_b = 0.
+    delta = prefix_mean[window - 1:n] - a_mean
+    m2 = a_m2 + np.where(n_b > 0, prefix_m2[window - 1:n], 0.0) + np.square(delta) * (n_a * n_b / window)
+    out[window - 1:] = m2 / (window - ddof)
+    return out
+
+
+def rolling_std(values: Sequence[float], window: int, ddof: int = 1) -> np.ndarray:
+    """Rolling standard deviation, matching `Series.rolling(window).std(ddof=ddof)`."""
+    return np.sqrt(rolling_var(values, window, ddof))
+
+
+def true_range(high: Sequence[float], low: Sequence[float], close: Sequence[float]) -> np.ndarray:
+    """True range: the largest of high - low, |high - previous close| and |low - previous close|.
+
+    The first bar has no previous close, so its true range is high - low.
+
+    Args:
+        high: High prices.
+        low: Low prices.
+        close: Close prices.
+
+    Returns:
+        np.ndarray: The true range of each bar.
+    """
+    h, l, c = _as_values(high), _as_values(low), _as_values(close)
+    prev_close = np.empty_like(c)
+    prev_close[:1] = np.nan
+    prev_close[1:] = c[:-1]
+    # fmax skips NaN like DataFrame.max(axis=1) does.
+    return np.fmax(h - l, np.fmax(np.abs(h - prev_close), np.abs(l - prev_close)))
+
@@ -0,0 +1,129 @@
+"""Constant-time state machines backing the streaming indicator updates."""
+import math
+from collections import deque
+from typing import Deque, Iterable, Mapping
+import pandas as pd
+from core.exceptions import IndicatorCalculationError
+
+# Re-sum the window from scratch every this many pushes (times the window
+# length) to stop floating-point drift in the running sum; amortized O(1).
+_RESYNC_FACTOR = 64
+
+
+class RollingMeanState:
+    """Rolling mean over a fixed window using a ring buffer and a running sum.
+
+    Matches `Series.rolling(window).mean()`: NaN until the window is full and
+    while any value in the window is NaN.
+    """
+
+    def __init__(self, window: int):
+        """Initializes an empty window.
+
+        Args:
+            window: The window length.
+        """
+        self.window = window
+        self._values: Deque[float] = deque(maxlen=window)
+        self._sum = 0.0
+        self._nans = 0
+        self._pushes = 0
+
+    def push(self, value: float) -> float:
+        """Adds a value, dropping the oldest one once the window is full.
+
+        Args:
+            value: The new value.
+
+        Returns:
+            float: The mean of the current window, or NaN.
+        """
+        if len(self._values) == self.window:
+            old = self._values[0]
+            if math.isnan(old):
+                self._nans -= 1
+            else:
+                self._sum -= old
+        self._values.append(value)
+        if math.isnan(value):
+            self._nans += 1
+        else:
+            self._sum += value
+
+        self._pushes += 1
+        if self._pushes >= self.window * _RESYNC_FACTOR:
+            self._sum = math.fsum(v for v in self._values if not math.isnan(v))
+            self._pushes = 0
+
+        if len(self._values) < self.window or self._nans:
+            return math.nan
+        return self._sum / self.window
+
+    def extend(self, values: Iterable[float]) -> float:
+        """Pushes several values and returns the last mean."""
+        mean = math.nan
+        for value in values:
+            mean = self.push(value)
+        return mean
+
+
+class EwmState:
+    """Exponentially weighted mean matching `Series.ewm(span=..., adjust=False).mean()`.
+
+    Mirrors pandas' recurrence including its handling of missing values
+    (`ignore_na=False`): a NaN input repeats the previous output and decays
+    the weight of the old mean for the next observation.
+    """
+
+    def __init__(self, span: int):
+        """Initializes the state with no observations.
+
+        Args:
+            span: The EWM span; alpha = 2 / (span + 1).
+        """
+        self.alpha = 2.0 / (span + 1.0)
+        self.weighted = math.nan
+        self.old_weight = 1.0
+
+    def push(self, value: float) -> float:
+        """Adds a value.
+
+        Args:
+            value: The new value.
+
+        Returns:
+            float: The updated mean, or NaN before the first observation.
+        """
+        is_obs = not math.isnan(value)
+        if not math.isnan(self.weighted):
+            self.old_weight *= 1.0 - self.alpha
+            if is_obs:
+                if self.weighted != value:
+                    self.weighted = (self.old_weight * self.weighted + self.alpha * value) / (self.old_weight + self.alpha)
+                self.old_weight = 1.0
+        elif is_obs:
+            self.weighted = value
+        return self.weighted
+
+
+def close_values(history: pd.DataFrame, name: str) -> pd.Series:
+    """Returns the Close column of a history frame as floats.
+
+    Raises:
+        IndicatorCalculationError: If the column is missing.
+    """
+    if 'Close' not in history.columns:
+        raise IndicatorCalculationError(f"{name}: 'Close' column missing")
+    return history['Close'].astype('float64')
+
+
+def bar_close(bar: Mapping[str, float], name: str) -> float:
+    """Returns the Close value of a single bar as a float.
+
+    Raises:
+        IndicatorCalculationError: If the bar has no Close value.
+    """
+    try:
+        return float(bar['Close'])
+    except (KeyError, TypeError, ValueError) as e:
+        raise IndicatorCalculationError(f"{name}: bar has no usable 'Close' value") from e
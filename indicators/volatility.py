@@ -0,0 +1,110 @@
+import pandas as pd
+from core.abstractions import Indicator
+from core.exceptions import IndicatorCalculationError
+from utils.decorators import register_indicator
+from utils.logging import setup_logger
+from indicators.grid import column_values
+from indicators import kernels, rolling
+from typing import Literal
+
+logger = setup_logger(__name__)
+
+@register_indicator("BBANDS")
+class BollingerBands(Indicator):
+    """Bollinger Bands: a simple moving average with bands `num_std` standard deviations away.
+
+    `calculate` returns a DataFrame with `<name>_upper`, `<name>_middle` and
+    `<name>_lower` columns. The standard deviation is the population one
+    (ddof=0), as in the original definition.
+    """
+
+    def __init__(self, period: int = 20, num_std: float = 2.0):
+        self.period = period
+        self.num_std = num_std
+        self._name = f"BBANDS_{period}"
+        self._type: Literal["overlay", "oscillator"] = "overlay"
+        logger.debug(f"Initialized {self.name}")
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+    @property
+    def type(self) -> Literal["overlay", "oscillator"]:
+        return self._type
+
+    def calculate(self, df: pd.DataFrame) -> pd.DataFrame:  # type: ignore[override]
+        try:
+            (close,) = column_values(df, ['Close'], self.name)
+            middle = kernels.rolling_mean_grid(close, [self.period])[:, 0]
+            width = self.num_std * rolling.rolling_std(close, self.period, ddof=0)
+            return pd.DataFrame({
+                f"{self.name}_upper": middle + width,
+                f"{self.name}_middle": middle,
+                f"{self.name}_lower": middle - width,
+            }, index=df.index)
+        except Exception as e:
+            raise IndicatorCalculationError(f"{self.name} calculation failed: {e}") from e
+
+@register_indicator("DONCHIAN")
+class DonchianChannel(Indicator):
+    """Donchian Channel: the highest high and lowest low over the period.
+
+    `calculate` returns a DataFrame with `<name>_upper`, `<name>_middle` and
+    `<name>_lower` columns.
+    """
+
+    def __init__(self, period: int = 20):
+        self.period = period
+        self._name = f"DONCHIAN_{period}"
+        self._type: Literal["overlay", "oscillator"] = "overlay"
+        logger.debug(f"Initialized {self.name}")
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+    @property
+    def type(self) -> Literal["overlay", "oscillator"]:
+        return self._type
+
+    def calculate(self, df: pd.DataFrame) -> pd.DataFrame:  # type: ignore[override]
+        try:
+            high, low = column_values(df, ['High', 'Low'], self.name)
+            upper = rolling.rolling_max(high, self.period)
+            lower = rolling.rolling_min(low, self.period)
+            return pd.DataFrame({
+                f"{self.name}_upper": upper,
+                f"{self.name}_middle": (upper + lower) / 2,
+                f"{self.name}_lower": lower,
+            }, index=df.index)
+        except Exception as e:
+            raise IndicatorCalculationError(f"{self.name} calculation failed: {e}") from e
+
+@register_indicator("ATR")
+class AverageTrueRange(Indicator):
+    """Average True Range with Wilder's smoothing (an EMA with alpha = 1 / period)."""
+
+    def __init__(self, period: int = 14):
+        self.period = period
+        self._name = f"ATR_{period}"
+        self._type: Literal["overlay", "oscillator"] = "oscillator"
+        logger.debug(f"Initialized {self.name}")
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+    @property
+    def type(self) -> Literal["overlay", "oscillator"]:
+        return self._type
+
+    def calculate(self, df: pd.DataFrame) -> pd.Series:
+        try:
+            high, low, close = column_values(df, ['High', 'Low', 'Close'], self.name)
+            tr = rolling.true_range(high, low, close)
+            # alpha = 1 / period corresponds to span = 2 * period - 1.
+            atr = kernels.ewm_mean_grid(tr, [2 * self.period - 1])[:, 0]
+            return pd.Series(atr, index=df.index, name=self.name)
+        except Exception as e:
+            raise IndicatorCalculationError(f"{self.name} calculation failed: {e}") from e
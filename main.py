@@ -1,13 +1,16 @@
 import argparse
+import os
 import sys
 import yaml
 from typing import Dict, Any
 
 # Import core components
 from core.factory import ComponentFactory
-from core.exceptions import TradingEngineError
+from core.exceptions import ConfigurationError, TradingEngineError
 from engine import TradingEngine
+from scanning import ScanWriter, read_tickers
 from utils.logging import setup_logger
+from utils.profiling import StageProfiler
 
 # Import plugins to ensure registration
 import data_sources
@@ -27,14 +30,106 @@ def load_config(config_path: str) -> Dict[str, Any]:
         print(f"Error parsing config file: {e}")
         sys.exit(1)
 
+def run_sweep(factory: ComponentFactory, config_data: Dict[str, Any], logger) -> None:
+    """Fetches data once, runs the configured parameter sweep and saves the ranked table."""
+    sweep = factory.create_sweep()
+    if sweep is None:
+        raise ConfigurationError("--sweep requires a 'sweep' configuration section.")
+    df = factory.create_data_source().fetch_data(factory.create_fetch_config())
+    logger.info(f"Fetched {len(df)} rows of data.")
+    results = sweep.run(df)
+
+    output_path = config_data['sweep'].get('output_path', 'results/outputs/sweep.csv')
+    save_table(results, output_path)
+    logger.info(f"Top combinations:\n{results.head(10).to_string(index=False)}")
+    logger.info(f"Sweep results saved to {output_path}")
+
+def run_walk_forward(factory: ComponentFactory, config_data: Dict[str, Any], logger) -> None:
+    """Fetches data once, runs walk-forward optimization and saves the per-window table."""
+    optimizer = factory.create_walk_forward()
+    if optimizer is None:
+        raise ConfigurationError("--walk-forward requires a 'walk_forward' configuration section.")
+    df = factory.create_data_source().fetch_data(factory.create_fetch_config())
+    logger.info(f"Fetched {len(df)} rows of data.")
+    result = optimizer.run(df)
+
+    output_path = config_data['walk_forward'].get('output_path', 'results/outputs/walk_forward.csv')
+    save_table(result.windows, output_path)
+    logger.info(f"Windows:\n{result.windows.to_string(index=False)}")
+    summary = ", ".join(f"{k}={v:.4g}" for k, v in result.stats.items())
+    logger.info(f"Out-of-sample: {summary}")
+    logger.info(f"Walk-forward windows saved to {output_path}")
+
+def run_scan(factory: ComponentFactory, config_data: Dict[str, Any], tickers_file: str, logger) -> None:
+    """Scans the tickers of a list file and streams one row per ticker to the output table."""
+    scan_config = config_data.get('scan') or {}
+    tickers_file = tickers_file or scan_config.get('tickers_file')
+    if not tickers_file:
+        raise ConfigurationError("--scan requires a ticker list file or 'scan.tickers_file'.")
+    tickers = read_tickers(tickers_file)
+    if not tickers:
+        raise ConfigurationError(f"Ticker list '{tickers_file}' contains no tickers.")
+    scanner = factory.create_scanner()
+
+    output_path = scan_config.get('output_path', 'results/outputs/scan.csv')
+    dirname = os.path.dirname(output_path)
+    if dirname:
+        os.makedirs(dirname, exist_ok=True)
+    failed = 0
+    with ScanWriter(output_path) as writer:
+        for row in scanner.scan(tickers):
+            writer.write(row)
+            if row['error'] is not None:
+                failed += 1
+                logger.warning(f"{row['ticker']}: {row['error']}")
+    logger.info(f"Scan results for {len(tickers)} tickers ({failed} failed) saved to {output_path}")
+
+def run_profile(engine: TradingEngine, fetch_config, output_path: str, args, logger) -> None:
+    """Runs the pipeline under cProfile and tracemalloc and writes the per-stage reports."""
+    if args.profile_warmup:
+        logger.info("Warm-up run (not profiled)...")
+        engine.run(fetch_config, output_path)
+    profiler = StageProfiler(args.profile, top=args.profile_top)
+    engine.profiler = profiler
+    with profiler:
+        for number in range(1, args.profile_repeat + 1):
+            logger.info(f"Profiled run {number}/{args.profile_repeat}...")
+            engine.run(fetch_config, output_path)
+    engine.profiler = None
+    summary_path = profiler.write()
+    logger.info(f"Stage profiles, {summary_path} and allocations.txt written to {args.profile}")
+
+def save_table(table, output_path: str) -> None:
+    """Writes a results table to CSV, creating the directory if needed."""
+    dirname = os.path.dirname(output_path)
+    if dirname:
+        os.makedirs(dirname, exist_ok=True)
+    table.to_csv(output_path, index=False)
+
 def main():
     parser = argparse.ArgumentParser(description='Trading Analysis Engine')
     parser.add_argument('--config', default='config.yaml', help='Path to config file')
     parser.add_argument('--ticker', help='Override ticker from config')
     parser.add_argument('--interval', help='Override interval from config')
     parser.add_argument('--output', help='Override output path from config')
+    mode_group = parser.add_mutually_exclusive_group()
+    mode_group.add_argument('--sweep', action='store_true', help='Run the parameter sweep from the sweep config section instead of a single analysis')
+    mode_group.add_argument('--walk-forward', action='store_true', help='Run walk-forward optimization from the walk_forward and sweep config sections')
+    mode_group.add_argument('--scan', nargs='?', const='', metavar='TICKERS_FILE', help='Scan every ticker of a list file (default: scan.tickers_file) without rendering charts')
+    parser.add_argument('--profile', nargs='?', const='results/profile', metavar='DIR', help='Profile every pipeline stage with cProfile and tracemalloc, writing pstats files, a top-N summary and top allocation sites to DIR (default: results/profile)')
+    parser.add_argument('--profile-repeat', type=int, default=1, metavar='N', help='Profiled runs with --profile; caches stay warm between runs and profiles accumulate')
+    parser.add_argument('--profile-warmup', action='store_true', help='With --profile, do one unprofiled run first so every profiled run has warm caches')
+    parser.add_argument('--profile-top', type=int, default=25, metavar='N', help='Functions and allocation sites listed per stage with --profile')
+    parser.add_argument('--workers', type=int, help='Override worker processes for --sweep, --walk-forward and --scan')
+    cache_group = parser.add_mutually_exclusive_group()
+    cache_group.add_argument('--no-cache', action='store_true', help='Bypass the data cache for this run')
+    cache_group.add_argument('--refresh-cache', action='store_true', help='Refetch data and overwrite cached entries')
     
     args = parser.parse_args()
+    if args.profile is not None and (args.sweep or args.walk_forward or args.scan is not None):
+        parser.error("--profile profiles a single analysis and cannot be combined with --sweep, --walk-forward or --scan")
+    if args.profile_repeat < 1:
+        parser.error("--profile-repeat must be at least 1")
     
     # Load config
     config_data = load_config(args.config)
@@ -55,6 +150,18 @@ def main():
             config_data['visualizer'] = {}
         config_data['visualizer']['output_path'] = args.output
 
+    if args.scan is not None and not config_data.get('scan'):
+        config_data['scan'] = {}
+    if args.workers is not None:
+        for section in ('sweep', 'walk_forward', 'scan'):
+            if config_data.get(section):
+                config_data[section]['workers'] = args.workers
+
+    if args.no_cache or args.refresh_cache:
+        if not config_data.get('cache'):
+            config_data['cache'] = {'enabled': True}
+        config_data['cache']['mode'] = 'bypass' if args.no_cache else 'refresh'
+
     # Setup logging
     log_config = config_data.get('logging', {})
     log_file = log_config.get('file')
@@ -66,6 +173,16 @@ def main():
         # Create factory
         factory = ComponentFactory(config_data)
         
+        if args.sweep:
+            run_sweep(factory, config_data, logger)
+            return
+        if args.walk_forward:
+            run_walk_forward(factory, config_data, logger)
+            return
+        if args.scan is not None:
+            run_scan(factory, config_data, args.scan, logger)
+            return
+
         # Create components
         data_source = factory.create_data_source()
         indicators_list = factory.create_indicators()
@@ -73,7 +190,13 @@ def main():
         strategy = factory.create_strategy()
         
         # Create engine
-        engine = TradingEngine(data_source, indicators_list, visualizer, strategy)
+        engine = TradingEngine(
+            data_source, indicators_list, visualizer, strategy,
+            indicator_cache=factory.create_indicator_cache(),
+            backtester=factory.create_backtester(),
+            metrics_exporter=factory.create_metrics_exporter(),
+            **factory.create_engine_options(),
+        )
         
         # Create fetch config
         fetch_config = factory.create_fetch_config()
@@ -82,7 +205,10 @@ def main():
         output_path = config_data.get('visualizer', {}).get('output_path', 'results/outputs/chart.png')
         
         # Run engine
-        engine.run(fetch_config, output_path)
+        if args.profile is not None:
+            run_profile(engine, fetch_config, output_path, args, logger)
+        else:
+            engine.run(fetch_config, output_path)
         
     except TradingEngineError as e:
         logger.error(f"Trading Engine Error: {e}")
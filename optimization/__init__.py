@@ -0,0 +1,3 @@
+"""Optimization package - parameter sweeps and walk-forward optimization of strategy configurations."""
+from .sweep import ParameterSweep, expand_grid, render_template
+from .walk_forward import WalkForwardOptimizer
@@ -0,0 +1,231 @@
+"""Parameter sweeps: backtest every combination of a parameter grid.
+
+A sweep runs over a configuration template. String values in the template
+may reference grid parameters as `{name}` placeholders: a value that is
+exactly one placeholder takes the parameter itself (so `period: "{fast}"`
+becomes an int), other strings are formatted. Each combination renders the
+template into a concrete configuration, builds its indicators, strategy and
+backtester with `ComponentFactory`, and analyzes the data without rendering
+a chart.
+
+With several workers, the data is placed in shared memory once and the
+combinations are spread over a process pool (see `optimization.workers`).
+Every worker keeps one `GraphEvaluator` over the shared data, so indicator
+intermediates (e.g. the cumulative sums behind every SMA period) are
+computed once per worker rather than once per combination.
+"""
+import copy
+import itertools
+import re
+import time
+from typing import TYPE_CHECKING, Any, Dict, List, Mapping, Optional, Tuple
+import pandas as pd
+import indicators, strategies  # noqa: F401 - registers the plugins, also in worker processes
+from core.exceptions import ConfigurationError
+from core.graph import GraphEvaluator
+from utils.logging import setup_logger
+from optimization.workers import default_workers, map_tasks
+
+if TYPE_CHECKING:
+    from engine import TradingEngine
+
+logger = setup_logger(__name__)
+
+_PLACEHOLDER = re.compile(r"^\{(\w+)\}$")
+
+
+def expand_grid(parameters: Mapping[str, Any]) -> List[Dict[str, Any]]:
+    """Expands a parameter grid into the list of its combinations.
+
+    Args:
+        parameters: Parameter name to a list of values, or to a mapping with
+            `start`, `stop` and an optional `step` (default 1) describing an
+            inclusive integer range.
+
+    Returns:
+        List[Dict[str, Any]]: One mapping per combination, varying the last
+        parameter fastest.
+
+    Raises:
+        ConfigurationError: If a parameter's values are malformed or empty.
+    """
+    names, axes = [], []
+    for name, spec in parameters.items():
+        if isinstance(spec, dict):
+            try:
+                values = list(range(int(spec['start']), int(spec['stop']) + 1, int(spec.get('step', 1))))
+            except (KeyError, TypeError, ValueError) as e:
+                raise ConfigurationError(f"Sweep parameter '{name}': invalid range {spec!r}") from e
+        elif isinstance(spec, (list, tuple)):
+            values = list(spec)
+        else:
+            raise ConfigurationError(f"Sweep parameter '{name}' must be a list or a start/stop/step mapping.")
+        if not values:
+            raise ConfigurationError(f"Sweep parameter '{name}' has no values.")
+        names.append(name)
+        axes.append(values)
+    return [dict(zip(names, combination)) for combination in itertools.product(*axes)]
+
+
+def render_template(template: Any, params: Mapping[str, Any]) -> Any:
+    """Substitutes `{name}` placeholders in a configuration template.
+
+    Args:
+        template: A configuration value: dicts and lists are rendered recursively.
+        params: The parameter values.
+
+    Returns:
+        Any: The rendered configuration; the template is not modified.
+
+    Raises:
+        ConfigurationError: If a placeholder names an unknown parameter.
+    """
+    if isinstance(template, dict):
+        return {key: render_template(value, params) for key, value in template.items()}
+    if isinstance(template, list):
+        return [render_template(value, params) for value in template]
+    if isinstance(template, str) and '{' in template:
+        match = _PLACEHOLDER.match(template)
+        try:
+            return params[match.group(1)] if match else template.format_map(params)
+        except KeyError as e:
+            raise ConfigurationError(f"Unknown sweep parameter {e} in '{template}'") from e
+    return template
+
+
+def build_engine(config: Dict[str, Any]) -> "TradingEngine":
+    """Builds an engine for analyzing data in memory from one concrete configuration.
+
+    The engine has no data source or visualizer and always has a
+    backtester, the default one when the configuration has none.
+
+    Args:
+        config: A full configuration, as accepted by `ComponentFactory`.
+
+    Returns:
+        TradingEngine: The engine, to be used through `analyze`.
+
+    Raises:
+        ConfigurationError: If the configuration has no strategy.
+    """
+    # Imported lazily: core.factory imports this module.
+    from backtesting import VectorizedBacktester
+    from core.factory import ComponentFactory
+    from engine import TradingEngine
+
+    factory = ComponentFactory(config)
+    strategy = factory.create_strategy()
+    if strategy is None:
+        raise ConfigurationError("Backtesting a configuration requires a 'strategy' section.")
+    return TradingEngine(
+        None, factory.create_indicators(), None, strategy,  # type: ignore[arg-type]
+        backtester=factory.create_backtester() or VectorizedBacktester(),
+        **factory.create_engine_options(),
+    )
+
+
+def evaluate_config(config: Dict[str, Any], df: pd.DataFrame, evaluator: Optional[GraphEvaluator] = None) -> Dict[str, Any]:
+    """Backtests one concrete configuration on the data.
+
+    Args:
+        config: A full configuration, as accepted by `ComponentFactory`.
+        df: The market data.
+        evaluator: Graph evaluator over `df` shared between calls (optional).
+
+    Returns:
+        Dict[str, Any]: The backtest statistics.
+    """
+    return build_engine(config).analyze(df, evaluator).backtest.stats
+
+
+def _evaluate(state: Dict[str, Any], params: Dict[str, Any]) -> Dict[str, Any]:
+    """Sweep task: evaluates one combination, reporting failures in an 'error' column."""
+    try:
+        config = render_template(state['template'], params)
+        return {**params, **evaluate_config(config, state['df'], state['evaluator']), 'error': None}
+    except Exception as e:
+        return {**params, 'error': f"{type(e).__name__}: {e}"}
+
+
+class ParameterSweep:
+    """Backtests a configuration template over a parameter grid and ranks the results."""
+
+    def __init__(
+        self,
+        template: Dict[str, Any],
+        parameters: Mapping[str, Any],
+        workers: Optional[int] = None,
+        rank_by: str = 'sharpe_ratio',
+        ascending: bool = False,
+    ):
+        """Initializes the sweep.
+
+        Args:
+            template: Configuration template with `{name}` placeholders.
+            parameters: The parameter grid, see `expand_grid`.
+            workers: Worker processes; 1 evaluates in the calling process.
+                Defaults to the number of available CPUs.
+            rank_by: Backtest statistic to rank combinations by.
+            ascending: Rank lower values first (e.g. for 'annualized_volatility').
+
+        Raises:
+            ConfigurationError: If the grid is malformed or `workers` is not positive.
+        """
+        if workers is None:
+            workers = default_workers()
+        if not isinstance(workers, int) or workers < 1:
+            raise ConfigurationError(f"Sweep 'workers' must be a positive integer, got {workers!r}")
+        self.template = template
+        self.combinations = expand_grid(parameters)
+        self.workers = workers
+        self.rank_by = rank_by
+        self.ascending = ascending
+
+    def run(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Evaluates every combination on the data.
+
+        Args:
+            df: The market data, fetched once for the whole sweep.
+
+        Returns:
+            pd.DataFrame: One row per combination with its parameters,
+            backtest statistics and an 'error' column (None on success),
+            ordered by `rank_by` with failed combinations last. The 'rank'
+            column numbers the rows from 1.
+        """
+        logger.info(f"Sweeping {len(self.combinations)} combinations on {self.workers} worker(s)...")
+        started = time.perf_counter()
+        rows = map_tasks(_evaluate, self.combinations, df, self.template, self.workers)
+        elapsed = time.perf_counter() - started
+        logger.info(f"Sweep finished in {elapsed:.2f}s ({len(self.combinations) / elapsed:.1f} combinations/s)")
+        return self._rank(rows)
+
+    def _rank(self, rows: List[Dict[str, Any]]) -> pd.DataFrame:
+        """Orders the result rows by the ranking statistic."""
+        results = pd.DataFrame(rows)
+        if self.rank_by in results.columns:
+            results = results.sort_values(self.rank_by, ascending=self.ascending, na_position='last', kind='stable')
+        elif results['error'].isna().any():
+            raise ConfigurationError(f"Unknown sweep ranking statistic '{self.rank_by}'")
+        results = results.reset_index(drop=True)
+        results.insert(0, 'rank', range(1, len(results) + 1))
+        return results
+
+
+def sweep_template(config: Dict[str, Any]) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    """Splits a configuration into a sweep template and the `sweep` section.
+
+    Sections under `sweep.overrides` replace the corresponding top-level
+    sections in the template; the `sweep` section itself is removed.
+
+    Args:
+        config: The full configuration.
+
+    Returns:
+        Tuple of the template and the `sweep` section.
+    """
+    template = copy.deepcopy(config)
+    sweep_config = template.pop('sweep', None) or {}
+    template.update(copy.deepcopy(sweep_config.get('overrides') or {}))
+    return template, sweep_config
+
@@ -0,0 +1,254 @@
+"""Walk-forward optimization over rolling in-sample/out-of-sample windows.
+
+The series is split into consecutive windows: parameters are chosen by
+backtesting every combination on a train window, and the best one is then
+backtested on the test window that follows it. Windows advance by the
+test length, so the test windows tile the end of the series and their
+returns stitch into one out-of-sample equity curve.
+
+Indicators and signals of a combination are computed once, on the full
+series, and every window only backtests a slice of them. This relies on
+indicators and strategies being causal (a bar's values depend on earlier
+bars only), which holds for the built-in ones; it also means indicators
+are fully warmed up at the start of each window.
+
+The out-of-sample account trades one position series: at the close of the
+last bar before a test window, it switches to the position that window's
+parameters hold there, and keeps it into the window's first bar. Costs are
+only paid when the position actually changes, so a boundary where the new
+parameters hold the same position is free. Per-window test statistics are
+measured on the stitched curve.
+
+Windows are evaluated in parallel, one task per window. Each worker process
+caches the signals of the combinations it has analyzed, so a combination is
+analyzed at most once per worker.
+"""
+import time
+from typing import Any, Dict, List, Mapping, Optional, Tuple
+import numpy as np
+import pandas as pd
+from backtesting.vectorized import VectorizedBacktester, performance_stats
+from core.exceptions import ConfigurationError
+from core.models import WalkForwardResult
+from optimization.sweep import build_engine, expand_grid, render_template
+from optimization.workers import default_workers, map_tasks
+from utils.logging import setup_logger
+
+logger = setup_logger(__name__)
+
+# Out-of-sample statistics reported per window, as `test_<stat>` columns.
+TEST_STATS = ('total_return', 'sharpe_ratio', 'max_drawdown', 'trades')
+
+
+def _analysis(state: Dict[str, Any], params: Dict[str, Any]) -> Tuple[Any, np.ndarray, Any]:
+    """Returns a combination's signals, full-series positions and backtester, cached per process."""
+    cache = state.setdefault('analyses', {})
+    key = repr(sorted(params.items()))
+    if key not in cache:
+        try:
+            engine = build_engine(render_template(state['template'], params))
+            result = engine.analyze(state['df'], state['evaluator'])
+            # Positions are -1/0/1; int8 keeps one entry per combination small.
+            cache[key] = (result.signals, result.backtest.positions.to_numpy(np.int8), engine.backtester)
+        except Exception as e:
+            cache[key] = e
+    if isinstance(cache[key], Exception):
+        raise cache[key]
+    return cache[key]
+
+
+def _run_window(state: Dict[str, Any], task: Tuple[Dict[str, int], List[Dict[str, Any]], str, bool]) -> Tuple[Dict[str, Any], Optional[np.ndarray]]:
+    """Walk-forward task: selects parameters on a train window.
+
+    Returns the window's row and the chosen parameters' positions from the
+    bar before the test window to its last bar, or None if nothing was chosen.
+    """
+    bounds, combinations, rank_by, ascending = task
+    df = state['df']
+    train_start, test_start, test_end = bounds['train_start'], bounds['test_start'], bounds['test_end']
+    row: Dict[str, Any] = {
+        'train_start': df.index[train_start],
+        'train_end': df.index[test_start - 1],
+        'test_start': df.index[test_start],
+        'test_end': df.index[test_end - 1],
+    }
+
+    best: Optional[Tuple[float, Dict[str, Any]]] = None
+    errors = 0
+    for params in combinations:
+        try:
+            signals, positions, backtester = _analysis(state, params)
+        except Exception:
+            errors += 1
+            continue
+        initial = float(positions[train_start - 1]) if train_start else 0.0
+        score = backtester.run(df.iloc[train_start:test_start], signals, initial).stats.get(rank_by, np.nan)
+        if np.isnan(score):
+            continue
+        if best is None or (score < best[0] if ascending else score > best[0]):
+            best = (score, params)
+
+    if best is None:
+        row['error'] = f"No combination has a finite {rank_by} on the train window ({errors} failed)"
+        return row, None
+    score, params = best
+    _, positions, _ = _analysis(state, params)
+    row.update(params)
+    row[f'train_{rank_by}'] = score
+    row['error'] = None
+    return row, positions[test_start - 1:test_end]
+
+
+class WalkForwardOptimizer:
+    """Chooses parameters on rolling train windows and evaluates them on the following test windows."""
+
+    def __init__(
+        self,
+        template: Dict[str, Any],
+        parameters: Mapping[str, Any],
+        train_bars: int,
+        test_bars: int,
+        anchored: bool = False,
+        workers: Optional[int] = None,
+        rank_by: str = 'sharpe_ratio',
+        ascending: bool = False,
+    ):
+        """Initializes the optimizer.
+
+        Args:
+            template: Configuration template with `{name}` placeholders, see
+                `optimization.sweep`.
+            parameters: The parameter grid, see `expand_grid`.
+            train_bars: Bars in each train window.
+            test_bars: Bars in each test window; windows advance by this many bars.
+            anchored: Start every train window at the first bar instead of
+                rolling it forward, so train windows grow.
+            workers: Worker processes; 1 evaluates in the calling process.
+                Defaults to the number of available CPUs.
+            rank_by: Backtest statistic that selects the parameters.
+            ascending: Select the lowest value instead of the highest.
+
+        Raises:
+            ConfigurationError: If a window length, the grid or `workers` is invalid.
+        """
+        if workers is None:
+            workers = default_workers()
+        for name, value in (('train_bars', train_bars), ('test_bars', test_bars), ('workers', workers)):
+            if not isinstance(value, int) or value < 1:
+                raise ConfigurationError(f"Walk-forward '{name}' must be a positive integer, got {value!r}")
+        self.template = template
+        self.combinations = expand_grid(parameters)
+        self.train_bars = train_bars
+        self.test_bars = test_bars
+        self.anchored = anchored
+        self.workers = workers
+        self.rank_by = rank_by
+        self.ascending = ascending
+
+    def windows(self, rows: int) -> List[Dict[str, int]]:
+        """Returns the row bounds of every window for a series of `rows` bars.
+
+        The last test window may be shorter than `test_bars`.
+
+        Args:
+            rows: Length of the series.
+
+        Returns:
+            List[Dict[str, int]]: `train_start`, `test_start` and `test_end`
+            (exclusive) row positions per window.
+        """
+        bounds = []
+        test_start = self.train_bars
+        while test_start < rows:
+            bounds.append({
+                'train_start': 0 if self.anchored else test_start - self.train_bars,
+                'test_start': test_start,
+                'test_end': min(test_start + self.test_bars, rows),
+            })
+            test_start += self.test_bars
+        return bounds
+
+    def run(self, df: pd.DataFrame) -> WalkForwardResult:
+        """Runs the walk-forward optimization.
+
+        Args:
+            df: The market data, fetched once for all windows.
+
+        Returns:
+            WalkForwardResult: Per-window choices and the stitched out-of-sample performance.
+
+        Raises:
+            ConfigurationError: If the series is too short for one window.
+        """
+        bounds = self.windows(len(df))
+        if not bounds:
+            raise ConfigurationError(f"Walk-forward needs more than {self.train_bars} bars, got {len(df)}")
+        logger.info(
+            f"Walk-forward over {len(bounds)} windows x {len(self.combinations)} combinations "
+            f"on {self.workers} worker(s)..."
+        )
+        started = time.perf_counter()
+        tasks = [(window, self.combinations, self.rank_by, self.ascending) for window in bounds]
+        outputs = map_tasks(_run_window, tasks, df, self.template, self.workers)
+        logger.info(f"Walk-forward finished in {time.perf_counter() - started:.2f}s")
+
+        # Positions from the last train bar of the first window to the end;
+        # a window's positions overwrite the previous window's at their
+        # shared boundary bar, where the account switches parameters.
+        start = bounds[0]['test_start']
+        position = np.zeros(len(df) - start + 1)
+        rows = []
+        for number, (window, (row, window_positions)) in enumerate(zip(bounds, outputs), start=1):
+            rows.append({'window': number, **row})
+            # Windows without a choice stay in cash.
+            offset = window['test_start'] - start
+            length = window['test_end'] - window['test_start'] + 1
+            position[offset:offset + length] = window_positions if window_positions is not None else 0.0
+        columns = [
+            'window', 'train_start', 'train_end', 'test_start', 'test_end', *self.combinations[0],
+            f'train_{self.rank_by}', *(f'test_{stat}' for stat in TEST_STATS), 'error',
+        ]
+        return self._stitch(df, pd.DataFrame(rows, columns=columns), bounds, position)
+
+    def _stitch(self, df: pd.DataFrame, windows: pd.DataFrame, bounds: List[Dict[str, int]], position: np.ndarray) -> WalkForwardResult:
+        """Backtests the stitched positions and measures each test window on the result."""
+        # Imported lazily: core.factory imports this module.
+        from core.factory import ComponentFactory
+
+        config = render_template(self.template, self.combinations[0])
+        backtester = ComponentFactory(config).create_backtester() or VectorizedBacktester()
+        start = bounds[0]['test_start']
+        result = backtester.evaluate(df.iloc[start - 1:], position)
+        growth = 1.0 + result.returns.to_numpy()
+        # The last train bar only pays for entering the first position.
+        growth[1] *= growth[0]
+        returns = growth[1:] - 1.0
+        equity = backtester.initial_capital * np.cumprod(growth[1:])
+        drawdown = equity / np.maximum.accumulate(equity) - 1.0
+
+        # Trades are counted in the window whose parameters opened them.
+        entries = np.flatnonzero((np.diff(position, prepend=0.0) != 0) & (position != 0))
+        for i, window in enumerate(bounds):
+            if pd.notna(windows.at[i, 'error']):
+                continue
+            first, last = window['test_start'] - start, window['test_end'] - start
+            window_growth = np.cumprod(growth[1:][first:last])
+            window_stats = performance_stats(
+                backtester.initial_capital * window_growth, returns[first:last],
+                window_growth / np.maximum.accumulate(window_growth) - 1.0,
+                backtester.initial_capital, backtester.periods_per_year,
+            )
+            window_stats['trades'] = int(((entries >= first) & (entries < last + (i == len(bounds) - 1))).sum())
+            for stat in TEST_STATS:
+                windows.at[i, f'test_{stat}'] = window_stats[stat]
+
+        stats = performance_stats(equity, returns, drawdown, backtester.initial_capital, backtester.periods_per_year)
+        stats['windows'] = len(windows)
+        stats['failed_windows'] = int(windows['error'].notna().sum())
+        index = df.index[start:]
+        return WalkForwardResult(
+            windows=windows,
+            equity=pd.Series(equity, index=index, name='equity'),
+            returns=pd.Series(returns, index=index, name='returns'),
+            stats=stats,
+        )
@@ -0,0 +1,78 @@
+"""Process pool plumbing shared by the optimizers.
+
+Tasks are module-level functions `func(state, item)`. The state holds the
+market data, the configuration template and a `GraphEvaluator` over the
+data, plus any per-process caches a task keeps. With one worker the tasks
+run in the calling process; otherwise the data is copied once into shared
+memory and every pool worker attaches to it in its initializer, so tasks
+never pickle the data and each worker's state lives for the whole pool.
+"""
+import os
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from typing import Any, Callable, Dict, List, Sequence, TypeVar
+import pandas as pd
+from core.graph import GraphEvaluator
+from utils.shared_frame import SharedFrame, SharedFrameHandle
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+# State of the current pool worker process, set by `_init_worker`.
+_state: Dict[str, Any] = {}
+
+
+def default_workers() -> int:
+    """Returns the number of CPUs available to this process."""
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:
+        return os.cpu_count() or 1
+
+
+def make_state(df: pd.DataFrame, template: Dict[str, Any]) -> Dict[str, Any]:
+    """Builds the task state for one process."""
+    return {'df': df, 'template': template, 'evaluator': GraphEvaluator(df)}
+
+
+def _init_worker(handle: SharedFrameHandle, template: Dict[str, Any]) -> None:
+    """Pool initializer: attaches to the shared data once per worker process."""
+    shm, df = SharedFrame.attach(handle)
+    _state.clear()
+    _state.update(make_state(df, template), shm=shm)
+
+
+def _call(func: Callable[[Dict[str, Any], T], R], item: T) -> R:
+    """Runs a task against the worker's state."""
+    return func(_state, item)
+
+
+def map_tasks(
+    func: Callable[[Dict[str, Any], T], R],
+    items: Sequence[T],
+    df: pd.DataFrame,
+    template: Dict[str, Any],
+    workers: int,
+) -> List[R]:
+    """Runs `func(state, item)` for every item, in order.
+
+    Args:
+        func: A module-level (picklable) task function.
+        items: The task inputs; they are pickled to the workers.
+        df: The market data.
+        template: The configuration template.
+        workers: Worker processes; 1 runs the tasks in the calling process.
+
+    Returns:
+        List[R]: The task results, in item order.
+    """
+    if workers == 1 or len(items) <= 1:
+        state = make_state(df, template)
+        return [func(state, item) for item in items]
+    workers = min(workers, len(items))
+    # A few chunks per worker amortize task overhead while balancing load.
+    chunksize = max(1, len(items) // (workers * 4))
+    with SharedFrame(df) as shared:
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                 initargs=(shared.handle, template)) as pool:
+            return list(pool.map(partial(_call, func), items, chunksize=chunksize))
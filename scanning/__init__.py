@@ -0,0 +1,2 @@
+"""Scanning package - runs one strategy configuration over a universe of tickers."""
+from .scanner import ScanWriter, UniverseScanner, read_tickers
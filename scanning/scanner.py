@@ -0,0 +1,270 @@
+"""Runs one configured strategy over a universe of tickers on a process pool.
+
+Each worker process builds the data source, indicators, strategy and
+optional backtester from the configuration once, in its initializer, and
+then analyzes many tickers: pandas, yfinance and the plugins are imported
+once per worker instead of once per ticker. Tickers are dispatched in
+chunks fetched with the data source's batch API (`fetch_many`), and no
+chart is rendered. Results come back as one flat row per ticker, in
+completion order, so they can be written out while the scan is running.
+
+Each worker has its own fetch executor and token bucket, so the configured
+`fetch.rate_limit_per_second` is divided evenly among the workers: the
+scan as a whole stays within the limit, and each worker gets its share.
+"""
+import csv
+import dataclasses
+import math
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from typing import Any, Dict, Iterator, List, Optional, Sequence
+from core.exceptions import ConfigurationError
+from core.models import AnalysisResult
+from optimization.workers import default_workers
+from utils.logging import setup_logger
+
+logger = setup_logger(__name__)
+
+# Columns every row has; indicator values follow as `<indicator name>` columns.
+BASE_COLUMNS = [
+    'ticker', 'rows', 'last_time', 'close', 'signals',
+    'last_signal', 'last_signal_time', 'last_signal_price', 'last_signal_description',
+]
+BACKTEST_COLUMNS = ['total_return', 'sharpe_ratio', 'max_drawdown', 'trades']
+
+# Components of the current worker process, set by `_init_worker`.
+_worker: Dict[str, Any] = {}
+
+
+def read_tickers(path: str) -> List[str]:
+    """Reads a ticker list file.
+
+    Tickers are separated by newlines, commas or whitespace. Text after a
+    '#' is a comment. Duplicates are dropped, keeping the first occurrence.
+
+    Args:
+        path: Path of the file.
+
+    Returns:
+        List[str]: The tickers, upper-cased.
+    """
+    tickers: Dict[str, None] = {}
+    with open(path, 'r') as f:
+        for line in f:
+            for token in line.split('#', 1)[0].replace(',', ' ').split():
+                tickers.setdefault(token.upper(), None)
+    return list(tickers)
+
+
+def summarize(ticker: str, result: AnalysisResult) -> Dict[str, Any]:
+    """Flattens an analysis into one scan row: latest bar, latest signal, last indicator values."""
+    df = result.data
+    row: Dict[str, Any] = {
+        'ticker': ticker,
+        'rows': len(df),
+        'last_time': df.index[-1] if len(df) else None,
+        'close': float(df['Close'].iloc[-1]) if len(df) and 'Close' in df.columns else None,
+        'signals': len(result.signals),
+    }
+    if len(result.signals):
+        last = result.signals[-1]
+        row.update(last_signal=last.type.name, last_signal_time=last.timestamp,
+                   last_signal_price=float(last.price), last_signal_description=last.description)
+    for name, series in result.indicators.items():
+        row[name] = float(series.iloc[-1]) if len(series) else None
+    if result.backtest is not None:
+        row.update({stat: result.backtest.stats[stat] for stat in BACKTEST_COLUMNS})
+    return row
+
+
+def _init_worker(config: Dict[str, Any], workers: int = 1) -> None:
+    """Pool initializer: builds the scan components once per worker process.
+
+    Args:
+        config: The scan configuration.
+        workers: Number of worker processes sharing the fetch rate limit.
+    """
+    import indicators, strategies  # noqa: F401 - registers the plugins
+    from core.factory import ComponentFactory
+    from engine import TradingEngine
+
+    fetch_config = config.get('fetch') or {}
+    if fetch_config.get('rate_limit_per_second') and workers > 1:
+        rate = fetch_config['rate_limit_per_second'] / workers
+        config = {**config, 'fetch': {**fetch_config, 'rate_limit_per_second': rate}}
+    # The ticker is set per task, so the configuration need not name one.
+    factory = ComponentFactory({**config, 'data_source': {'ticker': '', **(config.get('data_source') or {})}})
+    data_source = factory.create_data_source()
+    engine = TradingEngine(
+        data_source, factory.create_indicators(), None, factory.create_strategy(),  # type: ignore[arg-type]
+        indicator_cache=factory.create_indicator_cache(),
+        backtester=factory.create_backtester(),
+        **factory.create_engine_options(),
+    )
+    _worker.clear()
+    _worker.update(engine=engine, fetch_config=factory.create_fetch_config())
+
+
+def _scan_chunk(tickers: Sequence[str]) -> List[Dict[str, Any]]:
+    """Pool task: fetches a chunk of tickers in one batch and analyzes each of them."""
+    engine, template = _worker['engine'], _worker['fetch_config']
+    configs = [dataclasses.replace(template, ticker=ticker) for ticker in tickers]
+    started = time.perf_counter()
+    fetched = engine.data_source.fetch_many(configs)
+    fetch_seconds = (time.perf_counter() - started) / len(tickers)
+
+    rows = []
+    for ticker in tickers:
+        started = time.perf_counter()
+        try:
+            if ticker in fetched.errors:
+                raise fetched.errors[ticker]
+            df = fetched.data.get(ticker)
+            if df is None or df.empty:
+                raise ValueError("no data")
+            row = summarize(ticker, engine.analyze(df))
+            row['error'] = None
+        except Exception as e:
+            row = {'ticker': ticker, 'error': f"{type(e).__name__}: {e}"}
+        row['seconds'] = fetch_seconds + time.perf_counter() - started
+        rows.append(row)
+    return rows
+
+
+class UniverseScanner:
+    """Analyzes many tickers with one configuration, without rendering."""
+
+    def __init__(self, config: Dict[str, Any], workers: Optional[int] = None, chunk_size: int = 16,
+                 log_every_seconds: float = 10.0):
+        """Initializes the scanner.
+
+        Args:
+            config: The configuration; `data_source.ticker` is replaced per
+                ticker and may be omitted.
+            workers: Worker processes; 1 scans in the calling process.
+                Defaults to the number of available CPUs. Fetching is I/O
+                bound, so more workers than CPUs can pay off for remote sources.
+                The fetch rate limit is split evenly among the workers.
+            chunk_size: Tickers per task, fetched with one `fetch_many` call.
+            log_every_seconds: Interval of the progress and throughput log lines.
+
+        Raises:
+            ConfigurationError: If `workers` or `chunk_size` is not positive.
+        """
+        if workers is None:
+            workers = default_workers()
+        for name, value in (('workers', workers), ('chunk_size', chunk_size)):
+            if not isinstance(value, int) or value < 1:
+                raise ConfigurationError(f"Scan '{name}' must be a positive integer, got {value!r}")
+        self.config = config
+        self.workers = workers
+        self.chunk_size = chunk_size
+        self.log_every_seconds = log_every_seconds
+
+    def scan(self, tickers: Sequence[str]) -> Iterator[Dict[str, Any]]:
+        """Scans the tickers, yielding one row per ticker as soon as its chunk completes.
+
+        Failures (fetch errors, missing data, indicator or strategy errors)
+        are reported in the row's 'error' column and do not stop the scan.
+
+        Args:
+            tickers: The tickers to scan.
+
+        Yields:
+            Dict[str, Any]: Scan rows, in completion order.
+        """
+        chunks = [list(tickers[i:i + self.chunk_size]) for i in range(0, len(tickers), self.chunk_size)]
+        logger.info(f"Scanning {len(tickers)} tickers in {len(chunks)} chunks on {self.workers} worker(s)...")
+        started = last_log = time.perf_counter()
+        done = failed = 0
+        for rows in self._run(chunks):
+            for row in rows:
+                done += 1
+                failed += row['error'] is not None
+                yield row
+            now = time.perf_counter()
+            if now - last_log >= self.log_every_seconds or done == len(tickers):
+                last_log = now
+                logger.info(f"Scanned {done}/{len(tickers)} tickers ({failed} failed), "
+                            f"{done / (now - started):.1f} tickers/s")
+
+    def _run(self, chunks: List[List[str]]) -> Iterator[List[Dict[str, Any]]]:
+        """Yields the rows of each chunk as it completes."""
+        if not chunks:
+            return
+        if self.workers == 1 or len(chunks) == 1:
+            _init_worker(self.config)
+            for chunk in chunks:
+                yield _scan_chunk(chunk)
+            return
+        workers = min(self.workers, len(chunks))
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(self.config, workers)) as pool:
+            # Keep a bounded number of chunks in flight so a slow consumer
+            # does not let finished results pile up.
+            pending = iter(chunks)
+            in_flight = {pool.submit(_scan_chunk, chunk) for chunk in _take(pending, 2 * workers)}
+            while in_flight:
+                finished, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+                in_flight |= {pool.submit(_scan_chunk, chunk) for chunk in _take(pending, len(finished))}
+                for future in finished:
+                    yield future.result()
+
+
+def _take(chunks: Iterator[List[str]], n: int) -> List[List[str]]:
+    """Returns up to the next `n` chunks."""
+    return [chunk for _, chunk in zip(range(n), chunks)]
+
+
+class ScanWriter:
+    """Streams scan rows into one CSV table.
+
+    The header is fixed by the first successful row (base columns, indicator
+    columns, backtest columns, then 'error' and 'seconds'); failed rows seen
+    before it are held back until then. Every row is flushed when written.
+    """
+
+    def __init__(self, path: str):
+        """Opens the output file.
+
+        Args:
+            path: Path of the CSV file; it is overwritten.
+        """
+        self._file = open(path, 'w', newline='')
+        self._writer: Optional[csv.DictWriter] = None
+        self._held: List[Dict[str, Any]] = []
+        self.rows = 0
+
+    def write(self, row: Dict[str, Any]) -> None:
+        """Writes one scan row."""
+        if self._writer is None:
+            if row.get('error') is not None:
+                self._held.append(row)
+                return
+            extra = [c for c in row if c not in BASE_COLUMNS and c not in ('error', 'seconds')]
+            self._start(BASE_COLUMNS + extra + ['error', 'seconds'])
+        self._writerow(row)
+
+    def _start(self, columns: List[str]) -> None:
+        """Writes the header and the held-back rows."""
+        self._writer = csv.DictWriter(self._file, fieldnames=columns, extrasaction='ignore')
+        self._writer.writeheader()
+        held, self._held = self._held, []
+        for row in held:
+            self._writerow(row)
+
+    def _writerow(self, row: Dict[str, Any]) -> None:
+        self._writer.writerow({k: v for k, v in row.items() if not (isinstance(v, float) and math.isnan(v))})
+        self._file.flush()
+        self.rows += 1
+
+    def close(self) -> None:
+        """Writes any held-back rows and closes the file."""
+        if self._writer is None:
+            self._start(BASE_COLUMNS + ['error', 'seconds'])
+        self._file.close()
+
+    def __enter__(self) -> "ScanWriter":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
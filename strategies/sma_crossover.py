@@ -1,7 +1,8 @@
-from typing import Dict, List
+from typing import Dict
+import numpy as np
 import pandas as pd
 from core.abstractions import Strategy
-from core.models import Signal, SignalType
+from core.models import SignalBatch, SignalType
 from utils.decorators import register_strategy
 
 @register_strategy("sma_crossover")
@@ -16,44 +17,36 @@ class SMACrossoverStrategy(Strategy):
     def name(self) -> str:
         return "SMA Crossover"
 
-    def generate_signals(self, df: pd.DataFrame, indicators: Dict[str, pd.Series]) -> List[Signal]:
-        signals = []
-        
+    def generate_signals(self, df: pd.DataFrame, indicators: Dict[str, pd.Series]) -> SignalBatch:
         if self.fast_ma_name not in indicators or self.slow_ma_name not in indicators:
-            return signals
+            return SignalBatch()
 
-        fast_ma = indicators[self.fast_ma_name]
-        slow_ma = indicators[self.slow_ma_name]
-        
-        # Iterate through the data to find crossovers
-        for i in range(1, len(df)):
-            timestamp = df.index[i]
-            # Handle different column naming conventions if necessary, but assuming 'Close' is standard
-            price = df['Close'].iloc[i] 
-            
-            curr_fast = fast_ma.iloc[i]
-            curr_slow = slow_ma.iloc[i]
-            prev_fast = fast_ma.iloc[i-1]
-            prev_slow = slow_ma.iloc[i-1]
-            
-            if pd.isna(curr_fast) or pd.isna(curr_slow) or pd.isna(prev_fast) or pd.isna(prev_slow):
-                continue
+        n = len(df)
+        if n < 2:
+            return SignalBatch()
+        # Indicators are aligned with df by position.
+        fast = indicators[self.fast_ma_name].to_numpy(dtype='float64', na_value=np.nan)[:n]
+        slow = indicators[self.slow_ma_name].to_numpy(dtype='float64', na_value=np.nan)[:n]
+        close = df['Close'].to_numpy()
 
-            # Buy Signal: Fast crosses above Slow
-            if prev_fast <= prev_slow and curr_fast > curr_slow:
-                signals.append(Signal(
-                    timestamp=timestamp, 
-                    type=SignalType.BUY, 
-                    price=price, 
-                    description=f"Golden Cross: {self.fast_ma_name} crossed above {self.slow_ma_name}"
-                ))
-            # Sell Signal: Fast crosses below Slow
-            elif prev_fast >= prev_slow and curr_fast < curr_slow:
-                signals.append(Signal(
-                    timestamp=timestamp, 
-                    type=SignalType.SELL, 
-                    price=price, 
-                    description=f"Death Cross: {self.fast_ma_name} crossed below {self.slow_ma_name}"
-                ))
-                
-        return signals
+        # Compare each bar (curr) with the one before it (prev) in whole-array
+        # operations; bars with a NaN average on either side never signal.
+        prev_fast, curr_fast = fast[:-1], fast[1:]
+        prev_slow, curr_slow = slow[:-1], slow[1:]
+        valid = ~(np.isnan(prev_fast) | np.isnan(curr_fast) | np.isnan(prev_slow) | np.isnan(curr_slow))
+        # Buy: fast crosses above slow. Sell: fast crosses below slow.
+        buy = valid & (prev_fast <= prev_slow) & (curr_fast > curr_slow)
+        sell = valid & (prev_fast >= prev_slow) & (curr_fast < curr_slow)
+
+        golden = f"Golden Cross: {self.fast_ma_name} crossed above {self.slow_ma_name}"
+        death = f"Death Cross: {self.fast_ma_name} crossed below {self.slow_ma_name}"
+        rows = np.flatnonzero(buy | sell)
+        is_buy = buy[rows]
+        # Signals fire on the current bar, one position after `rows`.
+        return SignalBatch.from_arrays(
+            df.index[rows + 1],
+            np.where(is_buy, SignalType.BUY.value, SignalType.SELL.value),
+            close[rows + 1],
+            np.where(is_buy, 0, 1),
+            [golden, death],
+        )
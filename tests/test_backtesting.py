@@ -0,0 +1,126 @@
+import numpy as np
+import pandas as pd
+import pytest
+from backtesting import VectorizedBacktester
+from core.exceptions import BacktestError
+from core.models import Signal, SignalBatch, SignalType
+
+
+@pytest.fixture
+def prices():
+    index = pd.date_range("2024-01-01", periods=5, freq="D")
+    return pd.DataFrame({'Close': [100.0, 110.0, 121.0, 110.0, 121.0]}, index=index)
+
+
+def _loop_equity(close, signals, capital, rate, allow_short):
+    """Bar-by-bar reference: apply signals at the close, pay costs on position changes."""
+    targets = {}
+    for signal in signals:
+        if signal.type == SignalType.BUY:
+            targets[signal.timestamp] = 1.0
+        elif signal.type == SignalType.SELL:
+            targets[signal.timestamp] = -1.0 if allow_short else 0.0
+    equity, position, curve = capital, 0.0, []
+    for i, (timestamp, price) in enumerate(close.items()):
+        if i > 0:
+            equity *= 1.0 + position * (price / close.iloc[i - 1] - 1.0)
+        target = targets.get(timestamp, position)
+        equity *= 1.0 - abs(target - position) * rate
+        position = target
+        curve.append(equity)
+    return np.array(curve)
+
+
+def test_backtest_long_round_trip_with_costs(prices):
+    signals = [Signal(prices.index[1], SignalType.BUY, 110.0), Signal(prices.index[3], SignalType.SELL, 110.0)]
+    result = VectorizedBacktester(initial_capital=10_000, fee_rate=0.01).run(prices, signals)
+
+    np.testing.assert_allclose(result.equity, [10_000, 9_900, 10_890, 9_801, 9_801])
+    assert result.positions.tolist() == [0, 1, 1, 0, 0]
+    assert result.drawdown.iloc[3] == pytest.approx(9_801 / 10_890 - 1)
+    assert result.stats['fees_paid'] == pytest.approx(100 + 99)
+    assert result.stats['slippage_paid'] == 0
+    assert result.stats['gross_total_return'] == pytest.approx(0.0)
+    assert result.stats['total_return'] == pytest.approx(-0.0199)
+
+    trade = result.trades.iloc[0]
+    assert len(result.trades) == 1
+    assert (trade['entry_time'], trade['exit_time'], trade['bars']) == (prices.index[1], prices.index[3], 2)
+    assert trade['gross_return'] == pytest.approx(0.0)
+    assert trade['net_return'] == pytest.approx(0.99 * 0.99 - 1)
+    assert not trade['open']
+
+
+def test_backtest_short_flip_and_open_trade(prices):
+    signals = SignalBatch.from_signals([
+        Signal(prices.index[0], SignalType.BUY, 100.0),
+        Signal(prices.index[2], SignalType.SELL, 121.0),
+        Signal(prices.index[3], SignalType.HOLD, 110.0),
+    ])
+    result = VectorizedBacktester(allow_short=True, slippage=0.001).run(prices, signals)
+
+    assert result.positions.tolist() == [1, 1, -1, -1, -1]
+    assert result.trades['direction'].tolist() == [1, -1]
+    assert result.trades['open'].tolist() == [False, True]
+    assert result.trades['gross_return'].iloc[1] == pytest.approx((1 + 11 / 121) * (1 - 11 / 110) - 1)
+    # The flip trades twice the account value.
+    assert result.stats['turnover'] == 3.0
+
+
+def test_backtest_short_wiped_out(prices):
+    prices = prices.assign(Close=[100.0, 150.0, 320.0, 330.0, 300.0])
+    signals = [Signal(prices.index[0], SignalType.SELL, 100.0)]
+    with np.errstate(all='raise'):
+        result = VectorizedBacktester(allow_short=True, fee_rate=0.01).run(prices, signals)
+
+    # The short loses 50%, then 113%: the account is gone and stays flat.
+    np.testing.assert_allclose(result.equity, [9_900, 4_950, 0, 0, 0])
+    assert result.positions.tolist() == [-1, -1, 0, 0, 0]
+    assert result.returns.iloc[2] == -1.0
+    assert result.drawdown.iloc[-1] == -1.0
+    assert result.stats['gross_total_return'] == -1.0
+
+    trade = result.trades.iloc[0]
+    assert len(result.trades) == 1
+    assert (trade['exit_time'], trade['gross_return'], trade['open']) == (prices.index[2], -1.0, False)
+    assert np.isfinite(result.trades[['gross_return', 'net_return']].to_numpy()).all()
+
+
+def test_backtest_matches_loop():
+    rng = np.random.default_rng(3)
+    n = 500
+    index = pd.date_range("2024-01-01", periods=n, freq="h")
+    close = pd.Series(100 + rng.normal(0, 1, n).cumsum(), index=index)
+    rows = np.sort(rng.choice(n, 60, replace=False))
+    signals = [Signal(index[i], SignalType.BUY if rng.random() < 0.5 else SignalType.SELL, close.iloc[i]) for i in rows]
+
+    for allow_short in (False, True):
+        backtester = VectorizedBacktester(fee_rate=0.001, slippage=0.002, allow_short=allow_short)
+        result = backtester.run(close.to_frame('Close'), signals)
+        expected = _loop_equity(close, signals, 10_000.0, 0.003, allow_short)
+        np.testing.assert_allclose(result.equity.to_numpy(), expected, rtol=1e-12)
+        assert result.returns.iloc[1:].add(1).prod() == pytest.approx(expected[-1] / expected[0])
+
+
+def test_backtest_initial_position(prices):
+    signals = [Signal(prices.index[3], SignalType.SELL, 110.0)]
+    result = VectorizedBacktester(fee_rate=0.01).run(prices, signals, initial_position=1.0)
+
+    assert result.positions.tolist() == [1, 1, 1, 0, 0]
+    # The position is entered, and paid for, at the first close.
+    assert result.equity.iloc[0] == pytest.approx(9_900)
+    assert result.trades['entry_time'].tolist() == [prices.index[0]]
+
+
+def test_backtest_without_signals(prices):
+    result = VectorizedBacktester().run(prices, [])
+    assert (result.equity == 10_000).all()
+    assert result.trades.empty
+    assert result.stats['trades'] == 0 and result.stats['exposure'] == 0
+
+
+def test_backtest_errors(prices):
+    with pytest.raises(BacktestError):
+        VectorizedBacktester().run(prices.rename(columns={'Close': 'Price'}), [])
+    with pytest.raises(ValueError):
+        VectorizedBacktester(fee_rate=-0.1)
@@ -1,7 +1,7 @@
 import pytest
 from datetime import datetime
 import pandas as pd
-from core.models import DataFetchConfig, AnalysisResult
+from core.models import DataFetchConfig, AnalysisResult, Signal, SignalBatch, SignalType
 from core.factory import ComponentFactory
 from core.exceptions import ConfigurationError, FactoryError
 from core.abstractions import DataSource, Indicator, Visualizer
@@ -24,6 +24,37 @@ def test_analysis_result_initialization():
     assert result.indicators == {}
     assert isinstance(result.timestamp, datetime)
 
+@pytest.mark.parametrize("timestamps", [
+    pd.date_range("2024-03-08", periods=3, freq="D", tz="America/New_York"),
+    pd.date_range("2024-03-08", periods=3, freq="h"),
+    pd.RangeIndex(3),
+])
+def test_signal_batch_round_trip(timestamps):
+    signals = [
+        Signal(timestamps[0], SignalType.BUY, 10.5, "cross"),
+        Signal(timestamps[1], SignalType.SELL, 11.0, "other"),
+        Signal(timestamps[2], SignalType.HOLD, 12.0, "cross"),
+    ]
+    batch = SignalBatch.from_signals(signals)
+    assert batch.descriptions == ["cross", "other"]
+    assert batch.description_codes.tolist() == [0, 1, 0]
+    assert batch.index.equals(pd.Index(timestamps))
+    assert batch.to_signals() == signals
+    assert batch == signals and list(batch) == signals
+    assert batch[-1] == signals[-1]
+    assert batch.mask(SignalType.BUY).tolist() == [True, False, False]
+
+def test_signal_batch_empty_and_invalid():
+    empty = SignalBatch()
+    assert len(empty) == 0 and not empty and empty == []
+    assert SignalBatch.from_signals([]) == []
+    with pytest.raises(ValueError):
+        SignalBatch.from_arrays(pd.RangeIndex(2), [1], [1.0, 2.0])
+
+def test_signal_uses_slots():
+    signal = Signal(datetime(2024, 1, 1), SignalType.BUY, 1.0)
+    assert not hasattr(signal, "__dict__")
+
 # --- Tests for core/factory.py ---
 
 @pytest.fixture
@@ -93,3 +124,161 @@ def test_create_indicators_unregistered(valid_config):
     factory = ComponentFactory(valid_config)
     with pytest.raises(FactoryError, match="Indicator 'UnknownIndicator' is not registered"):
         factory.create_indicators()
+
+def test_create_indicators_with_periods(valid_config):
+    from indicators.grid import IndicatorGrid
+    from indicators.moving_averages import SimpleMovingAverage
+
+    valid_config['indicators'] = [
+        {'name': 'SMA', 'periods': [5, 10]},
+        {'name': 'SMA', 'periods': {'start': 5, 'stop': 20, 'step': 5}},
+    ]
+    factory = ComponentFactory(valid_config)
+    grid, ranged = factory.create_indicators()
+    assert isinstance(grid, IndicatorGrid)
+    assert grid.indicator_cls is SimpleMovingAverage
+    assert grid.periods == [5, 10]
+    assert grid.name == "SMA_5..SMA_10"
+    assert ranged.periods == [5, 10, 15, 20]
+
+@pytest.mark.parametrize("spec", [[], [5, -1], "5,10", {'start': 5}])
+def test_create_indicators_invalid_periods(valid_config, spec):
+    from indicators.moving_averages import SimpleMovingAverage
+
+    valid_config['indicators'] = [{'name': 'SMA', 'periods': spec}]
+    factory = ComponentFactory(valid_config)
+    with pytest.raises(FactoryError):
+        factory.create_indicators()
+
+def test_create_engine_options(valid_config):
+    factory = ComponentFactory(valid_config)
+    assert factory.create_engine_options() == {'indicator_backend': 'pandas', 'indicator_dtype': 'float64', 'indicator_workers': 1, 'track_memory': False}
+
+    valid_config['engine'] = {'indicator_backend': 'numpy', 'indicator_dtype': 'float32', 'indicator_workers': 4, 'track_memory': True}
+    assert ComponentFactory(valid_config).create_engine_options() == {'indicator_backend': 'numpy', 'indicator_dtype': 'float32', 'indicator_workers': 4, 'track_memory': True}
+
+    valid_config['engine'] = {'indicator_backend': 'polars'}
+    with pytest.raises(ConfigurationError, match="Unsupported indicator backend"):
+        ComponentFactory(valid_config).create_engine_options()
+
+    valid_config['engine'] = {'indicator_workers': 0}
+    with pytest.raises(ConfigurationError, match="indicator_workers"):
+        ComponentFactory(valid_config).create_engine_options()
+
+def test_create_metrics_exporter(valid_config, tmp_path):
+    from utils.metrics import JsonLinesExporter, PrometheusTextExporter
+
+    assert ComponentFactory(valid_config).create_metrics_exporter() is None
+    valid_config['metrics'] = {'path': str(tmp_path / 'runs.jsonl')}
+    assert isinstance(ComponentFactory(valid_config).create_metrics_exporter(), JsonLinesExporter)
+    valid_config['metrics'] = {'format': 'prometheus', 'path': str(tmp_path / 'runs.prom')}
+    assert isinstance(ComponentFactory(valid_config).create_metrics_exporter(), PrometheusTextExporter)
+    valid_config['metrics']['enabled'] = False
+    assert ComponentFactory(valid_config).create_metrics_exporter() is None
+
+    valid_config['metrics'] = {'format': 'xml', 'path': 'x'}
+    with pytest.raises(ConfigurationError, match="Unknown metrics format"):
+        ComponentFactory(valid_config).create_metrics_exporter()
+
+def test_create_backtester(valid_config):
+    from backtesting import VectorizedBacktester
+
+    assert ComponentFactory(valid_config).create_backtester() is None
+    valid_config['backtest'] = {'fee_rate': 0.001, 'allow_short': True}
+    backtester = ComponentFactory(valid_config).create_backtester()
+    assert isinstance(backtester, VectorizedBacktester)
+    assert backtester.fee_rate == 0.001 and backtester.allow_short
+
+    valid_config['backtest']['enabled'] = False
+    assert ComponentFactory(valid_config).create_backtester() is None
+
+    valid_config['backtest'] = {'fee_rate': 0.9}
+    with pytest.raises(ConfigurationError, match="Invalid backtest configuration"):
+        ComponentFactory(valid_config).create_backtester()
+
+def test_create_sweep(valid_config):
+    from optimization import ParameterSweep
+
+    assert ComponentFactory(valid_config).create_sweep() is None
+    valid_config['sweep'] = {
+        'parameters': {'fast': [5, 10]},
+        'overrides': {'strategy': {'name': 'sma_crossover', 'fast_ma_name': 'SMA_{fast}'}},
+        'workers': 2,
+    }
+    sweep = ComponentFactory(valid_config).create_sweep()
+    assert isinstance(sweep, ParameterSweep)
+    assert sweep.combinations == [{'fast': 5}, {'fast': 10}]
+    assert sweep.template['strategy']['fast_ma_name'] == 'SMA_{fast}'
+    assert 'sweep' not in sweep.template
+
+    valid_config['sweep'] = {'workers': 2}
+    with pytest.raises(ConfigurationError, match="missing 'parameters'"):
+        ComponentFactory(valid_config).create_sweep()
+
+def test_create_walk_forward(valid_config):
+    from optimization import WalkForwardOptimizer
+
+    assert ComponentFactory(valid_config).create_walk_forward() is None
+    valid_config['walk_forward'] = {'train_bars': 100, 'test_bars': 20, 'workers': 1}
+    with pytest.raises(ConfigurationError, match="sweep.parameters"):
+        ComponentFactory(valid_config).create_walk_forward()
+
+    valid_config['sweep'] = {'parameters': {'fast': [5, 10]}, 'rank_by': 'total_return', 'workers': 4}
+    optimizer = ComponentFactory(valid_config).create_walk_forward()
+    assert isinstance(optimizer, WalkForwardOptimizer)
+    assert (optimizer.train_bars, optimizer.test_bars, optimizer.workers) == (100, 20, 1)
+    assert optimizer.rank_by == 'total_return'
+    assert 'walk_forward' not in optimizer.template and 'sweep' not in optimizer.template
+
+    del valid_config['walk_forward']['test_bars']
+    with pytest.raises(ConfigurationError, match="test_bars"):
+        ComponentFactory(valid_config).create_walk_forward()
+
+def test_create_data_source_parquet(valid_config):
+    from data_sources.parquet_source import ParquetDataSource
+
+    valid_config['data_source']['type'] = 'parquet'
+    valid_config['data_source']['root_dir'] = 'store'
+    factory = ComponentFactory(valid_config)
+    ds = factory.create_data_source()
+    assert isinstance(ds, ParquetDataSource)
+    assert ds.root_dir == 'store'
+
+def test_create_data_source_with_fetch_executor(valid_config):
+    from data_sources.executor import ConcurrentFetchExecutor
+
+    valid_config['fetch'] = {'max_workers': 4, 'rate_limit_per_second': 5, 'max_retries': 1}
+    factory = ComponentFactory(valid_config)
+    ds = factory.create_data_source()
+    assert isinstance(ds, ConcurrentFetchExecutor)
+    assert isinstance(ds.source, YFinanceDataSource)
+    assert ds.max_workers == 4
+    assert ds.max_retries == 1
+
+def test_create_data_source_with_cache(valid_config, tmp_path):
+    from data_sources.cached_source import CachedDataSource
+
+    valid_config['cache'] = {'enabled': True, 'ttl_seconds': 60, 'dir': str(tmp_path), 'mode': 'refresh'}
+    factory = ComponentFactory(valid_config)
+    ds = factory.create_data_source()
+    assert isinstance(ds, CachedDataSource)
+    assert isinstance(ds.source, YFinanceDataSource)
+    assert ds.mode == 'refresh'
+
+def test_create_data_source_cache_disabled(valid_config):
+    valid_config['cache'] = {'enabled': False}
+    factory = ComponentFactory(valid_config)
+    assert isinstance(factory.create_data_source(), YFinanceDataSource)
+
+def test_create_indicator_cache(valid_config, tmp_path):
+    from utils.cache import TTLCache
+
+    assert ComponentFactory(valid_config).create_indicator_cache() is None
+
+    valid_config['cache'] = {'enabled': True, 'indicators': True, 'dir': str(tmp_path)}
+    cache = ComponentFactory(valid_config).create_indicator_cache()
+    assert isinstance(cache, TTLCache)
+    assert cache.cache_dir == str(tmp_path / 'indicators')
+
+    valid_config['cache']['mode'] = 'bypass'
+    assert ComponentFactory(valid_config).create_indicator_cache() is None
@@ -5,6 +5,7 @@ from data_sources.csv_source import CSVDataSource
 from data_sources.yfinance_source import YFinanceDataSource
 from core.models import DataFetchConfig
 from core.exceptions import DataFetchError
+from core.abstractions import DataSource
 
 # --- Tests for CSVDataSource ---
 
@@ -90,3 +91,510 @@ def test_yfinance_missing_columns(mock_download):
     
     with pytest.raises(DataFetchError, match="Missing columns"):
         source.fetch_data(config)
+
+# --- Tests for ParquetDataSource ---
+
+@pytest.fixture
+def parquet_store(tmp_path):
+    pytest.importorskip("pyarrow")
+    from data_sources.parquet_source import convert_csv_to_parquet
+
+    dates = pd.date_range("2022-12-28", "2023-01-05", freq="D")
+    csv_df = pd.DataFrame({
+        'date': dates.strftime('%Y-%m-%d'),
+        'open': range(len(dates)),
+        'high': range(len(dates)),
+        'low': range(len(dates)),
+        'close': range(len(dates)),
+        'volume': range(len(dates)),
+        'adj close': range(len(dates)),
+    })
+    csv_path = tmp_path / "ohlcv.csv"
+    csv_df.to_csv(csv_path, index=False)
+
+    root = tmp_path / "store"
+    written = convert_csv_to_parquet(str(csv_path), str(root), "AAPL", "1d", partition_by="year")
+    assert len(written) == 2
+    return str(root)
+
+def test_parquet_fetch_range(parquet_store):
+    from data_sources.parquet_source import ParquetDataSource
+
+    source = ParquetDataSource(parquet_store)
+    config = DataFetchConfig(ticker="AAPL", start_date="2023-01-02", end_date="2023-01-04")
+
+    df = source.fetch_data(config)
+    assert list(df.columns) == ['Open', 'High', 'Low', 'Close', 'Volume']
+    assert isinstance(df.index, pd.DatetimeIndex)
+    assert df.index[0] == pd.Timestamp("2023-01-02")
+    assert df.index[-1] == pd.Timestamp("2023-01-04")
+
+def test_parquet_prunes_partitions(parquet_store):
+    from data_sources.parquet_source import ParquetDataSource
+
+    source = ParquetDataSource(parquet_store)
+    paths = source._select_partitions(DataFetchConfig(ticker="AAPL", start_date="2023-01-02"))
+    assert len(paths) == 1
+    assert "period=2023" in paths[0]
+
+def test_parquet_unknown_ticker(parquet_store):
+    from data_sources.parquet_source import ParquetDataSource
+
+    source = ParquetDataSource(parquet_store)
+    with pytest.raises(DataFetchError, match="No Parquet data"):
+        source.fetch_data(DataFetchConfig(ticker="MSFT"))
+
+# --- Tests for MemoryMappedDataSource ---
+
+@pytest.fixture
+def bar_store(tmp_path):
+    from data_sources.mmap_source import write_mmap_bars
+
+    dates = pd.date_range("2023-01-01", periods=10, freq="D")
+    df = pd.DataFrame({
+        'Open': range(10), 'High': range(10), 'Low': range(10),
+        'Close': [float(i) for i in range(10)], 'Volume': range(10)
+    }, index=dates)
+    write_mmap_bars(df, str(tmp_path), "AAPL", "1d")
+    return str(tmp_path)
+
+def test_mmap_fetch_range(bar_store):
+    import numpy as np
+    from data_sources.mmap_source import MemoryMappedDataSource
+
+    source = MemoryMappedDataSource(bar_store)
+    config = DataFetchConfig(ticker="AAPL", start_date="2023-01-03", end_date="2023-01-05")
+
+    df = source.fetch_data(config)
+    assert list(df['Close']) == [2.0, 3.0, 4.0]
+    assert isinstance(df.index, pd.DatetimeIndex)
+
+    # Columns are views onto the mapped arrays, not copies
+    _, columns = source._open("AAPL", "1d")
+    assert np.shares_memory(df['Close'].to_numpy(), columns['Close'])
+
+def test_mmap_fetch_empty_range(bar_store):
+    from data_sources.mmap_source import MemoryMappedDataSource
+
+    source = MemoryMappedDataSource(bar_store)
+    with pytest.raises(DataFetchError, match="No data found"):
+        source.fetch_data(DataFetchConfig(ticker="AAPL", start_date="2024-01-01"))
+    with pytest.raises(DataFetchError, match="No data found"):
+        source.fetch_data(DataFetchConfig(ticker="AAPL", start_date="2023-01-05", end_date="2023-01-04"))
+
+def test_mmap_reopens_rewritten_series(bar_store):
+    from data_sources.mmap_source import MemoryMappedDataSource, write_mmap_bars
+
+    source = MemoryMappedDataSource(bar_store)
+    before = source.fetch_data(DataFetchConfig(ticker="AAPL"))
+
+    dates = pd.date_range("2023-01-01", periods=12, freq="D")
+    df = pd.DataFrame({col: [100.0 + i for i in range(12)] for col in ['Open', 'High', 'Low', 'Close', 'Volume']}, index=dates)
+    write_mmap_bars(df, bar_store, "AAPL", "1d")
+
+    after = source.fetch_data(DataFetchConfig(ticker="AAPL"))
+    assert len(after) == 12 and after['Close'].iloc[0] == 100.0
+    # Frames mapped before the rewrite keep the old bars.
+    assert list(before['Close']) == [float(i) for i in range(10)]
+
+def test_mmap_unknown_ticker(bar_store):
+    from data_sources.mmap_source import MemoryMappedDataSource
+
+    source = MemoryMappedDataSource(bar_store)
+    with pytest.raises(DataFetchError, match="No binary bar data"):
+        source.fetch_data(DataFetchConfig(ticker="MSFT"))
+
+# --- Tests for incremental YFinanceDataSource fetching ---
+
+class FakeDownloader:
+    """Stand-in for yf.download serving daily bars and recording requested ranges."""
+
+    def __init__(self):
+        self.calls = []
+
+    def __call__(self, ticker, start, end, interval, progress):
+        self.calls.append((start, end))
+        dates = pd.date_range(start, end, freq="D", inclusive="left")
+        return pd.DataFrame({
+            'Open': 1.0, 'High': 1.0, 'Low': 1.0, 'Close': [float(d.day) for d in dates], 'Volume': 1
+        }, index=dates)
+
+def test_bar_store_missing_ranges(tmp_path):
+    from data_sources.bar_store import BarStore
+
+    store = BarStore(str(tmp_path))
+    store.merge("AAPL", "1d", pd.DataFrame(), ("2023-01-05", "2023-01-10"))
+    assert store.missing_ranges("AAPL", "1d", "2023-01-01", "2023-01-15") == [
+        ("2023-01-01", "2023-01-05"), ("2023-01-10", "2023-01-15")
+    ]
+    assert store.missing_ranges("AAPL", "1d", "2023-01-06", "2023-01-09") == []
+
+def test_yfinance_incremental_fetch(tmp_path):
+    from data_sources.bar_store import BarStore
+
+    downloader = FakeDownloader()
+    source = YFinanceDataSource(store=BarStore(str(tmp_path)), downloader=downloader)
+
+    df = source.fetch_data(DataFetchConfig(ticker="AAPL", start_date="2023-01-01", end_date="2023-01-11"))
+    assert len(df) == 10
+    assert downloader.calls == [("2023-01-01", "2023-01-11")]
+
+    # Overlapping request only downloads the uncovered tail
+    df = source.fetch_data(DataFetchConfig(ticker="AAPL", start_date="2023-01-05", end_date="2023-01-20"))
+    assert downloader.calls[-1] == ("2023-01-11", "2023-01-20")
+    assert len(df) == 15
+    assert df.index.is_unique
+    assert df.index.is_monotonic_increasing
+
+    # Fully covered request is served from disk
+    source.fetch_data(DataFetchConfig(ticker="AAPL", start_date="2023-01-02", end_date="2023-01-18"))
+    assert len(downloader.calls) == 2
+
+# --- Tests for batched fetch_many ---
+
+def test_yfinance_fetch_many_splits_tickers():
+    dates = pd.to_datetime(['2023-01-02', '2023-01-03'])
+    fields = ['Open', 'High', 'Low', 'Close', 'Volume']
+    columns = pd.MultiIndex.from_product([['AAPL', 'MSFT', 'BAD'], fields])
+    raw = pd.DataFrame(1.0, index=dates.tz_localize('UTC'), columns=columns)
+    raw['BAD'] = float('nan')
+
+    downloader = MagicMock(return_value=raw)
+    source = YFinanceDataSource(downloader=downloader, chunk_size=10)
+    configs = [DataFetchConfig(ticker=t, start_date="2023-01-01", end_date="2023-01-04") for t in ['AAPL', 'MSFT', 'BAD']]
+
+    result = source.fetch_many(configs)
+    downloader.assert_called_once()
+    assert downloader.call_args.args[0] == ['AAPL', 'MSFT', 'BAD']
+    assert set(result.data) == {'AAPL', 'MSFT'}
+    assert list(result.data['AAPL'].columns) == fields
+    assert result.data['AAPL'].index.tz is None
+    assert isinstance(result.errors['BAD'], DataFetchError)
+
+def test_yfinance_fetch_many_chunks():
+    downloader = MagicMock(side_effect=Exception("rate limited"))
+    source = YFinanceDataSource(downloader=downloader, chunk_size=2)
+    configs = [DataFetchConfig(ticker=t, start_date="2023-01-01", end_date="2023-01-04") for t in 'ABCDE']
+
+    result = source.fetch_many(configs)
+    assert downloader.call_count == 3
+    assert set(result.errors) == set('ABCDE')
+
+def test_csv_fetch_many_multi_ticker(tmp_path):
+    csv_path = tmp_path / "multi.csv"
+    pd.DataFrame({
+        'Date': ['2023-01-01', '2023-01-02', '2023-01-01', '2023-01-02'],
+        'Ticker': ['AAPL', 'AAPL', 'MSFT', 'MSFT'],
+        'Open': [1, 2, 3, 4], 'High': [1, 2, 3, 4], 'Low': [1, 2, 3, 4],
+        'Close': [1, 2, 3, 4], 'Volume': [1, 2, 3, 4],
+    }).to_csv(csv_path, index=False)
+
+    source = CSVDataSource(str(csv_path))
+    configs = [DataFetchConfig(ticker="AAPL"), DataFetchConfig(ticker="MSFT", start_date="2023-01-02"), DataFetchConfig(ticker="TSLA")]
+
+    with patch('data_sources.csv_source.pd.read_csv', wraps=pd.read_csv) as mock_read_csv:
+        result = source.fetch_many(configs)
+        mock_read_csv.assert_called_once()
+
+    assert list(result.data['AAPL']['Close']) == [1, 2]
+    assert list(result.data['MSFT']['Close']) == [4]
+    assert 'Ticker' not in result.data['AAPL'].columns
+    assert 'TSLA' in result.errors
+
+def test_default_fetch_many_collects_errors():
+    source = YFinanceDataSource()
+    with patch.object(source, 'fetch_data', side_effect=[pd.DataFrame({'Close': [1]}), DataFetchError("boom")]):
+        result = DataSource.fetch_many(source, [DataFetchConfig(ticker="A"), DataFetchConfig(ticker="B")])
+    assert list(result.data) == ['A']
+    assert list(result.errors) == ['B']
+
+# --- Tests for ConcurrentFetchExecutor ---
+
+class FakeLatencySource(DataSource):
+    """Local source that sleeps to simulate network latency and fails a set number of times per ticker."""
+
+    def __init__(self, latency=0.05, failures=None, error=ConnectionError):
+        self.latency = latency
+        self.failures = dict(failures or {})
+        self.error = error
+        self.calls = []
+
+    def fetch_data(self, config):
+        import time
+        self.calls.append(config.ticker)
+        time.sleep(self.latency)
+        if self.failures.get(config.ticker, 0) > 0:
+            self.failures[config.ticker] -= 1
+            raise self.error(f"Transient failure for {config.ticker}")
+        return pd.DataFrame({'Close': [1.0]})
+
+class FakeBatchSource(FakeLatencySource):
+    """Source with a native batch API that records each batch."""
+
+    def __init__(self, **kwargs):
+        super().__init__(latency=0, **kwargs)
+        self.batches = []
+
+    def fetch_many(self, configs):
+        self.batches.append([c.ticker for c in configs])
+        return DataSource.fetch_many(self, configs)
+
+class FakeClock:
+    """Clock whose sleep advances time instantly."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.now += seconds
+
+def test_executor_runs_fetches_concurrently():
+    import threading
+    from data_sources.executor import ConcurrentFetchExecutor
+
+    # Every fetch waits until 8 are in flight; fewer workers break the barrier.
+    barrier = threading.Barrier(8, timeout=10)
+
+    class BarrierSource(FakeLatencySource):
+        def fetch_data(self, config):
+            barrier.wait()
+            return super().fetch_data(config)
+
+    executor = ConcurrentFetchExecutor(BarrierSource(latency=0), max_workers=8)
+    result = executor.fetch_many([DataFetchConfig(ticker=f"T{i}") for i in range(16)])
+
+    assert list(result.data) == [f"T{i}" for i in range(16)]
+    assert not result.errors
+    assert executor.fetch_stats.summary()['requests'] == 16
+
+def test_executor_retries_transient_failures():
+    from data_sources.executor import ConcurrentFetchExecutor
+
+    clock = FakeClock()
+    source = FakeLatencySource(latency=0, failures={'AAPL': 2})
+    executor = ConcurrentFetchExecutor(source, max_retries=3, clock=clock, sleep=clock.sleep)
+
+    df = executor.fetch_data(DataFetchConfig(ticker="AAPL"))
+    assert not df.empty
+    assert source.calls.count('AAPL') == 3
+    assert executor.fetch_stats.summary()['retries'] == 2
+
+def test_executor_gives_up_after_max_retries():
+    from data_sources.executor import ConcurrentFetchExecutor
+
+    clock = FakeClock()
+    source = FakeLatencySource(latency=0, failures={'AAPL': 10, 'MSFT': 0})
+    executor = ConcurrentFetchExecutor(source, max_retries=2, clock=clock, sleep=clock.sleep)
+
+    result = executor.fetch_many([DataFetchConfig(ticker="AAPL"), DataFetchConfig(ticker="MSFT")])
+    assert source.calls.count('AAPL') == 3
+    assert isinstance(result.errors['AAPL'], DataFetchError)
+    assert 'MSFT' in result.data
+    assert executor.fetch_stats.summary()['failures'] == 1
+
+def test_executor_does_not_retry_permanent_errors():
+    from data_sources.executor import ConcurrentFetchExecutor
+
+    clock = FakeClock()
+    source = FakeLatencySource(latency=0, failures={'BAD': 10}, error=DataFetchError)
+    executor = ConcurrentFetchExecutor(source, max_retries=3, clock=clock, sleep=clock.sleep)
+
+    with pytest.raises(DataFetchError):
+        executor.fetch_data(DataFetchConfig(ticker="BAD"))
+    assert source.calls == ['BAD']
+    assert clock.now == 0.0
+
+    # A fetch error caused by a network failure is transient
+    def wrapped(config):
+        try:
+            raise TimeoutError("read timed out")
+        except TimeoutError as e:
+            raise DataFetchError("Failed to fetch data") from e
+
+    source.fetch_data = wrapped
+    with pytest.raises(DataFetchError):
+        executor.fetch_data(DataFetchConfig(ticker="SLOW"))
+    assert executor.fetch_stats.summary()['attempts'] == 1 + 4
+
+def test_executor_delegates_to_batching_source():
+    from data_sources.executor import ConcurrentFetchExecutor
+
+    clock = FakeClock()
+    source = FakeBatchSource(failures={'FLAKY': 1, 'BAD': 10})
+    source.error = lambda message: ConnectionError(message) if 'FLAKY' in message else DataFetchError(message)
+    executor = ConcurrentFetchExecutor(source, rate_limit=1, max_retries=3, clock=clock, sleep=clock.sleep)
+
+    tickers = ["AAPL", "FLAKY", "BAD", "MSFT"]
+    result = executor.fetch_many([DataFetchConfig(ticker=t) for t in tickers])
+
+    # One batch, then a retry of the transient failure only
+    assert source.batches == [tickers, ["FLAKY"]]
+    assert list(result.data) == ["AAPL", "FLAKY", "MSFT"]
+    assert isinstance(result.errors['BAD'], DataFetchError)
+    # One token per batch: the retry waited for the second token
+    assert clock.now >= 1.0
+    summary = executor.fetch_stats.summary()
+    assert (summary['requests'], summary['retries'], summary['failures']) == (4, 1, 1)
+
+def test_executor_detects_batching_sources(tmp_path):
+    from data_sources.executor import ConcurrentFetchExecutor
+    from data_sources.bar_store import BarStore
+
+    assert not ConcurrentFetchExecutor(FakeLatencySource()).batches_fetches
+    assert ConcurrentFetchExecutor(FakeBatchSource()).batches_fetches
+    assert YFinanceDataSource().batches_fetches
+    assert not YFinanceDataSource(store=BarStore(str(tmp_path))).batches_fetches
+
+def _yfinance_errors():
+    import requests
+    from curl_cffi.requests import exceptions as curl_exceptions
+    from yfinance.exceptions import YFRateLimitError
+    return [
+        requests.exceptions.ConnectionError("connection reset"),
+        requests.exceptions.Timeout("read timed out"),
+        curl_exceptions.ConnectionError("connection refused"),
+        curl_exceptions.Timeout("operation timed out"),
+        YFRateLimitError(),
+    ]
+
+@pytest.mark.parametrize("error", _yfinance_errors(), ids=lambda e: f"{type(e).__module__.split('.')[0]}-{type(e).__name__}")
+def test_executor_retries_yfinance_network_errors(error):
+    from data_sources.executor import ConcurrentFetchExecutor
+
+    fields = ['Open', 'High', 'Low', 'Close', 'Volume']
+    dates = pd.to_datetime(['2023-01-02', '2023-01-03'])
+    calls = []
+
+    def downloader(tickers, **kwargs):
+        calls.append(tickers)
+        if len(calls) % 2:
+            raise error
+        if isinstance(tickers, str):
+            return pd.DataFrame(1.0, index=dates, columns=fields)
+        return pd.DataFrame(1.0, index=dates, columns=pd.MultiIndex.from_product([tickers, fields]))
+
+    clock = FakeClock()
+    executor = ConcurrentFetchExecutor(YFinanceDataSource(downloader=downloader), max_retries=3, clock=clock, sleep=clock.sleep)
+    configs = [DataFetchConfig(ticker=t, start_date="2023-01-01", end_date="2023-01-04") for t in ['AAPL', 'MSFT']]
+
+    result = executor.fetch_many(configs)
+    assert set(result.data) == {'AAPL', 'MSFT'} and not result.errors
+    assert not executor.fetch_data(configs[0]).empty
+    assert len(calls) == 4
+
+def test_executor_retries_rate_limit_swallowed_by_yf_download():
+    import yfinance as yf
+    from yfinance.exceptions import YFRateLimitError
+    from data_sources.executor import ConcurrentFetchExecutor
+
+    clock = FakeClock()
+    executor = ConcurrentFetchExecutor(YFinanceDataSource(), max_retries=2, clock=clock, sleep=clock.sleep)
+    configs = [DataFetchConfig(ticker=t, start_date="2023-01-01", end_date="2023-01-04") for t in ['AAPL', 'MSFT']]
+
+    # yf.download logs the failure and returns an empty frame
+    with patch.object(yf.Ticker, 'history', side_effect=YFRateLimitError()) as history:
+        result = executor.fetch_many(configs)
+    assert set(result.errors) == {'AAPL', 'MSFT'}
+    assert history.call_count == 2 * 3
+
+    # An unknown ticker is not retried
+    with patch.object(yf.Ticker, 'history', return_value=pd.DataFrame()) as history:
+        result = executor.fetch_many(configs[:1])
+    assert 'AAPL' in result.errors
+    assert history.call_count == 1
+
+def test_executor_does_not_retry_missing_files(tmp_path):
+    from data_sources.executor import ConcurrentFetchExecutor
+
+    clock = FakeClock()
+    source = CSVDataSource(csv_path=str(tmp_path / "missing.csv"))
+    executor = ConcurrentFetchExecutor(source, max_retries=3, clock=clock, sleep=clock.sleep)
+    with pytest.raises(DataFetchError):
+        executor.fetch_data(DataFetchConfig(ticker="AAPL"))
+    assert executor.fetch_stats.summary()['attempts'] == 1
+
+def test_token_bucket_limits_rate():
+    from data_sources.executor import TokenBucket
+
+    clock = FakeClock()
+    bucket = TokenBucket(rate=50, capacity=1, clock=clock, sleep=clock.sleep)
+    waited = [bucket.acquire() for _ in range(6)]
+    # First token is free, the remaining five need 0.02s each at 50/s
+    assert waited[0] == 0.0
+    assert clock.now == pytest.approx(0.1)
+    assert sum(waited) == pytest.approx(0.1)
+
+# --- Tests for CachedDataSource ---
+
+def test_cached_source_hits_and_misses(tmp_path):
+    from data_sources.cached_source import CachedDataSource
+    from utils.cache import TTLCache
+
+    inner = FakeLatencySource(latency=0)
+    source = CachedDataSource(inner, TTLCache(str(tmp_path), ttl_seconds=60))
+    config = DataFetchConfig(ticker="AAPL", start_date="2023-01-01")
+
+    source.fetch_data(config)
+    source.fetch_data(config)
+    assert inner.calls == ["AAPL"]
+    stats = source.stats()['cache']
+    assert (stats['hits'], stats['misses'], stats['mode']) == (1, 1, 'normal')
+    assert stats['store']['memory_hits'] == 1
+
+def test_cached_source_resolves_open_end_date(tmp_path):
+    from datetime import datetime
+    from data_sources.cached_source import CachedDataSource
+    from utils.cache import TTLCache
+
+    source = CachedDataSource(FakeLatencySource(latency=0), TTLCache(str(tmp_path)))
+    today = datetime.now().strftime('%Y-%m-%d')
+    assert source.cache_key(DataFetchConfig(ticker="AAPL")) == source.cache_key(DataFetchConfig(ticker="aapl", end_date=today))
+    assert source.cache_key(DataFetchConfig(ticker="AAPL")) != source.cache_key(DataFetchConfig(ticker="AAPL", end_date="2020-01-01"))
+
+def test_cached_source_refresh_and_bypass(tmp_path):
+    from data_sources.cached_source import CachedDataSource
+    from utils.cache import TTLCache
+
+    cache = TTLCache(str(tmp_path))
+    inner = FakeLatencySource(latency=0)
+    config = DataFetchConfig(ticker="AAPL")
+
+    CachedDataSource(inner, cache).fetch_data(config)
+    CachedDataSource(inner, cache, mode='refresh').fetch_data(config)
+    CachedDataSource(inner, cache, mode='bypass').fetch_data(config)
+    assert len(inner.calls) == 3
+
+    CachedDataSource(inner, cache).fetch_data(config)
+    assert len(inner.calls) == 3
+
+def test_cached_source_fetch_many(tmp_path):
+    from data_sources.cached_source import CachedDataSource
+    from utils.cache import TTLCache
+
+    inner = FakeLatencySource(latency=0, failures={'BAD': 1})
+    source = CachedDataSource(inner, TTLCache(str(tmp_path)))
+    source.fetch_data(DataFetchConfig(ticker="AAPL"))
+
+    result = source.fetch_many([DataFetchConfig(ticker=t) for t in ["AAPL", "MSFT", "BAD"]])
+    assert set(result.data) == {"AAPL", "MSFT"}
+    assert "BAD" in result.errors
+    assert inner.calls.count("AAPL") == 1
+
+def test_cached_source_coalesces_concurrent_fetches(tmp_path):
+    from concurrent.futures import ThreadPoolExecutor
+    from data_sources.cached_source import CachedDataSource
+    from utils.cache import TTLCache
+
+    inner = FakeLatencySource(latency=0.1)
+    source = CachedDataSource(inner, TTLCache(str(tmp_path)))
+    config = DataFetchConfig(ticker="AAPL", start_date="2023-01-01")
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        frames = list(pool.map(lambda _: source.fetch_data(config), range(8)))
+
+    assert len(frames) == 8
+    assert inner.calls == ["AAPL"]
+    assert source.stats()['cache']['misses'] == 1
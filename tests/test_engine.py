@@ -2,8 +2,9 @@ import pytest
 import pandas as pd
 from unittest.mock import MagicMock
 from engine import TradingEngine
-from core.models import DataFetchConfig, AnalysisResult
-from core.exceptions import DataFetchError, IndicatorCalculationError, VisualizationError
+from core.models import DataFetchConfig, AnalysisResult, Signal, SignalType
+from core.exceptions import BacktestError, DataFetchError, IndicatorCalculationError, VisualizationError
+from backtesting import VectorizedBacktester
 
 @pytest.fixture
 def mock_data_source():
@@ -55,3 +56,287 @@ def test_run_visualization_error(engine, mock_visualizer):
     
     with pytest.raises(VisualizationError):
         engine.run(config, "output.png")
+
+def test_run_reports_data_source_stats(engine, mock_data_source):
+    mock_data_source.stats.return_value = {'cache': {'hits': 1, 'misses': 0}}
+    result = engine.run(DataFetchConfig(ticker="AAPL"), "output.png")
+    assert result.metadata['data_source']['cache']['hits'] == 1
+
+def test_run_uses_indicator_cache(mock_data_source, mock_visualizer, tmp_path):
+    from unittest.mock import patch
+    from indicators.moving_averages import SimpleMovingAverage
+    from utils.cache import TTLCache
+
+    mock_data_source.fetch_data.return_value = pd.DataFrame({'Close': [float(i) for i in range(10)]})
+    sma = SimpleMovingAverage(period=3)
+    cache = TTLCache(str(tmp_path), ttl_seconds=60)
+    engine = TradingEngine(mock_data_source, [sma], mock_visualizer, indicator_cache=cache)
+    config = DataFetchConfig(ticker="AAPL")
+
+    # Route SMA through calculate (not the graph) so calls can be counted
+    with patch.object(SimpleMovingAverage, 'node', return_value=None), \
+            patch.object(SimpleMovingAverage, 'calculate', autospec=True, side_effect=lambda self, df: df['Close'].rolling(3).mean()) as calc:
+        first = engine.run(config, "output.png")
+        second = engine.run(config, "output.png")
+        assert calc.call_count == 1
+        pd.testing.assert_series_equal(first.indicators['SMA_3'], second.indicators['SMA_3'])
+        assert second.metadata['indicator_cache']['hits'] >= 1
+
+        # Changed data must never be served a stale result
+        mock_data_source.fetch_data.return_value = pd.DataFrame({'Close': [float(i) * 2 for i in range(10)]})
+        third = engine.run(config, "output.png")
+        assert calc.call_count == 2
+        assert third.indicators['SMA_3'].iloc[-1] == 16.0
+
+        # Different parameters are cached separately
+        engine.indicators = [SimpleMovingAverage(period=4)]
+        engine.run(config, "output.png")
+        assert calc.call_count == 3
+
+def test_indicator_cache_sees_high_low_changes(mock_data_source, mock_visualizer, tmp_path):
+    from indicators.volatility import AverageTrueRange
+    from utils.cache import TTLCache
+
+    close = [10.0] * 5
+    mock_data_source.fetch_data.return_value = pd.DataFrame({'High': [11.0] * 5, 'Low': [9.0] * 5, 'Close': close})
+    cache = TTLCache(str(tmp_path), ttl_seconds=60)
+    engine = TradingEngine(mock_data_source, [AverageTrueRange(period=2)], mock_visualizer, indicator_cache=cache)
+    config = DataFetchConfig(ticker="AAPL")
+
+    first = engine.run(config, "output.png")
+    assert first.indicators['ATR_2'].iloc[-1] == pytest.approx(2.0)
+
+    # Only High/Low change: the cached ATR must not be served
+    mock_data_source.fetch_data.return_value = pd.DataFrame({'High': [13.0] * 5, 'Low': [7.0] * 5, 'Close': close})
+    second = engine.run(config, "output.png")
+    assert second.indicators['ATR_2'].iloc[-1] == pytest.approx(6.0)
+
+def test_run_shares_indicator_intermediates(mock_data_source, mock_visualizer):
+    from indicators.moving_averages import SimpleMovingAverage, ExponentialMovingAverage
+    from indicators.oscillators import RelativeStrengthIndex
+
+    df = pd.DataFrame({'Close': [10.0, 11.0, 10.5, 12.0, 11.5, 13.0, 12.5, 14.0, 13.0, 15.0, float('nan'), 16.0, 15.5, 17.0]})
+    mock_data_source.fetch_data.return_value = df
+    indicators = [
+        SimpleMovingAverage(period=3), SimpleMovingAverage(period=3), SimpleMovingAverage(period=5),
+        ExponentialMovingAverage(period=4), RelativeStrengthIndex(period=3),
+    ]
+    engine = TradingEngine(mock_data_source, indicators, mock_visualizer)
+    result = engine.run(DataFetchConfig(ticker="AAPL"), "output.png")
+
+    # Graph results match the per-indicator pandas implementations
+    for indicator in indicators:
+        pd.testing.assert_series_equal(result.indicators[indicator.name], indicator.calculate(df), check_names=False)
+
+    graph_stats = result.metadata['indicator_graph']
+    assert graph_stats['distinct_indicators'] == 4
+    # Close, its cumsum and NaN count are computed once and shared by both SMAs
+    assert graph_stats['nodes_computed'] < graph_stats['nodes_requested']
+
+def test_run_unpacks_indicator_grid(mock_data_source, mock_visualizer):
+    from indicators.grid import IndicatorGrid
+    from indicators.moving_averages import SimpleMovingAverage
+
+    df = pd.DataFrame({'Close': [float(x) for x in range(1, 31)]})
+    mock_data_source.fetch_data.return_value = df
+    engine = TradingEngine(mock_data_source, [IndicatorGrid(SimpleMovingAverage, [5, 10, 20])], mock_visualizer)
+    result = engine.run(DataFetchConfig(ticker="AAPL"), "output.png")
+
+    assert list(result.indicators) == ["SMA_5", "SMA_10", "SMA_20"]
+    for period in (5, 10, 20):
+        pd.testing.assert_series_equal(
+            result.indicators[f"SMA_{period}"], SimpleMovingAverage(period).calculate(df), check_names=False
+        )
+
+def test_run_numpy_backend(mock_data_source, mock_visualizer):
+    from indicators.moving_averages import SimpleMovingAverage
+    from indicators.oscillators import RelativeStrengthIndex
+
+    df = pd.DataFrame({'Close': [10.0, 11.0, 10.5, 12.0, 11.5, 13.0, 12.5, 14.0, 13.0, 15.0]})
+    mock_data_source.fetch_data.return_value = df
+    indicators = [SimpleMovingAverage(period=3), RelativeStrengthIndex(period=3)]
+    engine = TradingEngine(mock_data_source, indicators, mock_visualizer, indicator_backend="numpy")
+    result = engine.run(DataFetchConfig(ticker="AAPL"), "output.png")
+
+    for indicator in indicators:
+        pd.testing.assert_series_equal(result.indicators[indicator.name], indicator.calculate(df), check_names=False)
+    assert result.metadata['indicator_graph']['backend'] == "numpy:float64"
+    assert result.metadata['indicator_graph']['nodes_requested'] == 0
+
+def test_invalid_indicator_backend(mock_data_source, mock_visualizer):
+    with pytest.raises(ValueError):
+        TradingEngine(mock_data_source, [], mock_visualizer, indicator_backend="gpu")
+
+@pytest.fixture
+def long_history():
+    import numpy as np
+    closes = 100 + np.random.default_rng(5).normal(0, 1, 5000).cumsum()
+    return pd.DataFrame({'Close': closes})
+
+def test_run_parallel_matches_sequential(mock_data_source, mock_visualizer, long_history):
+    from indicators.moving_averages import SimpleMovingAverage, ExponentialMovingAverage
+    from indicators.oscillators import RelativeStrengthIndex
+
+    mock_data_source.fetch_data.return_value = long_history
+    indicators = [SimpleMovingAverage(period=p) for p in (5, 20, 50, 200)]
+    indicators += [ExponentialMovingAverage(period=12), RelativeStrengthIndex(period=14), SimpleMovingAverage(period=20)]
+    config = DataFetchConfig(ticker="AAPL")
+
+    sequential = TradingEngine(mock_data_source, indicators, mock_visualizer).run(config, "output.png")
+    parallel = TradingEngine(mock_data_source, indicators, mock_visualizer, indicator_workers=4).run(config, "output.png")
+
+    assert list(parallel.indicators) == list(sequential.indicators)
+    for name, series in sequential.indicators.items():
+        pd.testing.assert_series_equal(parallel.indicators[name], series)
+    timing = parallel.metadata['indicator_timing']
+    assert timing['workers'] == 4
+    assert set(timing['per_indicator']) == {ind.name for ind in indicators}
+
+def test_run_parallel_reports_first_failure_in_order(mock_data_source, mock_visualizer):
+    first, second = MagicMock(), MagicMock()
+    first.name, second.name = "First", "Second"
+    first.params, second.params = {'id': 1}, {'id': 2}
+    first.node.return_value = second.node.return_value = None
+    first.calculate.side_effect = Exception("first failed")
+    second.calculate.side_effect = Exception("second failed")
+    engine = TradingEngine(mock_data_source, [first, second], mock_visualizer, indicator_workers=2)
+
+    with pytest.raises(IndicatorCalculationError, match="Failed to calculate First"):
+        engine.run(DataFetchConfig(ticker="AAPL"), "output.png")
+
+def test_run_backtests_signals(mock_data_source, mock_indicator, mock_visualizer):
+    strategy = MagicMock()
+    strategy.generate_signals.return_value = [Signal(1, SignalType.BUY, 101)]
+    engine = TradingEngine(mock_data_source, [mock_indicator], mock_visualizer, strategy,
+                           backtester=VectorizedBacktester(initial_capital=1000))
+
+    result = engine.run(DataFetchConfig(ticker="AAPL"), "output.png")
+
+    assert result.backtest.equity.tolist() == pytest.approx([1000, 1000, 1000 * 102 / 101])
+    assert result.metadata["backtest"] is result.backtest.stats
+    assert result.metadata["backtest"]["trades"] == 1
+
+def test_run_backtest_error(mock_data_source, mock_indicator, mock_visualizer):
+    mock_data_source.fetch_data.return_value = pd.DataFrame({'Price': [1.0, 2.0]})
+    mock_indicator.calculate.return_value = pd.Series([1.0, 2.0])
+    engine = TradingEngine(mock_data_source, [mock_indicator], mock_visualizer, MagicMock(),
+                           backtester=VectorizedBacktester())
+
+    with pytest.raises(BacktestError, match="Failed to run backtest"):
+        engine.run(DataFetchConfig(ticker="AAPL"), "output.png")
+
+def test_analyze_skips_fetch_and_render(mock_data_source, mock_indicator, mock_visualizer):
+    engine = TradingEngine(mock_data_source, [mock_indicator], mock_visualizer)
+    result = engine.analyze(pd.DataFrame({'Close': [1.0, 2.0, 3.0]}))
+
+    assert list(result.indicators) == ["TestInd"]
+    assert "indicator_timing" in result.metadata and "ticker" not in result.metadata
+    mock_data_source.fetch_data.assert_not_called()
+    mock_visualizer.render.assert_not_called()
+
+class FileVisualizer:
+    """Picklable visualizer that records the rendered ticker's last close."""
+
+    def render(self, df, indicators, signals, output_path):
+        with open(output_path, 'w') as f:
+            f.write(f"{df['Close'].iloc[-1]} {len(signals)}")
+
+def test_run_many_threads(mock_data_source, mock_indicator, mock_visualizer):
+    engine = TradingEngine(mock_data_source, [mock_indicator], mock_visualizer)
+    configs = [DataFetchConfig(ticker=t) for t in ("A", "B", "C")]
+    results = list(engine.run_many(configs, output_path="{ticker}.png", processes=False))
+
+    assert sorted(r.metadata['ticker'] for r in results) == ["A", "B", "C"]
+    assert all(list(r.indicators) == ["TestInd"] for r in results)
+    paths = sorted(call.args[3] for call in mock_visualizer.render.call_args_list)
+    assert paths == ["A.png", "B.png", "C.png"]
+
+def test_run_many_errors(mock_data_source, mock_indicator, mock_visualizer):
+    frame = pd.DataFrame({'Close': [1.0, 2.0]})
+    mock_data_source.fetch_data.side_effect = lambda c: frame if c.ticker != "BAD" else (_ for _ in ()).throw(DataFetchError("boom"))
+    engine = TradingEngine(mock_data_source, [mock_indicator], mock_visualizer)
+    configs = [DataFetchConfig(ticker=t) for t in ("A", "BAD", "C")]
+
+    outcomes = list(engine.run_many(configs, processes=False, return_exceptions=True))
+    errors = [o for o in outcomes if isinstance(o, Exception)]
+    assert len(outcomes) == 3 and len(errors) == 1
+    assert isinstance(errors[0], DataFetchError) and str(errors[0]) == "BAD: boom"
+
+    with pytest.raises(DataFetchError, match="BAD"):
+        list(engine.run_many(configs, processes=False))
+
+def test_run_many_backpressure(mock_data_source, mock_indicator):
+    pulled = []
+
+    def configs():
+        for i in range(100):
+            pulled.append(i)
+            yield DataFetchConfig(ticker=str(i))
+
+    engine = TradingEngine(mock_data_source, [mock_indicator], None)
+    results = engine.run_many(configs(), fetch_workers=2, compute_workers=1, queue_size=1, processes=False)
+    next(results)
+    # Only what fits into the stages' workers and queues is read ahead.
+    assert len(pulled) <= 2 + 1 + 1 + 2 * 1
+    assert len(list(results)) == 99
+
+def test_run_many_processes(tmp_path):
+    from core.factory import ComponentFactory
+    import indicators  # noqa: F401 - registers the indicators
+
+    csv_path = tmp_path / "multi.csv"
+    dates = pd.date_range("2023-01-01", periods=30).strftime("%Y-%m-%d").tolist()
+    pd.DataFrame({
+        'Date': dates * 2, 'Ticker': ['A'] * 30 + ['B'] * 30,
+        'Open': 1.0, 'High': 1.0, 'Low': 1.0, 'Close': list(range(30)) + list(range(100, 130)), 'Volume': 1,
+    }).to_csv(csv_path, index=False)
+    factory = ComponentFactory({
+        'data_source': {'type': 'csv', 'csv_path': str(csv_path), 'ticker': 'A'},
+        'indicators': [{'name': 'SMA', 'period': 5}], 'visualizer': {'name': 'matplotlib'},
+    })
+    engine = TradingEngine(factory.create_data_source(), factory.create_indicators(), FileVisualizer())
+
+    configs = [DataFetchConfig(ticker=t) for t in ("A", "B")]
+    results = {r.metadata['ticker']: r for r in engine.run_many(configs, str(tmp_path / "{ticker}.txt"), compute_workers=2)}
+
+    assert results['B'].data['Close'].iloc[-1] == 129
+    assert results['B'].indicators['SMA_5'].iloc[-1] == pytest.approx(127)
+    assert (tmp_path / "A.txt").read_text() == "29 0"
+
+def test_run_records_stage_metrics(mock_data_source, mock_indicator, mock_visualizer):
+    exporter = MagicMock()
+    engine = TradingEngine(mock_data_source, [mock_indicator], mock_visualizer, metrics_exporter=exporter, track_memory=True)
+    result = engine.run(DataFetchConfig(ticker="AAPL"), "output.png")
+
+    metrics = result.metadata['metrics']
+    assert list(metrics['stages']) == ['fetch', 'indicators', 'render']
+    assert list(metrics['indicators']) == ['TestInd']
+    for values in (*metrics['stages'].values(), *metrics['indicators'].values()):
+        assert values['wall_seconds'] >= 0 and values['cpu_seconds'] >= 0
+        assert values['peak_memory_bytes'] >= 0
+    assert metrics['memory_tracked'] is True
+    exporter.export.assert_called_once_with(result)
+
+def test_run_many_records_stage_metrics(mock_data_source, mock_indicator, mock_visualizer):
+    exporter = MagicMock()
+    engine = TradingEngine(mock_data_source, [mock_indicator], mock_visualizer, metrics_exporter=exporter)
+    results = list(engine.run_many([DataFetchConfig(ticker="A"), DataFetchConfig(ticker="B")], processes=False))
+
+    for result in results:
+        metrics = result.metadata['metrics']
+        assert list(metrics['stages']) == ['fetch', 'indicators', 'render']
+        assert metrics['stages']['fetch']['peak_memory_bytes'] is None
+    assert exporter.export.call_count == 2
+
+def test_run_profiles_stages(engine, tmp_path):
+    from utils.profiling import StageProfiler
+
+    with StageProfiler(str(tmp_path)) as profiler:
+        engine.profiler = profiler
+        engine.run(DataFetchConfig(ticker="AAPL"), "output.png")
+        engine.run(DataFetchConfig(ticker="AAPL"), "output.png")
+    assert profiler.calls == {'fetch': 2, 'indicators': 2, 'render': 2}
+    profiler.write()
+    assert sorted(p.name for p in tmp_path.iterdir()) == [
+        'allocations.txt', 'fetch.prof', 'indicators.prof', 'render.prof', 'summary.txt',
+    ]
@@ -55,3 +55,218 @@ def test_rsi_missing_column():
     df = pd.DataFrame({'Open': [10]})
     with pytest.raises(IndicatorCalculationError, match="'Close' column missing"):
         rsi.calculate(df)
+
+def test_graph_nodes_deduplicate():
+    from core.graph import GraphEvaluator
+
+    df = pd.DataFrame({'Close': np.linspace(10, 30, 50)})
+    evaluator = GraphEvaluator(df)
+    for period in (5, 10, 20):
+        evaluator.evaluate(SimpleMovingAverage(period=period).node())
+    evaluator.evaluate(SimpleMovingAverage(period=5).node())
+
+    # column + cumsum + nan_count shared, one rolling_mean per distinct period
+    assert evaluator.computed == 3 + 3
+
+def test_graph_rolling_mean_matches_pandas():
+    from core.graph import GraphEvaluator
+
+    values = np.random.default_rng(0).normal(100, 5, 500)
+    values[[10, 11, 200]] = np.nan
+    df = pd.DataFrame({'Close': values})
+    evaluator = GraphEvaluator(df)
+    for period in (1, 2, 14, 50):
+        sma = SimpleMovingAverage(period=period)
+        np.testing.assert_allclose(evaluator.evaluate(sma.node()), sma.calculate(df), rtol=1e-10, equal_nan=True)
+    rsi = RelativeStrengthIndex(period=14)
+    np.testing.assert_allclose(evaluator.evaluate(rsi.node()), rsi.calculate(df), rtol=1e-8, equal_nan=True)
+
+@pytest.fixture
+def noisy_closes():
+    rng = np.random.default_rng(7)
+    closes = 100 + rng.normal(0, 1, 300).cumsum()
+    closes[[40, 41, 150, 299 - 60]] = np.nan
+    return pd.DataFrame({'Close': closes})
+
+@pytest.mark.parametrize("indicator", [
+    SimpleMovingAverage(period=10),
+    ExponentialMovingAverage(period=12),
+    RelativeStrengthIndex(period=14),
+])
+@pytest.mark.parametrize("split", [0, 5, 41, 200])
+def test_streaming_update_matches_calculate(noisy_closes, indicator, split):
+    expected = indicator.calculate(noisy_closes).to_numpy()
+    indicator.init_state(noisy_closes.iloc[:split])
+    streamed = [indicator.update(bar) for _, bar in noisy_closes.iloc[split:].iterrows()]
+    np.testing.assert_allclose(streamed, expected[split:], rtol=1e-9, atol=1e-9)
+
+def test_streaming_missing_close():
+    sma = SimpleMovingAverage(period=3)
+    with pytest.raises(IndicatorCalculationError):
+        sma.init_state(pd.DataFrame({'Open': [1.0, 2.0]}))
+    with pytest.raises(IndicatorCalculationError):
+        sma.update({'Open': 1.0})
+
+@pytest.mark.parametrize("indicator_cls", [SimpleMovingAverage, ExponentialMovingAverage, RelativeStrengthIndex])
+def test_calculate_grid_matches_single_period(noisy_closes, indicator_cls):
+    periods = [1, 2, 5, 14, 70, 200]
+    grid = indicator_cls.calculate_grid(noisy_closes, periods)
+    assert list(grid.columns) == [indicator_cls(period=p).name for p in periods]
+    for p in periods:
+        expected = indicator_cls(period=p).calculate(noisy_closes)
+        np.testing.assert_allclose(grid[f"{indicator_cls(period=p).name}"], expected, rtol=1e-9, atol=1e-9)
+
+def test_ewm_grid_gap_free_matches_pandas():
+    from indicators.kernels import ewm_mean_grid
+    closes = pd.Series(100 + np.random.default_rng(3).normal(0, 1, 500).cumsum())
+    spans = [2, 9, 64, 300]
+    grid = ewm_mean_grid(closes.to_numpy(), spans)
+    for j, span in enumerate(spans):
+        np.testing.assert_allclose(grid[:, j], closes.ewm(span=span, adjust=False).mean(), rtol=1e-10)
+
+def test_rolling_mean_grid_matches_pandas():
+    from indicators.kernels import rolling_mean_grid
+    closes = pd.Series(100 + np.random.default_rng(4).normal(0, 1, 300).cumsum())
+    closes.iloc[[10, 150, 151]] = np.nan
+    windows = [1, 3, 20, 300, 301]
+    for dtype in (np.float64, np.float32):
+        grid = rolling_mean_grid(closes.to_numpy(dtype=dtype), windows)
+        assert grid.shape == (300, len(windows)) and grid.dtype == dtype
+        for j, window in enumerate(windows):
+            np.testing.assert_allclose(grid[:, j], closes.rolling(window).mean(), rtol=1e-5 if dtype == np.float32 else 1e-10)
+
+def test_calculate_grid_invalid_periods(noisy_closes):
+    with pytest.raises(IndicatorCalculationError):
+        SimpleMovingAverage.calculate_grid(noisy_closes, [5, 0])
+    with pytest.raises(IndicatorCalculationError):
+        SimpleMovingAverage.calculate_grid(pd.DataFrame({'Open': [1.0]}), [5])
+
+@pytest.mark.parametrize("indicator", [
+    SimpleMovingAverage(period=1), SimpleMovingAverage(period=20),
+    ExponentialMovingAverage(period=1), ExponentialMovingAverage(period=30),
+    RelativeStrengthIndex(period=2), RelativeStrengthIndex(period=14),
+])
+@pytest.mark.parametrize("length", [0, 5, 300])
+def test_numpy_backend_matches_pandas(noisy_closes, indicator, length):
+    df = noisy_closes.iloc[:length]
+    expected = indicator.calculate(df)
+    result = indicator.calculate_numpy(df)
+    assert result.dtype == np.float64
+    pd.testing.assert_index_equal(result.index, expected.index)
+    np.testing.assert_allclose(result, expected, rtol=1e-9, atol=1e-9)
+
+    result32 = indicator.calculate_numpy(df, dtype="float32")
+    assert result32.dtype == np.float32
+    np.testing.assert_allclose(result32, expected, rtol=1e-4, atol=1e-2)
+
+def test_numpy_backend_missing_column():
+    with pytest.raises(IndicatorCalculationError):
+        RelativeStrengthIndex().calculate_numpy(pd.DataFrame({'Open': [1.0, 2.0]}))
+
+@pytest.fixture
+def op_registry(monkeypatch):
+    """Gives the test its own graph op registry, so ops it registers are dropped afterwards."""
+    from core import graph
+    monkeypatch.setattr(graph, '_OP_REGISTRY', dict(graph._OP_REGISTRY))
+    return graph._OP_REGISTRY
+
+def test_graph_evaluator_computes_shared_node_once_across_threads(op_registry):
+    import threading
+    from concurrent.futures import ThreadPoolExecutor
+    from core import graph
+
+    calls = []
+    barrier = threading.Barrier(8)
+
+    @graph.register_op('test_slow_double')
+    def _slow_double(node, inputs, df):
+        calls.append(node)
+        return inputs[0] * 2
+
+    shared = graph.Node('test_slow_double', (graph.column('Close'),))
+    evaluator = graph.GraphEvaluator(pd.DataFrame({'Close': np.arange(100.0)}))
+
+    def worker(window):
+        barrier.wait()
+        return evaluator.evaluate(graph.rolling_mean(shared, window))
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        results = list(pool.map(worker, range(1, 9)))
+
+    assert len(calls) == 1
+    pd.testing.assert_series_equal(results[0], pd.Series(np.arange(100.0) * 2), check_names=False)
+
+def test_op_registry_fixture_drops_test_ops():
+    from core import graph
+    assert 'test_slow_double' not in graph._OP_REGISTRY
+
+@pytest.fixture
+def ohlc_data():
+    rng = np.random.default_rng(11)
+    close = 1000 + rng.normal(0, 1, 3000).cumsum()
+    close[[10, 1500]] = np.nan
+    spread = rng.uniform(0, 1, 3000)
+    return pd.DataFrame({'High': close + spread, 'Low': close - spread, 'Close': close})
+
+@pytest.mark.parametrize("window", [1, 2, 7, 64, 1000])
+def test_rolling_kernels_match_pandas(ohlc_data, window):
+    from indicators import rolling
+
+    close = ohlc_data['Close']
+    values = close.to_numpy()
+    np.testing.assert_array_equal(rolling.rolling_max(values, window), close.rolling(window).max())
+    np.testing.assert_array_equal(rolling.rolling_min(values, window), close.rolling(window).min())
+    # pandas' online update drifts by ~1e-6 on long series; the block merge does not.
+    np.testing.assert_allclose(rolling.rolling_std(values, window), close.rolling(window).std(), rtol=1e-6, atol=1e-5)
+    np.testing.assert_allclose(rolling.rolling_var(values, window, ddof=0), close.rolling(window).var(ddof=0), rtol=1e-6, atol=1e-5)
+
+def test_rolling_std_is_exact_for_pairs(ohlc_data):
+    from indicators import rolling
+
+    values = ohlc_data['Close'].to_numpy()
+    np.testing.assert_allclose(rolling.rolling_std(values, 2, ddof=0)[1:], np.abs(np.diff(values)) / 2, rtol=1e-12)
+
+def test_true_range_matches_pandas(ohlc_data):
+    from indicators import rolling
+
+    high, low, close = ohlc_data['High'], ohlc_data['Low'], ohlc_data['Close']
+    prev = close.shift()
+    expected = pd.concat([high - low, (high - prev).abs(), (low - prev).abs()], axis=1).max(axis=1)
+    np.testing.assert_allclose(rolling.true_range(high, low, close), expected)
+
+def test_channel_and_volatility_indicators_match_pandas(ohlc_data):
+    from indicators.volatility import BollingerBands, DonchianChannel, AverageTrueRange
+    from indicators.oscillators import StochasticOscillator
+
+    high, low, close = ohlc_data['High'], ohlc_data['Low'], ohlc_data['Close']
+
+    bands = BollingerBands(period=20, num_std=2).calculate(ohlc_data)
+    middle = close.rolling(20).mean()
+    std = close.rolling(20).std(ddof=0)
+    np.testing.assert_allclose(bands['BBANDS_20_middle'], middle, rtol=1e-9)
+    np.testing.assert_allclose(bands['BBANDS_20_upper'], middle + 2 * std, rtol=1e-9)
+    np.testing.assert_allclose(bands['BBANDS_20_lower'], middle - 2 * std, rtol=1e-9)
+
+    channel = DonchianChannel(period=20).calculate(ohlc_data)
+    np.testing.assert_array_equal(channel['DONCHIAN_20_upper'], high.rolling(20).max())
+    np.testing.assert_array_equal(channel['DONCHIAN_20_lower'], low.rolling(20).min())
+
+    stoch = StochasticOscillator(period=14, d_period=3).calculate(ohlc_data)
+    lowest, highest = low.rolling(14).min(), high.rolling(14).max()
+    k = 100 * (close - lowest) / (highest - lowest)
+    np.testing.assert_allclose(stoch['STOCH_14_k'], k, rtol=1e-9)
+    np.testing.assert_allclose(stoch['STOCH_14_d'], k.rolling(3).mean(), rtol=1e-9)
+
+    prev = close.shift()
+    tr = pd.concat([high - low, (high - prev).abs(), (low - prev).abs()], axis=1).max(axis=1)
+    atr = AverageTrueRange(period=14).calculate(ohlc_data)
+    np.testing.assert_allclose(atr, tr.ewm(alpha=1 / 14, adjust=False).mean(), rtol=1e-9)
+
+def test_channel_indicators_missing_columns():
+    from indicators.volatility import DonchianChannel, AverageTrueRange
+
+    df = pd.DataFrame({'Close': [1.0, 2.0, 3.0]})
+    with pytest.raises(IndicatorCalculationError, match="'High', 'Low'"):
+        DonchianChannel(period=2).calculate(df)
+    with pytest.raises(IndicatorCalculationError):
+        AverageTrueRange(period=2).calculate(df)
@@ -0,0 +1,141 @@
+import numpy as np
+import pandas as pd
+import pytest
+from core.exceptions import ConfigurationError
+from optimization import ParameterSweep, WalkForwardOptimizer, expand_grid, render_template
+from optimization.sweep import build_engine, evaluate_config, sweep_template
+
+
+@pytest.fixture
+def sweep_config():
+    return {
+        'data_source': {'type': 'csv', 'ticker': 'TEST'},
+        'indicators': [{'name': 'SMA', 'period': '{fast}'}, {'name': 'SMA', 'period': '{slow}'}],
+        'strategy': {'name': 'sma_crossover', 'fast_ma_name': 'SMA_{fast}', 'slow_ma_name': 'SMA_{slow}'},
+        'visualizer': {'name': 'matplotlib'},
+        'backtest': {'fee_rate': 0.001},
+    }
+
+
+@pytest.fixture
+def prices():
+    rng = np.random.default_rng(11)
+    n = 3000
+    index = pd.date_range("2020-01-01", periods=n, freq="h", tz="UTC")
+    return pd.DataFrame({'Close': 100 * np.exp(rng.normal(0, 0.01, n).cumsum())}, index=index)
+
+
+def test_expand_grid():
+    grid = expand_grid({'fast': [5, 10], 'slow': {'start': 20, 'stop': 40, 'step': 10}})
+    assert len(grid) == 6
+    assert grid[:2] == [{'fast': 5, 'slow': 20}, {'fast': 5, 'slow': 30}]
+    with pytest.raises(ConfigurationError):
+        expand_grid({'fast': []})
+    with pytest.raises(ConfigurationError):
+        expand_grid({'fast': {'start': 1}})
+
+
+def test_render_template(sweep_config):
+    rendered = render_template(sweep_config, {'fast': 5, 'slow': 20})
+    assert rendered['indicators'][0]['period'] == 5
+    assert rendered['strategy']['slow_ma_name'] == 'SMA_20'
+    assert sweep_config['indicators'][0]['period'] == '{fast}'
+    with pytest.raises(ConfigurationError, match="Unknown sweep parameter"):
+        render_template({'period': '{missing}'}, {'fast': 5})
+
+
+def test_sweep_template_applies_overrides():
+    config = {'strategy': {'name': 'a'}, 'sweep': {'parameters': {'x': [1]}, 'overrides': {'strategy': {'name': 'b'}}}}
+    template, sweep_config = sweep_template(config)
+    assert template == {'strategy': {'name': 'b'}}
+    assert sweep_config['parameters'] == {'x': [1]}
+    assert config['strategy'] == {'name': 'a'}
+
+
+def test_sweep_ranks_combinations(sweep_config, prices):
+    sweep = ParameterSweep(sweep_config, {'fast': [5, 10], 'slow': [30, 60]}, workers=1)
+    results = sweep.run(prices)
+
+    assert results['rank'].tolist() == [1, 2, 3, 4]
+    assert results['error'].isna().all()
+    assert results['sharpe_ratio'].is_monotonic_decreasing
+    best = results.iloc[0]
+    expected = evaluate_config(render_template(sweep_config, {'fast': best['fast'], 'slow': best['slow']}), prices)
+    assert best['total_return'] == pytest.approx(expected['total_return'])
+
+
+def test_sweep_reports_failed_combinations(sweep_config, prices):
+    sweep_config['indicators'][0]['name'] = '{name}'
+    results = ParameterSweep(sweep_config, {'name': ['SMA', 'NOPE'], 'fast': [5], 'slow': [30]}, workers=1).run(prices)
+    assert results['name'].tolist() == ['SMA', 'NOPE']
+    assert results['error'].iloc[0] is None
+    assert "not registered" in results['error'].iloc[1]
+
+
+def test_sweep_process_pool_matches_sequential(sweep_config, prices):
+    parameters = {'fast': [5, 10], 'slow': [30, 60]}
+    sequential = ParameterSweep(sweep_config, parameters, workers=1).run(prices)
+    parallel = ParameterSweep(sweep_config, parameters, workers=2).run(prices)
+    pd.testing.assert_frame_equal(parallel, sequential)
+
+
+@pytest.fixture
+def walk_forward(sweep_config):
+    return WalkForwardOptimizer(sweep_config, {'fast': [5, 10], 'slow': [30, 60]},
+                                train_bars=1000, test_bars=500, workers=1)
+
+
+def test_walk_forward_windows(walk_forward):
+    assert walk_forward.windows(2200) == [
+        {'train_start': 0, 'test_start': 1000, 'test_end': 1500},
+        {'train_start': 500, 'test_start': 1500, 'test_end': 2000},
+        {'train_start': 1000, 'test_start': 2000, 'test_end': 2200},
+    ]
+    walk_forward.anchored = True
+    assert [w['train_start'] for w in walk_forward.windows(2200)] == [0, 0, 0]
+    assert walk_forward.windows(1000) == []
+
+
+def test_walk_forward_stitches_test_windows(walk_forward, prices, monkeypatch):
+    from optimization import walk_forward as module
+
+    built = []
+    monkeypatch.setattr(module, 'build_engine', lambda config: built.append(config) or build_engine(config))
+    result = walk_forward.run(prices)
+
+    # Each combination is analyzed once, however many windows use it.
+    assert len(built) == 4
+    assert len(result.windows) == 4 and result.windows['error'].isna().all()
+    assert result.equity.index.equals(prices.index[1000:])
+    assert result.equity.iloc[-1] == pytest.approx(10_000 * (1 + result.returns).prod())
+    for _, window in result.windows.iterrows():
+        window_returns = result.returns.loc[window['test_start']:window['test_end']]
+        assert (1 + window_returns).prod() - 1 == pytest.approx(window['test_total_return'])
+        assert window['train_start'] == prices.index[window['window'] * 500 - 500]
+    assert result.stats['windows'] == 4
+    assert result.stats['total_return'] == pytest.approx(result.equity.iloc[-1] / 10_000 - 1)
+
+
+def test_walk_forward_carries_positions_across_windows(sweep_config, prices):
+    # With one combination the stitched curve is the full-series backtest
+    # from the last train bar: no bar dropped, no cost at window boundaries.
+    optimizer = WalkForwardOptimizer(sweep_config, {'fast': [5], 'slow': [30]}, train_bars=1000, test_bars=500, workers=1)
+    result = optimizer.run(prices)
+
+    engine = build_engine(render_template(sweep_config, {'fast': 5, 'slow': 30}))
+    full = engine.analyze(prices).backtest
+    position = full.positions.to_numpy()
+    expected = engine.backtester.evaluate(prices.iloc[999:], position[999:])
+    # A position is held across at least one window boundary.
+    assert position[[1499, 1999]].any()
+    assert result.equity.iloc[-1] == pytest.approx(expected.equity.iloc[-1])
+    np.testing.assert_allclose(result.returns.iloc[1:], expected.returns.iloc[2:])
+    assert result.windows['test_trades'].sum() == len(expected.trades)
+
+
+def test_walk_forward_process_pool_matches_sequential(walk_forward, prices):
+    sequential = walk_forward.run(prices)
+    walk_forward.workers = 2
+    parallel = walk_forward.run(prices)
+    pd.testing.assert_frame_equal(parallel.windows, sequential.windows)
+    pd.testing.assert_series_equal(parallel.equity, sequential.equity)
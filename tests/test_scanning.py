@@ -0,0 +1,105 @@
+import csv
+import numpy as np
+import pandas as pd
+import pytest
+from core.exceptions import ConfigurationError
+from core.factory import ComponentFactory
+from scanning import ScanWriter, UniverseScanner, read_tickers
+
+
+@pytest.fixture
+def scan_config(tmp_path):
+    rng = np.random.default_rng(5)
+    frames = []
+    for ticker in ('AAA', 'BBB', 'CCC'):
+        close = 100 * np.exp(rng.normal(0, 0.02, 300).cumsum())
+        frames.append(pd.DataFrame({
+            'Date': pd.date_range('2022-01-01', periods=300, freq='D').strftime('%Y-%m-%d'),
+            'Ticker': ticker, 'Open': close, 'High': close, 'Low': close, 'Close': close, 'Volume': 1,
+        }))
+    csv_path = tmp_path / "universe.csv"
+    pd.concat(frames).to_csv(csv_path, index=False)
+    return {
+        'data_source': {'type': 'csv', 'csv_path': str(csv_path)},
+        'indicators': [{'name': 'SMA', 'period': 5}, {'name': 'SMA', 'period': 20}],
+        'strategy': {'name': 'sma_crossover', 'fast_ma_name': 'SMA_5', 'slow_ma_name': 'SMA_20'},
+        'visualizer': {'name': 'matplotlib'},
+        'backtest': {'fee_rate': 0.001},
+    }
+
+
+def test_read_tickers(tmp_path):
+    path = tmp_path / "tickers.txt"
+    path.write_text("# universe\naapl\nMSFT, GOOGL  # big tech\n\nAAPL nvda\n")
+    assert read_tickers(str(path)) == ['AAPL', 'MSFT', 'GOOGL', 'NVDA']
+
+
+def test_scan_rows(scan_config):
+    scanner = UniverseScanner(scan_config, workers=1, chunk_size=2)
+    rows = {row['ticker']: row for row in scanner.scan(['AAA', 'BBB', 'CCC', 'ZZZ'])}
+
+    assert set(rows) == {'AAA', 'BBB', 'CCC', 'ZZZ'}
+    assert 'DataFetchError' in rows['ZZZ']['error']
+
+    row = rows['AAA']
+    assert row['error'] is None
+    assert row['rows'] == 300
+    assert row['last_time'] == pd.Timestamp('2022-10-27')
+    df = pd.read_csv(scan_config['data_source']['csv_path'])
+    close = df.loc[df['Ticker'] == 'AAA', 'Close']
+    assert row['close'] == pytest.approx(close.iloc[-1])
+    assert row['SMA_20'] == pytest.approx(close.iloc[-20:].mean())
+    assert row['signals'] > 0 and row['last_signal'] in ('BUY', 'SELL')
+    assert 'total_return' in row and row['seconds'] >= 0
+
+
+def test_scan_process_pool_matches_sequential(scan_config):
+    tickers = ['AAA', 'BBB', 'CCC', 'ZZZ']
+    drop = lambda row: {k: v for k, v in row.items() if k != 'seconds'}
+    sequential = {r['ticker']: drop(r) for r in UniverseScanner(scan_config, workers=1, chunk_size=1).scan(tickers)}
+    pooled = {r['ticker']: drop(r) for r in UniverseScanner(scan_config, workers=2, chunk_size=1).scan(tickers)}
+    assert pooled == sequential
+
+
+def test_scan_empty_universe(scan_config, tmp_path):
+    from main import run_scan
+
+    assert list(UniverseScanner(scan_config, workers=4).scan([])) == []
+
+    path = tmp_path / "tickers.txt"
+    path.write_text("# nothing to scan\n")
+    with pytest.raises(ConfigurationError, match="no tickers"):
+        run_scan(ComponentFactory(scan_config), scan_config, str(path), None)
+
+
+def test_scan_workers_share_the_fetch_rate_limit(scan_config):
+    from scanning.scanner import _init_worker, _worker
+
+    config = {**scan_config, 'fetch': {'max_workers': 2, 'rate_limit_per_second': 2}}
+    _init_worker(config, workers=4)
+    assert _worker['engine'].data_source.bucket.rate == pytest.approx(0.5)
+    _init_worker(config)
+    assert _worker['engine'].data_source.bucket.rate == pytest.approx(2)
+    assert config['fetch']['rate_limit_per_second'] == 2
+
+
+def test_scan_writer_streams_one_table(tmp_path):
+    path = tmp_path / "scan.csv"
+    with ScanWriter(str(path)) as writer:
+        writer.write({'ticker': 'BAD', 'error': 'boom', 'seconds': 0.1})
+        writer.write({'ticker': 'AAA', 'rows': 3, 'SMA_5': 1.5, 'error': None, 'seconds': 0.2})
+        writer.write({'ticker': 'BBB', 'rows': 3, 'SMA_5': float('nan'), 'error': None, 'seconds': 0.2})
+
+    with open(path) as f:
+        rows = list(csv.DictReader(f))
+    assert [r['ticker'] for r in rows] == ['BAD', 'AAA', 'BBB']
+    assert list(rows[0])[-3:] == ['SMA_5', 'error', 'seconds']
+    assert rows[0]['error'] == 'boom' and rows[1]['SMA_5'] == '1.5' and rows[2]['SMA_5'] == ''
+
+
+def test_create_scanner(scan_config):
+    scan_config['scan'] = {'workers': 3, 'chunk_size': 4}
+    scanner = ComponentFactory(scan_config).create_scanner()
+    assert (scanner.workers, scanner.chunk_size) == (3, 4)
+    with pytest.raises(ConfigurationError):
+        UniverseScanner(scan_config, workers=0)
@@ -0,0 +1,68 @@
+import numpy as np
+import pandas as pd
+import pytest
+from core.models import Signal, SignalBatch, SignalType
+from strategies.sma_crossover import SMACrossoverStrategy
+
+
+def _loop_signals(df, fast_ma, slow_ma, fast_name, slow_name):
+    """Row-by-row reference implementation of the crossover rules."""
+    signals = []
+    for i in range(1, len(df)):
+        curr_fast, curr_slow = fast_ma.iloc[i], slow_ma.iloc[i]
+        prev_fast, prev_slow = fast_ma.iloc[i - 1], slow_ma.iloc[i - 1]
+        if pd.isna(curr_fast) or pd.isna(curr_slow) or pd.isna(prev_fast) or pd.isna(prev_slow):
+            continue
+        if prev_fast <= prev_slow and curr_fast > curr_slow:
+            signals.append(Signal(df.index[i], SignalType.BUY, df['Close'].iloc[i],
+                                  f"Golden Cross: {fast_name} crossed above {slow_name}"))
+        elif prev_fast >= prev_slow and curr_fast < curr_slow:
+            signals.append(Signal(df.index[i], SignalType.SELL, df['Close'].iloc[i],
+                                  f"Death Cross: {fast_name} crossed below {slow_name}"))
+    return signals
+
+
+@pytest.fixture
+def crossing_data():
+    rng = np.random.default_rng(7)
+    n = 2000
+    index = pd.date_range("2020-01-01", periods=n, freq="min")
+    df = pd.DataFrame({'Close': 100 + rng.normal(0, 1, n).cumsum()}, index=index)
+    # Rounded values produce ties (equal averages) around crossings.
+    fast = df['Close'].rolling(5).mean().round(0)
+    slow = df['Close'].rolling(20).mean().round(0)
+    fast.iloc[[300, 301, 900]] = np.nan
+    slow.iloc[[1200]] = np.nan
+    return df, {"SMA_5": fast, "SMA_20": slow}
+
+
+def test_sma_crossover_matches_loop(crossing_data):
+    df, indicators = crossing_data
+    strategy = SMACrossoverStrategy("SMA_5", "SMA_20")
+    expected = _loop_signals(df, indicators["SMA_5"], indicators["SMA_20"], "SMA_5", "SMA_20")
+    signals = strategy.generate_signals(df, indicators)
+    assert len(expected) > 10
+    assert signals == expected
+    assert isinstance(signals, SignalBatch)
+    assert signals.descriptions == ["Golden Cross: SMA_5 crossed above SMA_20", "Death Cross: SMA_5 crossed below SMA_20"]
+
+
+def test_sma_crossover_tie_then_cross():
+    df = pd.DataFrame({'Close': [10.0, 11.0, 12.0, 13.0, 14.0]},
+                      index=pd.date_range("2024-01-01", periods=5, freq="D"))
+    indicators = {
+        "SMA_10": pd.Series([1.0, 2.0, 3.0, 1.5, np.nan], index=df.index),
+        "SMA_50": pd.Series([2.0, 2.0, 2.0, 2.0, 1.0], index=df.index),
+    }
+    signals = SMACrossoverStrategy().generate_signals(df, indicators)
+    assert [(s.timestamp, s.type, s.price) for s in signals] == [
+        (df.index[2], SignalType.BUY, 12.0),
+        (df.index[3], SignalType.SELL, 13.0),
+    ]
+
+
+def test_sma_crossover_missing_or_short_input():
+    strategy = SMACrossoverStrategy()
+    df = pd.DataFrame({'Close': [1.0]})
+    assert strategy.generate_signals(df, {}) == []
+    assert strategy.generate_signals(df, {"SMA_10": df['Close'], "SMA_50": df['Close']}) == []
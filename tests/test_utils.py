@@ -3,6 +3,7 @@ import os
 import time
 import shutil
 import logging
+import pandas as pd
 from utils.cache import TTLCache, cached
 from utils.decorators import register_indicator, register_visualizer, get_indicator_class, get_visualizer_class, _INDICATOR_REGISTRY, _VISUALIZER_REGISTRY
 from utils.logging import setup_logger
@@ -115,3 +116,320 @@ def test_setup_logger_with_file(tmp_path):
     # Verify root logger has file handler
     root_logger = logging.getLogger()
     assert any(isinstance(h, logging.FileHandler) and h.baseFilename == str(log_file) for h in root_logger.handlers)
+
+def test_ttl_cache_memory_tier(cache_dir):
+    cache = TTLCache(cache_dir=cache_dir, ttl_seconds=10, memory_entries=1)
+    cache.set("key1", "value1")
+    assert cache.get("key1") == "value1"
+    assert cache.stats()['memory_hits'] == 1
+
+    # key2 pushes key1 out of the single-slot memory tier; it is then served from disk
+    cache.set("key2", "value2")
+    assert cache.get("key1") == "value1"
+    assert cache.stats()['disk_hits'] == 1
+
+def test_ttl_cache_lru_eviction(cache_dir):
+    cache = TTLCache(cache_dir=cache_dir, ttl_seconds=10, memory_entries=0, max_disk_entries=2)
+    cache.set("a", 1)
+    time.sleep(0.01)
+    cache.set("b", 2)
+    time.sleep(0.01)
+    assert cache.get("a") == 1  # "a" is now more recently used than "b"
+    time.sleep(0.01)
+    cache.set("c", 3)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+    assert cache.stats()['evictions'] == 1
+
+def test_ttl_cache_size_bound(cache_dir):
+    cache = TTLCache(cache_dir=cache_dir, ttl_seconds=10, max_disk_bytes=3000)
+    for i in range(10):
+        cache.set(f"key{i}", b"x" * 1000)
+    total = sum(os.path.getsize(os.path.join(cache_dir, f)) for f in os.listdir(cache_dir) if f.endswith(".pickle"))
+    assert total <= 3000
+    assert cache.stats()['evictions'] > 0
+
+def test_ttl_cache_atomic_write(cache_dir, monkeypatch):
+    import pickle
+    cache = TTLCache(cache_dir=cache_dir, ttl_seconds=10, memory_entries=0)
+    cache.set("key1", "old")
+
+    def failing_dump(*args, **kwargs):
+        raise RuntimeError("crash mid-write")
+
+    monkeypatch.setattr(pickle, "dump", failing_dump)
+    with pytest.raises(RuntimeError):
+        cache.set("key1", "new")
+
+    assert cache.get("key1") == "old"
+    assert [f for f in os.listdir(cache_dir) if not f.startswith(".locks")] == ["key1.pickle"]
+
+def test_ttl_cache_dataframe_is_memory_mapped(cache_dir):
+    import numpy as np
+    import pandas as pd
+
+    df = pd.DataFrame({
+        'Close': np.arange(1000, dtype=float),
+        'Volume': np.arange(1000),
+    }, index=pd.date_range("2020-01-01", periods=1000, freq="min", name="Date"))
+
+    cache = TTLCache(cache_dir=cache_dir, ttl_seconds=10, memory_entries=0)
+    cache.set("frame", df)
+    assert os.path.exists(os.path.join(cache_dir, "frame.frame"))
+
+    result = cache.get("frame")
+    pd.testing.assert_frame_equal(result, df)
+    # Columns are read-only views of the mapped file rather than parsed copies
+    assert not result['Close'].to_numpy().flags.writeable
+
+def test_ttl_cache_compressed_series(cache_dir):
+    import pandas as pd
+
+    series = pd.Series([1.0, 2.0, 3.0], name="SMA_20")
+    cache = TTLCache(cache_dir=cache_dir, ttl_seconds=10, memory_entries=0, compression="zlib")
+    cache.set("series", series)
+    pd.testing.assert_series_equal(cache.get("series"), series)
+
+def test_ttl_cache_pickle_fallback(cache_dir):
+    import pandas as pd
+
+    df = pd.DataFrame({'Ticker': ['AAPL', 'MSFT']})
+    cache = TTLCache(cache_dir=cache_dir, ttl_seconds=10, memory_entries=0)
+    cache.set("objects", df)
+    assert os.path.exists(os.path.join(cache_dir, "objects.pickle"))
+    pd.testing.assert_frame_equal(cache.get("objects"), df)
+
+    # Overwriting with a columnar value removes the stale pickle entry
+    cache.set("objects", pd.DataFrame({'Close': [1.0]}))
+    assert not os.path.exists(os.path.join(cache_dir, "objects.pickle"))
+    assert cache.get("objects")['Close'].iloc[0] == 1.0
+
+def test_ttl_cache_single_flight_threads(cache_dir):
+    import threading
+    from concurrent.futures import ThreadPoolExecutor
+
+    cache = TTLCache(cache_dir=cache_dir, ttl_seconds=10)
+    calls = 0
+    calls_lock = threading.Lock()
+    barrier = threading.Barrier(8)
+
+    def producer():
+        nonlocal calls
+        with calls_lock:
+            calls += 1
+        time.sleep(0.1)
+        return "value"
+
+    def worker(_):
+        barrier.wait()
+        return cache.get_or_compute("shared", producer)
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        results = list(pool.map(worker, range(8)))
+
+    assert results == ["value"] * 8
+    assert calls == 1
+    assert cache.stats()['coalesced'] >= 1
+
+def test_cache_lock_files_are_removed_with_their_entries(tmp_path):
+    from utils.cache import LOCK_DIR
+
+    cache = TTLCache(cache_dir=str(tmp_path), ttl_seconds=10, memory_entries=0, max_disk_entries=5)
+    for i in range(50):
+        cache.get_or_compute(f"key{i}", lambda: i)
+    cache.get_or_compute("nothing", lambda: None)
+    cache.set("last", 1)
+    locks = sorted(os.listdir(tmp_path / LOCK_DIR))
+    assert len(locks) <= 5
+    assert "nothing.lock" not in locks
+
+    cache.delete("last")
+    assert "last.lock" not in os.listdir(tmp_path / LOCK_DIR)
+
+    # A producer may compute another key
+    assert cache.get_or_compute("outer", lambda: cache.get_or_compute("inner", lambda: "value")) == "value"
+
+def test_file_lock_survives_lock_file_deletion(tmp_path):
+    import threading
+    from utils.cache import FileLock
+
+    path = str(tmp_path / "key.lock")
+    holder = FileLock(path)
+    holder.acquire()
+    assert not FileLock(path).acquire(blocking=False)
+
+    # A waiter that opened the file before its holder deleted it must
+    # relock the new file, or two callers would hold the key at once.
+    waiter = FileLock(path)
+    acquired = threading.Event()
+    thread = threading.Thread(target=lambda: (waiter.acquire(), acquired.set()))
+    thread.start()
+    time.sleep(0.05)
+    os.remove(path)
+    holder.release()
+    assert acquired.wait(5)
+    assert os.fstat(waiter._fd).st_ino == os.stat(path).st_ino
+    assert not FileLock(path).acquire(blocking=False)
+    waiter.release()
+    thread.join()
+
+def _single_flight_process_worker(cache_dir, counter_path, start_event):
+    cache = TTLCache(cache_dir=cache_dir, ttl_seconds=10)
+    start_event.wait()
+
+    def producer():
+        with open(counter_path, "a") as f:
+            f.write("x")
+        time.sleep(0.2)
+        return "value"
+
+    assert cache.get_or_compute("shared", producer) == "value"
+
+def test_ttl_cache_single_flight_processes(cache_dir, tmp_path):
+    import multiprocessing
+
+    if "fork" not in multiprocessing.get_all_start_methods():
+        pytest.skip("requires the fork start method")
+    ctx = multiprocessing.get_context("fork")
+    counter_path = str(tmp_path / "calls")
+    TTLCache(cache_dir=cache_dir)
+    start_event = ctx.Event()
+
+    workers = [ctx.Process(target=_single_flight_process_worker, args=(cache_dir, counter_path, start_event)) for _ in range(6)]
+    for p in workers:
+        p.start()
+    start_event.set()
+    for p in workers:
+        p.join(timeout=10)
+
+    assert all(p.exitcode == 0 for p in workers)
+    with open(counter_path) as f:
+        assert f.read() == "x"
+
+def test_frame_fingerprint():
+    import pandas as pd
+    from utils.cache import frame_fingerprint
+
+    index = pd.date_range("2023-01-01", periods=5)
+    df = pd.DataFrame({'Close': [1.0, 2.0, 3.0, 4.0, 5.0]}, index=index)
+    assert frame_fingerprint(df) == frame_fingerprint(df.copy())
+
+    changed = df.copy()
+    changed.iloc[2, 0] = 3.5
+    assert frame_fingerprint(changed) != frame_fingerprint(df)
+
+    shifted = df.copy()
+    shifted.index = index + pd.Timedelta(days=1)
+    assert frame_fingerprint(shifted) != frame_fingerprint(df)
+
+    ohlc = df.assign(High=df['Close'] + 1, Low=df['Close'] - 1)
+    wider = ohlc.assign(High=ohlc['High'] + 1)
+    assert frame_fingerprint(wider) != frame_fingerprint(ohlc)
+
+# --- Tests for utils/shared_frame.py ---
+
+@pytest.mark.parametrize("index", [
+    pd.date_range("2024-03-08", periods=4, freq="D", tz="America/New_York", name="Date"),
+    pd.RangeIndex(4),
+])
+def test_shared_frame_round_trip(index):
+    import numpy as np
+    from utils.shared_frame import SharedFrame
+
+    df = pd.DataFrame({'Close': [1.0, np.nan, 3.0, 4.0], 'Volume': [1, 2, 3, 4], 'Note': list('abcd')}, index=index)
+    with SharedFrame(df) as shared:
+        shm, attached = SharedFrame.attach(shared.handle)
+        pd.testing.assert_frame_equal(attached, df[['Close', 'Volume']].astype(float), check_freq=False, check_index_type=False)
+        assert not attached['Close'].to_numpy().flags.writeable
+        del attached
+        shm.close()
+
+
+def test_metrics_recorder_memory():
+    import numpy as np
+    import tracemalloc
+    from utils.metrics import MetricsRecorder
+
+    with MetricsRecorder(track_memory=True) as recorder:
+        with recorder.measure('stages', 'outer'):
+            with recorder.measure('stages', 'inner'):
+                block = np.ones(1_000_000)  # 8 MB
+                del block
+            small = np.ones(1000)
+    assert not tracemalloc.is_tracing()
+
+    inner, outer = recorder.groups['stages']['inner'], recorder.groups['stages']['outer']
+    assert inner['peak_memory_bytes'] >= 8_000_000
+    # The inner block's peak is still part of the outer one.
+    assert outer['peak_memory_bytes'] >= inner['peak_memory_bytes']
+    assert outer['wall_seconds'] >= inner['wall_seconds'] >= 0
+    assert recorder.as_dict()['memory_tracked'] is True
+
+    with MetricsRecorder() as recorder:
+        with pytest.raises(ValueError):
+            with recorder.measure('stages', 'failing'):
+                raise ValueError("boom")
+    assert recorder.groups['stages']['failing']['peak_memory_bytes'] is None
+
+
+def test_metrics_exporter_requires_export():
+    from utils.metrics import MetricsExporter
+
+    class Incomplete(MetricsExporter):
+        pass
+
+    with pytest.raises(TypeError):
+        Incomplete()
+
+def test_metrics_exporters(tmp_path):
+    import json
+    from core.models import AnalysisResult
+    from utils.metrics import JsonLinesExporter, PrometheusTextExporter
+
+    stage = {'wall_seconds': 0.5, 'cpu_seconds': 0.25, 'peak_memory_bytes': None}
+    result = AnalysisResult(data=pd.DataFrame({'Close': [1.0, 2.0]}), metadata={
+        'ticker': 'AAPL', 'interval': '1d',
+        'metrics': {'stages': {'fetch': stage}, 'indicators': {'SMA_5': {**stage, 'peak_memory_bytes': 64}}, 'memory_tracked': True},
+    })
+
+    jsonl = JsonLinesExporter(str(tmp_path / "runs.jsonl"))
+    jsonl.export(result)
+    jsonl.export(result)
+    records = [json.loads(line) for line in (tmp_path / "runs.jsonl").read_text().splitlines()]
+    assert len(records) == 2
+    assert records[0]['ticker'] == 'AAPL' and records[0]['rows'] == 2
+    assert records[0]['stages']['fetch']['wall_seconds'] == 0.5
+
+    prometheus = PrometheusTextExporter(str(tmp_path / "runs.prom"))
+    prometheus.export(result)
+    prometheus.export(result)
+    text = (tmp_path / "runs.prom").read_text()
+    assert "trading_engine_runs_total 2" in text
+    assert 'trading_engine_stage_wall_seconds_sum{stage="fetch"} 1.0' in text
+    assert 'trading_engine_stage_cpu_seconds_count{stage="fetch"} 2' in text
+    assert 'trading_engine_indicator_peak_memory_bytes{indicator="SMA_5"} 64' in text
+    assert 'stage_peak_memory_bytes' not in text
+
+
+def test_stage_profiler(tmp_path):
+    import pstats
+    from utils.profiling import StageProfiler
+
+    def allocate():
+        return [bytearray(1024) for _ in range(1000)]
+
+    kept = []
+    with StageProfiler(str(tmp_path), top=5) as profiler:
+        for _ in range(2):
+            with profiler.stage('compute'):
+                kept.append(allocate())
+    summary_path = profiler.write()
+
+    assert profiler.calls == {'compute': 2}
+    stats = pstats.Stats(str(tmp_path / "compute.prof"))
+    assert any(func[2] == 'allocate' and values[0] == 2 for func, values in stats.stats.items())
+    assert "=== compute: 2 run(s)" in open(summary_path).read()
+    allocations = (tmp_path / "allocations.txt").read_text()
+    assert "test_utils.py" in allocations.splitlines()[1]
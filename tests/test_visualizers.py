@@ -1,8 +1,10 @@
 import pytest
 import pandas as pd
 from unittest.mock import patch, MagicMock
+import numpy as np
 from visualizers.mpl_visualizer import MatplotlibVisualizer
 from core.exceptions import VisualizationError
+from core.models import Signal, SignalBatch, SignalType
 
 @pytest.fixture
 def sample_data():
@@ -28,7 +30,7 @@ def test_render_success(mock_plot, sample_data, sample_indicators, tmp_path):
     visualizer = MatplotlibVisualizer()
     output_path = str(tmp_path / "chart.png")
     
-    visualizer.render(sample_data, sample_indicators, output_path)
+    visualizer.render(sample_data, sample_indicators, [], output_path)
     
     assert mock_plot.called
     args, kwargs = mock_plot.call_args
@@ -40,10 +42,45 @@ def test_render_success(mock_plot, sample_data, sample_indicators, tmp_path):
     
     assert len(kwargs['addplot']) == 2 # SMA and RSI
 
+@patch('visualizers.mpl_visualizer.mpf.make_addplot')
+@patch('visualizers.mpl_visualizer.mpf.plot')
+def test_render_oscillator_panels(mock_plot, mock_addplot, sample_data, tmp_path):
+    index = sample_data.index
+    indicators = {
+        'SMA_20': pd.Series([100.0] * 5, index=index),
+        'STOCH_14': pd.DataFrame({'%K': [50.0] * 5, '%D': [50.0] * 5}, index=index),
+        'ATR_14': pd.Series([2.0] * 5, index=index),
+        'RSI_14': pd.Series([50.0] * 5, index=index),
+        'RSI_7': pd.Series([50.0] * 5, index=index),
+    }
+    MatplotlibVisualizer().render(sample_data, indicators, [], str(tmp_path / "chart.png"))
+
+    panels = [kwargs['panel'] for _, kwargs in mock_addplot.call_args_list]
+    assert panels == [0, 2, 3, 4, 4]
+    assert mock_plot.call_args.kwargs['panel_ratios'] == (6, 2, 2, 2, 2)
+
 @patch('visualizers.mpl_visualizer.mpf.plot')
 def test_render_failure(mock_plot, sample_data, sample_indicators):
     mock_plot.side_effect = Exception("Plotting error")
     visualizer = MatplotlibVisualizer()
     
     with pytest.raises(VisualizationError, match="Visualization failed"):
-        visualizer.render(sample_data, sample_indicators, "dummy.png")
+        visualizer.render(sample_data, sample_indicators, [], "dummy.png")
+
+@pytest.mark.parametrize("as_batch", [False, True])
+@patch('visualizers.mpl_visualizer.mpf.make_addplot')
+@patch('visualizers.mpl_visualizer.mpf.plot')
+def test_render_signal_markers(mock_plot, mock_addplot, as_batch, sample_data, tmp_path):
+    signals = [
+        Signal(sample_data.index[1], SignalType.BUY, 100.0),
+        Signal(sample_data.index[3], SignalType.SELL, 200.0),
+        Signal(pd.Timestamp('2030-01-01'), SignalType.BUY, 300.0),  # not in the data
+    ]
+    if as_batch:
+        signals = SignalBatch.from_signals(signals)
+    MatplotlibVisualizer().render(sample_data, {}, signals, str(tmp_path / "chart.png"))
+
+    (buy,), _ = mock_addplot.call_args_list[0]
+    (sell,), _ = mock_addplot.call_args_list[1]
+    np.testing.assert_allclose(buy, [np.nan, 99.0, np.nan, np.nan, np.nan])
+    np.testing.assert_allclose(sell, [np.nan, np.nan, np.nan, 202.0, np.nan])
@@ -1,31 +1,253 @@
 import os
 import pickle
+import tempfile
+import zlib
+import threading
 import time
 import functools
 import hashlib
-from typing import Any, Callable, Optional, TypeVar
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, Optional, Sequence, Tuple, TypeVar
+import numpy as np
+import pandas as pd
+from utils import frame_codec
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None  # type: ignore[assignment]
+    import msvcrt
 
 # Generic return type for the cached decorator
 T = TypeVar("T")
 
+CACHE_SUFFIX = ".pickle"
+FRAME_SUFFIX = ".frame"
+CACHE_SUFFIXES = (FRAME_SUFFIX, CACHE_SUFFIX)
+LOCK_DIR = ".locks"
+
+class FileLock:
+    """Exclusive advisory lock on a file, shared across processes.
+
+    Uses `fcntl.flock` on POSIX and `msvcrt.locking` on Windows. The lock is
+    released when the context exits or the holding process dies.
+    """
+
+    def __init__(self, path: str):
+        """Initializes the lock.
+
+        Args:
+            path: Path of the lock file; created if missing.
+        """
+        self.path = path
+        self._fd: Optional[int] = None
+
+    def acquire(self, blocking: bool = True) -> bool:
+        """Takes the lock.
+
+        The lock file may be deleted by its holder (see `TTLCache`), so a
+        lock taken on a file that is no longer at `path` is dropped and
+        taken again on the current file.
+
+        Args:
+            blocking: Wait until the lock is free; otherwise give up at once.
+
+        Returns:
+            bool: Whether the lock is held; always True when blocking.
+        """
+        while True:
+            fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o644)
+            try:
+                if not self._lock(fd, blocking):
+                    os.close(fd)
+                    return False
+                if self._is_current(fd):
+                    self._fd = fd
+                    return True
+            except BaseException:
+                os.close(fd)
+                raise
+            self._unlock(fd)
+
+    @staticmethod
+    def _lock(fd: int, blocking: bool) -> bool:
+        """Locks an open file; returns False if it is held elsewhere and `blocking` is off."""
+        if fcntl is not None:
+            try:
+                fcntl.flock(fd, fcntl.LOCK_EX | (0 if blocking else fcntl.LOCK_NB))
+            except BlockingIOError:
+                return False
+            return True
+        while True:  # pragma: no cover - Windows
+            try:
+                msvcrt.locking(fd, msvcrt.LK_LOCK if blocking else msvcrt.LK_NBLCK, 1)
+                return True
+            except OSError:
+                if not blocking:
+                    return False
+
+    def _is_current(self, fd: int) -> bool:
+        """Returns whether the open file is still the one at `path`."""
+        try:
+            current = os.stat(self.path)
+        except FileNotFoundError:
+            return False
+        opened = os.fstat(fd)
+        return (opened.st_ino, opened.st_dev) == (current.st_ino, current.st_dev)
+
+    @staticmethod
+    def _unlock(fd: int) -> None:
+        """Unlocks and closes an open file."""
+        try:
+            if fcntl is not None:
+                fcntl.flock(fd, fcntl.LOCK_UN)
+            else:  # pragma: no cover - Windows
+                os.lseek(fd, 0, os.SEEK_SET)
+                msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
+        finally:
+            os.close(fd)
+
+    def release(self) -> None:
+        """Releases the lock."""
+        if self._fd is None:
+            return
+        fd, self._fd = self._fd, None
+        self._unlock(fd)
+
+    def __enter__(self) -> "FileLock":
+        self.acquire()
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.release()
+
 class TTLCache:
-    """Time-To-Live (TTL) Cache implementation using file storage."""
+    """Two-tier Time-To-Live (TTL) cache: an in-process LRU in front of a bounded disk store.
+
+    Values are first looked up in a small in-memory LRU, then on disk. Disk
+    entries expire `ttl_seconds` after they were written and, once the store
+    exceeds `max_disk_bytes` or `max_disk_entries`, the least recently used
+    entries are evicted. Each file's mtime records when it was written and
+    its atime when it was last read, so eviction order is shared by every
+    process using the same directory. Writes go to a temporary file that is
+    atomically renamed into place, so a crash never leaves a truncated entry.
+
+    DataFrames and Series with fixed-width columns are stored in the columnar
+    format of `utils.frame_codec` and memory-mapped on read, so a hit costs
+    about a file open rather than a full unpickle. Other values use pickle.
+
+    `get_or_compute` coalesces concurrent misses on the same key: threads in
+    one process wait on an in-process lock, and processes sharing the
+    directory wait on a per-key file lock, so only one caller runs the
+    producer while the rest read its result.
+
+    Values served from the memory tier are the cached objects themselves;
+    callers must not mutate them.
+    """
 
-    def __init__(self, cache_dir: str = ".cache", ttl_seconds: int = 3600):
+    def __init__(
+        self,
+        cache_dir: str = ".cache",
+        ttl_seconds: int = 3600,
+        memory_entries: int = 128,
+        max_disk_bytes: Optional[int] = None,
+        max_disk_entries: Optional[int] = None,
+        columnar: bool = True,
+        compression: Optional[str] = None,
+    ):
         """Initializes the cache.
 
         Args:
             cache_dir: Directory to store cache files.
             ttl_seconds: Time to live in seconds.
+            memory_entries: Capacity of the in-process LRU tier (0 disables it).
+            max_disk_bytes: Size bound of the disk tier, or None for unbounded.
+            max_disk_entries: Entry bound of the disk tier, or None for unbounded.
+            columnar: Store DataFrames/Series in the memory-mappable columnar format.
+            compression: Optional columnar compression ('zlib'). Compressed
+                entries are smaller but decompressed rather than mapped on read.
         """
         self.cache_dir = cache_dir
         self.ttl_seconds = ttl_seconds
-        if not os.path.exists(cache_dir):
-            os.makedirs(cache_dir)
+        self.memory_entries = memory_entries
+        self.max_disk_bytes = max_disk_bytes
+        self.max_disk_entries = max_disk_entries
+        self.columnar = columnar
+        self.compression = compression
+        self._init_process_state()
+        os.makedirs(os.path.join(cache_dir, LOCK_DIR), exist_ok=True)
 
-    def _get_cache_path(self, key: str) -> str:
+    def _init_process_state(self) -> None:
+        """Creates the memory tier, locks and statistics, which are never shared between processes."""
+        self._memory: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats = {'memory_hits': 0, 'disk_hits': 0, 'misses': 0, 'evictions': 0, 'expirations': 0, 'coalesced': 0}
+        # Per-key in-process locks and the number of threads using each.
+        self._key_locks: Dict[str, Tuple[threading.Lock, int]] = {}
+
+    def _get_cache_path(self, key: str, suffix: str = CACHE_SUFFIX) -> str:
         """Generates the file path for a cache key."""
-        return os.path.join(self.cache_dir, f"{key}.pickle")
+        return os.path.join(self.cache_dir, f"{key}{suffix}")
+
+    def _get_lock_path(self, key: str) -> str:
+        """Generates the lock file path for a cache key."""
+        return os.path.join(self.cache_dir, LOCK_DIR, f"{key}.lock")
+
+    def _count(self, stat: str, n: int = 1) -> None:
+        """Increments a statistics counter."""
+        with self._lock:
+            self._stats[stat] += n
+
+    def _remember(self, key: str, written_at: float, value: Any) -> None:
+        """Puts a value into the memory tier, evicting the least recently used entry if full."""
+        if self.memory_entries <= 0:
+            return
+        with self._lock:
+            self._memory[key] = (written_at, value)
+            self._memory.move_to_end(key)
+            while len(self._memory) > self.memory_entries:
+                self._memory.popitem(last=False)
+
+    def _get_memory(self, key: str) -> Optional[Any]:
+        """Looks a key up in the memory tier."""
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is None:
+                return None
+            written_at, value = entry
+            if time.time() - written_at > self.ttl_seconds:
+                del self._memory[key]
+                return None
+            self._memory.move_to_end(key)
+            self._stats['memory_hits'] += 1
+            return value
+
+    def _read_disk(self, path: str) -> Any:
+        """Deserializes a disk entry.
+
+        Raises:
+            EOFError, pickle.UnpicklingError, ValueError, zlib.error: If the entry is unreadable.
+        """
+        if path.endswith(FRAME_SUFFIX):
+            return frame_codec.decode(path)
+        with open(path, "rb") as f:
+            return pickle.load(f)
+
+    def _write_disk(self, path: str, value: Any) -> None:
+        """Serializes a value into a temporary file and atomically renames it to `path`."""
+        fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, prefix=".tmp-")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                if path.endswith(FRAME_SUFFIX):
+                    frame_codec.encode(value, f, self.compression)
+                else:
+                    pickle.dump(value, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
 
     def get(self, key: str) -> Optional[Any]:
         """Retrieves a value from the cache if valid.
@@ -36,21 +258,49 @@ class TTLCache:
         Returns:
             The cached value or None if not found or expired.
         """
-        path = self._get_cache_path(key)
-        if not os.path.exists(path):
+        return self._get(key, count_miss=True)
+
+    def _get(self, key: str, count_miss: bool) -> Optional[Any]:
+        """Looks a key up in the memory tier, then on disk."""
+        value = self._get_memory(key)
+        if value is not None:
+            return value
+
+        for suffix in CACHE_SUFFIXES:
+            path = self._get_cache_path(key, suffix)
+            try:
+                stat = os.stat(path)
+                break
+            except FileNotFoundError:
+                continue
+        else:
+            if count_miss:
+                self._count('misses')
             return None
 
         # Check TTL
-        mtime = os.path.getmtime(path)
-        if time.time() - mtime > self.ttl_seconds:
+        if time.time() - stat.st_mtime > self.ttl_seconds:
+            if count_miss:
+                self._count('misses')
             return None
 
         try:
-            with open(path, "rb") as f:
-                return pickle.load(f)
-        except (EOFError, pickle.UnpicklingError):
+            value = self._read_disk(path)
+        except (FileNotFoundError, EOFError, pickle.UnpicklingError, ValueError, zlib.error):
+            if count_miss:
+                self._count('misses')
             return None
 
+        # Record the access time for LRU eviction, keeping mtime for the TTL.
+        try:
+            os.utime(path, (time.time(), stat.st_mtime))
+        except OSError:
+            pass
+
+        self._count('disk_hits')
+        self._remember(key, stat.st_mtime, value)
+        return value
+
     def set(self, key: str, value: Any) -> None:
         """Sets a value in the cache.
 
@@ -58,18 +308,213 @@ class TTLCache:
             key: The cache key.
             value: The value to cache.
         """
-        path = self._get_cache_path(key)
-        with open(path, "wb") as f:
-            pickle.dump(value, f)
+        use_columnar = self.columnar and frame_codec.can_encode(value)
+        suffix = FRAME_SUFFIX if use_columnar else CACHE_SUFFIX
+        self._write_disk(self._get_cache_path(key, suffix), value)
 
-def cached(ttl_seconds: int = 3600, cache_dir: str = ".cache") -> Callable[[Callable[..., T]], Callable[..., T]]:
+        # A previous value of another kind must not shadow the new one.
+        stale_suffix = CACHE_SUFFIX if use_columnar else FRAME_SUFFIX
+        try:
+            os.remove(self._get_cache_path(key, stale_suffix))
+        except FileNotFoundError:
+            pass
+
+        self._remember(key, time.time(), value)
+        self._enforce_limits()
+
+    def delete(self, key: str) -> None:
+        """Removes a key from both tiers.
+
+        Args:
+            key: The cache key.
+        """
+        with self._lock:
+            self._memory.pop(key, None)
+        for suffix in CACHE_SUFFIXES:
+            try:
+                os.remove(self._get_cache_path(key, suffix))
+            except FileNotFoundError:
+                pass
+        self._discard_lock(key)
+
+    @contextmanager
+    def _key_lock(self, key: str) -> Iterator[None]:
+        """Holds the in-process and cross-process locks of a key."""
+        with self._lock:
+            lock, users = self._key_locks.get(key, (threading.Lock(), 0))
+            self._key_locks[key] = (lock, users + 1)
+        try:
+            with lock, FileLock(self._get_lock_path(key)):
+                yield
+        finally:
+            with self._lock:
+                lock, users = self._key_locks[key]
+                if users == 1:
+                    del self._key_locks[key]
+                else:
+                    self._key_locks[key] = (lock, users - 1)
+
+    def _discard_lock(self, key: str) -> None:
+        """Deletes a key's lock file unless a thread or process holds it.
+
+        The file is only deleted while locked, and `FileLock.acquire` retries
+        on a lock file deleted under it, so waiters never end up holding
+        locks on different files.
+        """
+        path = self._get_lock_path(key)
+        if not os.path.exists(path):
+            return
+        lock = FileLock(path)
+        if not lock.acquire(blocking=False):
+            return
+        try:
+            os.remove(path)
+        except OSError:  # pragma: no cover - open files cannot be deleted on Windows
+            pass
+        finally:
+            lock.release()
+
+    def get_or_compute(self, key: str, producer: Callable[[], T]) -> T:
+        """Returns the cached value of a key, computing it at most once across concurrent callers.
+
+        Args:
+            key: The cache key.
+            producer: Computes the value on a miss. Its result is cached
+                unless it is None.
+
+        Returns:
+            The cached or freshly computed value.
+        """
+        value = self.get(key)
+        if value is not None:
+            return value
+
+        with self._key_lock(key):
+            # Another thread or process may have produced the value while we waited.
+            value = self._get(key, count_miss=False)
+            if value is not None:
+                self._count('coalesced')
+                return value
+
+            value = producer()
+            if value is not None:
+                self.set(key, value)
+            return value
+
+    def _enforce_limits(self) -> None:
+        """Removes expired disk entries, evicts least recently used ones over the bounds, and drops unused lock files."""
+        now = time.time()
+        entries = []
+        for entry in os.scandir(self.cache_dir):
+            if not entry.name.endswith(CACHE_SUFFIXES):
+                continue
+            try:
+                stat = entry.stat()
+            except FileNotFoundError:
+                continue
+            if now - stat.st_mtime > self.ttl_seconds:
+                self._remove_file(entry.path, 'expirations')
+                continue
+            entries.append((max(stat.st_atime, stat.st_mtime), stat.st_size, entry.path))
+
+        entries.sort()
+        total_bytes = sum(size for _, size, _ in entries)
+        while entries and (
+            (self.max_disk_bytes is not None and total_bytes > self.max_disk_bytes)
+            or (self.max_disk_entries is not None and len(entries) > self.max_disk_entries)
+        ):
+            _, size, path = entries.pop(0)
+            self._remove_file(path, 'evictions')
+            total_bytes -= size
+
+        # Lock files of evicted or expired entries, and of keys whose
+        # producer returned None, would otherwise accumulate.
+        live = {os.path.splitext(os.path.basename(path))[0] for _, _, path in entries}
+        for entry in os.scandir(os.path.join(self.cache_dir, LOCK_DIR)):
+            key = entry.name[:-len(".lock")]
+            if entry.name.endswith(".lock") and key not in live:
+                self._discard_lock(key)
+
+    def _remove_file(self, path: str, stat: str) -> None:
+        """Deletes a disk entry and its memory-tier copy, counting it under `stat`."""
+        key = os.path.splitext(os.path.basename(path))[0]
+        with self._lock:
+            self._memory.pop(key, None)
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            return
+        self._count(stat)
+
+    def __getstate__(self) -> Dict[str, Any]:
+        """Pickles the settings only, so a cache can be handed to worker processes.
+
+        The copy shares the disk tier (and its file locks) and starts with an
+        empty memory tier and zeroed statistics.
+        """
+        state = self.__dict__.copy()
+        for name in ('_memory', '_lock', '_stats', '_key_locks'):
+            del state[name]
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self._init_process_state()
+
+    def stats(self) -> Dict[str, int]:
+        """Returns hit, miss and eviction counters.
+
+        Returns:
+            Dict[str, int]: Counters for memory hits, disk hits, misses,
+            LRU evictions, TTL expirations and requests coalesced onto
+            another caller's computation.
+        """
+        with self._lock:
+            stats = dict(self._stats)
+        stats['hits'] = stats['memory_hits'] + stats['disk_hits']
+        return stats
+
+# Columns indicators read; all of them go into the fingerprint.
+PRICE_COLUMNS = ('Open', 'High', 'Low', 'Close', 'Volume')
+
+def frame_fingerprint(df: pd.DataFrame, columns: Sequence[str] = PRICE_COLUMNS) -> str:
+    """Computes a content fingerprint of a price frame.
+
+    Combines the length, the index bounds, and a checksum of the index and
+    of every present column in `columns`, so any change to the data an
+    indicator can read yields a different fingerprint. Hashing runs at
+    memory bandwidth and is negligible next to indicator computation.
+
+    Args:
+        df: The market data.
+        columns: The value columns to checksum; missing ones are skipped.
+
+    Returns:
+        str: A hex digest.
+    """
+    h = hashlib.blake2b(digest_size=16)
+    h.update(f"{len(df)}|{df.index[0] if len(df) else ''}|{df.index[-1] if len(df) else ''}".encode('utf-8'))
+    if isinstance(df.index, pd.DatetimeIndex):
+        h.update(np.ascontiguousarray(df.index.asi8).data)
+    else:
+        h.update(pd.util.hash_pandas_object(df.index, index=False).to_numpy().data)
+    for column in columns:
+        if column in df.columns:
+            h.update(column.encode('utf-8'))
+            h.update(np.ascontiguousarray(df[column].to_numpy(dtype='float64', na_value=np.nan)).data)
+    return h.hexdigest()
+
+def cached(ttl_seconds: int = 3600, cache_dir: str = ".cache", **cache_options: Any) -> Callable[[Callable[..., T]], Callable[..., T]]:
     """Decorator to cache function results.
 
     Args:
         ttl_seconds: Time to live in seconds.
         cache_dir: Directory to store cache files.
+        **cache_options: Extra `TTLCache` options such as `max_disk_bytes`.
     """
     def decorator(func: Callable[..., T]) -> Callable[..., T]:
+        cache = TTLCache(cache_dir, ttl_seconds, **cache_options)
+
         @functools.wraps(func)
         def wrapper(*args: Any, **kwargs: Any) -> T:
             # Check for skip cache flag
@@ -84,14 +529,8 @@ def cached(ttl_seconds: int = 3600, cache_dir: str = ".cache") -> Callable[[Call
             key_string = "|".join(key_parts)
             key = hashlib.md5(key_string.encode('utf-8')).hexdigest()
 
-            cache = TTLCache(cache_dir, ttl_seconds)
-            cached_result = cache.get(key)
-
-            if cached_result is not None:
-                return cached_result  # type: ignore[return-value]
+            return cache.get_or_compute(key, lambda: func(*args, **kwargs))
 
-            result = func(*args, **kwargs)
-            cache.set(key, result)
-            return result
+        wrapper.cache = cache  # type: ignore[attr-defined]
         return wrapper
     return decorator
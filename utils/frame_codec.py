@@ -0,0 +1,203 @@
+"""Columnar binary encoding of DataFrames and Series that can be memory-mapped on read.
+
+File layout::
+
+    MAGIC (8 bytes) | header length (uint64, little-endian) | JSON header | arrays...
+
+Every array starts at a 64-byte aligned offset recorded in the header, so
+uncompressed columns are read back as read-only `np.memmap` views with no
+parsing or copying. Compressed arrays (zlib) are decompressed on read.
+"""
+import json
+import struct
+import zlib
+import numpy as np
+import pandas as pd
+from typing import Any, BinaryIO, Dict, List, Optional, Tuple, Union
+
+MAGIC = b"TEFRAME1"
+ALIGNMENT = 64
+COMPRESSIONS = (None, "zlib")
+SERIES_COLUMN = "__values__"
+
+PandasValue = Union[pd.DataFrame, pd.Series]
+
+
+def _is_encodable_array(values: np.ndarray) -> bool:
+    """Returns True for fixed-width dtypes that round-trip through raw bytes."""
+    return values.dtype.kind in "biufcmM" and not values.dtype.hasobject
+
+
+def _index_arrays(index: pd.Index) -> Optional[Tuple[Dict[str, Any], Optional[np.ndarray]]]:
+    """Describes an index and returns its backing array, or None if unsupported."""
+    if isinstance(index, pd.RangeIndex):
+        return {'kind': 'range', 'start': index.start, 'stop': index.stop, 'step': index.step, 'name': index.name}, None
+    if isinstance(index, pd.MultiIndex):
+        return None
+    if isinstance(index, pd.DatetimeIndex):
+        # Timezone-aware indexes are stored as naive UTC plus the zone name.
+        tz = str(index.tz) if index.tz is not None else None
+        naive = index.tz_convert(None) if tz else index
+        meta = {'kind': 'datetime', 'name': index.name, 'tz': tz, 'freq': index.freqstr}
+        return meta, naive.to_numpy()
+    values = index.to_numpy()
+    if not _is_encodable_array(values):
+        return None
+    return {'kind': 'array', 'name': index.name}, values
+
+
+def can_encode(value: Any) -> bool:
+    """Returns True if `value` can be stored in the columnar format.
+
+    Args:
+        value: The value to check.
+
+    Returns:
+        bool: True for DataFrames/Series with fixed-width columns, string or
+        None names, and a non-MultiIndex index.
+    """
+    if isinstance(value, pd.Series):
+        if not isinstance(value.name, (str, type(None))):
+            return False
+        frame = value.to_frame(name=SERIES_COLUMN)
+    elif isinstance(value, pd.DataFrame):
+        frame = value
+    else:
+        return False
+    if isinstance(frame.columns, pd.MultiIndex) or not frame.columns.is_unique:
+        return False
+    if not all(isinstance(c, str) or c is None for c in frame.columns):
+        return False
+    if _index_arrays(frame.index) is None:
+        return False
+    if not isinstance(frame.index.name, (str, type(None))):
+        return False
+    return all(_is_encodable_array(frame[c].to_numpy()) for c in frame.columns)
+
+
+def encode(value: PandasValue, f: BinaryIO, compression: Optional[str] = None) -> None:
+    """Writes a DataFrame or Series in the columnar format.
+
+    Args:
+        value: The value to encode; must satisfy `can_encode`.
+        f: A binary file opened for writing, positioned at its start.
+        compression: None for memory-mappable raw arrays, or 'zlib'.
+
+    Raises:
+        ValueError: If the value or compression is unsupported.
+    """
+    if compression not in COMPRESSIONS:
+        raise ValueError(f"Unsupported compression '{compression}', expected one of {COMPRESSIONS}")
+    if not can_encode(value):
+        raise ValueError("Value cannot be stored in the columnar format")
+
+    is_series = isinstance(value, pd.Series)
+    frame = value.to_frame(name=SERIES_COLUMN) if is_series else value
+    index_meta, index_values = _index_arrays(frame.index)  # type: ignore[misc]
+
+    arrays: List[Tuple[Dict[str, Any], np.ndarray]] = []
+    if index_values is not None:
+        arrays.append((index_meta, index_values))
+    columns_meta = []
+    for name in frame.columns:
+        meta: Dict[str, Any] = {'name': name}
+        columns_meta.append(meta)
+        arrays.append((meta, frame[name].to_numpy()))
+
+    payloads = []
+    for meta, values in arrays:
+        raw = np.ascontiguousarray(values).tobytes()
+        meta['dtype'] = values.dtype.str
+        meta['length'] = len(values)
+        payloads.append(zlib.compress(raw) if compression else raw)
+
+    header: Dict[str, Any] = {
+        'kind': 'series' if is_series else 'frame',
+        'series_name': value.name if is_series else None,
+        'compression': compression,
+        'index': index_meta,
+        'columns': columns_meta,
+    }
+
+    # Offsets depend on the header length and vice versa: grow the reserved
+    # header length until the encoded header fits in it.
+    def layout(header_len: int) -> int:
+        offset = len(MAGIC) + 8 + header_len
+        for (meta, _), payload in zip(arrays, payloads):
+            offset += -offset % ALIGNMENT
+            meta['offset'] = offset
+            meta['nbytes'] = len(payload)
+            offset += len(payload)
+        return offset
+
+    header_len = 0
+    while True:
+        layout(header_len)
+        encoded = json.dumps(header).encode('utf-8')
+        if len(encoded) <= header_len:
+            encoded = encoded.ljust(header_len)
+            break
+        header_len = len(encoded) + 64
+
+    f.write(MAGIC)
+    f.write(struct.pack("<Q", header_len))
+    f.write(encoded)
+    for (meta, _), payload in zip(arrays, payloads):
+        f.write(b"\0" * (meta['offset'] - f.tell()))
+        f.write(payload)
+
+
+def _read_array(path: str, meta: Dict[str, Any], compression: Optional[str]) -> np.ndarray:
+    """Maps (or decompresses) one stored array."""
+    dtype = np.dtype(meta['dtype'])
+    if meta['length'] == 0:
+        return np.empty(0, dtype=dtype)
+    if compression:
+        with open(path, "rb") as f:
+            f.seek(meta['offset'])
+            raw = zlib.decompress(f.read(meta['nbytes']))
+        return np.frombuffer(raw, dtype=dtype)
+    # A plain ndarray view keeps the mapping alive without leaking the memmap subclass into pandas.
+    return np.asarray(np.memmap(path, dtype=dtype, mode='r', offset=meta['offset'], shape=(meta['length'],)))
+
+
+def decode(path: str) -> PandasValue:
+    """Reads a file written by `encode`.
+
+    Uncompressed columns are read-only memory-mapped views of the file.
+
+    Args:
+        path: Path of the encoded file.
+
+    Returns:
+        The decoded DataFrame or Series.
+
+    Raises:
+        ValueError: If the file is not in the columnar format.
+    """
+    with open(path, "rb") as f:
+        if f.read(len(MAGIC)) != MAGIC:
+            raise ValueError(f"{path} is not a columnar frame file")
+        (header_len,) = struct.unpack("<Q", f.read(8))
+        header = json.loads(f.read(header_len))
+
+    compression = header['compression']
+    index_meta = header['index']
+    if index_meta['kind'] == 'range':
+        index: pd.Index = pd.RangeIndex(index_meta['start'], index_meta['stop'], index_meta['step'], name=index_meta['name'])
+    elif index_meta['kind'] == 'datetime':
+        index = pd.DatetimeIndex(_read_array(path, index_meta, compression), name=index_meta['name'])
+        if index_meta['tz']:
+            index = index.tz_localize('UTC').tz_convert(index_meta['tz'])
+        if index_meta.get('freq'):
+            # Setting a freq validates it against the whole index; only frames
+            # that carried one (e.g. built with date_range) pay for this.
+            index.freq = index_meta['freq']
+    else:
+        index = pd.Index(_read_array(path, index_meta, compression), name=index_meta['name'], copy=False)
+
+    data = {meta['name']: _read_array(path, meta, compression) for meta in header['columns']}
+    frame = pd.DataFrame(data, index=index, copy=False)
+    if header['kind'] == 'series':
+        return frame.iloc[:, 0].rename(header['series_name'])
+    return frame
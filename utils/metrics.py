@@ -0,0 +1,264 @@
+"""Wall time, CPU time and peak memory of pipeline stages, and their export.
+
+`MetricsRecorder.measure` times a block of code. Memory is measured with
+`tracemalloc` (Python and NumPy allocations) and only when requested, since
+tracing slows allocation-heavy code down noticeably. The reported figure is
+the peak of traced memory during the block minus the traced memory when it
+started. `tracemalloc` has one global peak, so blocks that run concurrently
+(e.g. indicators on several threads) each see the other's allocations too.
+
+Exporters write the metrics of each run for aggregation across many runs:
+`JsonLinesExporter` appends one JSON object per run, `PrometheusTextExporter`
+keeps running totals and rewrites a file in the Prometheus text exposition
+format (e.g. for the node_exporter textfile collector).
+"""
+import json
+import os
+import tempfile
+import threading
+import time
+import tracemalloc
+from abc import ABC, abstractmethod
+from collections import defaultdict
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterator, List, Tuple
+
+if TYPE_CHECKING:
+    from core.models import AnalysisResult
+
+# Metrics of one measured block, as stored in `AnalysisResult.metadata`.
+Metrics = Dict[str, Any]
+
+# Blocks being measured with memory tracking, across all recorders of the
+# process: they share tracemalloc's single peak.
+_open: List["_Measurement"] = []
+_open_lock = threading.Lock()
+
+
+class _Measurement:
+    """Memory bookkeeping of one open block."""
+
+    __slots__ = ('start', 'peak')
+
+    def __init__(self, start: int):
+        self.start = start
+        self.peak = start
+
+
+class MetricsRecorder:
+    """Measures blocks of code into named groups of metrics.
+
+    Example:
+        with MetricsRecorder(track_memory=True) as recorder:
+            with recorder.measure('stages', 'fetch'):
+                df = fetch()
+        recorder.as_dict()  # {'stages': {'fetch': {'wall_seconds': ...}}, ...}
+    """
+
+    def __init__(self, track_memory: bool = False):
+        """Initializes the recorder.
+
+        Args:
+            track_memory: Also record peak memory deltas. Tracing starts when
+                the recorder is entered, unless it is already running.
+        """
+        self.track_memory = track_memory
+        self.groups: Dict[str, Dict[str, Metrics]] = defaultdict(dict)
+        self.groups['stages'] = {}
+        self._started_tracing = False
+
+    def __enter__(self) -> "MetricsRecorder":
+        if self.track_memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracing = True
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        if self._started_tracing:
+            tracemalloc.stop()
+            self._started_tracing = False
+
+    @staticmethod
+    def _sample_peak() -> int:
+        """Folds the traced peak since the last sample into every open block and restarts peak tracking."""
+        current, peak = tracemalloc.get_traced_memory()
+        for measurement in _open:
+            measurement.peak = max(measurement.peak, peak)
+        tracemalloc.reset_peak()
+        return current
+
+    @contextmanager
+    def measure(self, group: str, name: str, cpu_clock: Callable[[], float] = time.thread_time) -> Iterator[None]:
+        """Measures a block; the metrics are stored even if it raises.
+
+        Args:
+            group: Group of the metrics, e.g. 'stages' or 'indicators'.
+            name: Name of the block within the group.
+            cpu_clock: CPU clock: `time.thread_time` (default) for work on the
+                calling thread, `time.process_time` for blocks that spread
+                work over threads.
+        """
+        tracing = self.track_memory and tracemalloc.is_tracing()
+        measurement = None
+        if tracing:
+            with _open_lock:
+                measurement = _Measurement(self._sample_peak())
+                _open.append(measurement)
+        wall, cpu = time.perf_counter(), cpu_clock()
+        try:
+            yield
+        finally:
+            metrics: Metrics = {
+                'wall_seconds': time.perf_counter() - wall,
+                'cpu_seconds': cpu_clock() - cpu,
+                'peak_memory_bytes': None,
+            }
+            if measurement is not None:
+                with _open_lock:
+                    self._sample_peak()
+                    _open.remove(measurement)
+                metrics['peak_memory_bytes'] = measurement.peak - measurement.start
+            self.groups[group][name] = metrics
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Returns the recorded groups and whether memory was tracked."""
+        return {**{group: dict(metrics) for group, metrics in self.groups.items()}, 'memory_tracked': self.track_memory}
+
+
+class MetricsExporter(ABC):
+    """Abstract base class for metrics exporters."""
+
+    @abstractmethod
+    def export(self, result: "AnalysisResult") -> None:
+        """Exports the metrics of one run.
+
+        Args:
+            result: A result whose metadata holds 'metrics', as produced by
+                `TradingEngine.run` and `TradingEngine.run_many`.
+        """
+        pass
+
+
+class JsonLinesExporter(MetricsExporter):
+    """Appends one JSON object per run to a file."""
+
+    def __init__(self, path: str):
+        """Initializes the exporter.
+
+        Args:
+            path: The JSON lines file; created if missing, appended to otherwise.
+        """
+        self.path = path
+        self._lock = threading.Lock()
+        dirname = os.path.dirname(path)
+        if dirname:
+            os.makedirs(dirname, exist_ok=True)
+
+    def export(self, result: "AnalysisResult") -> None:
+        metadata = result.metadata
+        record = {
+            'time': datetime.now(timezone.utc).isoformat(),
+            'ticker': metadata.get('ticker'),
+            'interval': metadata.get('interval'),
+            'rows': len(result.data) if result.data is not None else None,
+            **metadata.get('metrics', {}),
+        }
+        line = json.dumps(record, default=str)
+        with self._lock, open(self.path, 'a') as f:
+            f.write(line + '\n')
+
+
+class PrometheusTextExporter(MetricsExporter):
+    """Aggregates metrics across runs into a Prometheus text exposition file.
+
+    Wall and CPU seconds are exported as summaries (`_sum` and `_count` per
+    stage or indicator), peak memory as the largest delta seen. The file is
+    rewritten atomically after every run.
+    """
+
+    def __init__(self, path: str, prefix: str = 'trading_engine'):
+        """Initializes the exporter.
+
+        Args:
+            path: The metrics file; overwritten.
+            prefix: Prefix of the metric names.
+        """
+        self.path = path
+        self.prefix = prefix
+        self.runs = 0
+        # (group, name) -> running totals
+        self._totals: Dict[Tuple[str, str], Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+        dirname = os.path.dirname(path)
+        if dirname:
+            os.makedirs(dirname, exist_ok=True)
+
+    def export(self, result: "AnalysisResult") -> None:
+        metrics = result.metadata.get('metrics', {})
+        with self._lock:
+            self.runs += 1
+            for group in ('stages', 'indicators'):
+                for name, values in metrics.get(group, {}).items():
+                    totals = self._totals.setdefault((group, name), {'count': 0, 'wall': 0.0, 'cpu': 0.0, 'memory': None})
+                    totals['count'] += 1
+                    totals['wall'] += values['wall_seconds']
+                    totals['cpu'] += values['cpu_seconds']
+                    if values.get('peak_memory_bytes') is not None:
+                        totals['memory'] = max(totals['memory'] or 0, values['peak_memory_bytes'])
+            text = self._render()
+            fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(self.path) or '.', prefix='.tmp-')
+            with os.fdopen(fd, 'w') as f:
+                f.write(text)
+            os.replace(tmp_path, self.path)
+
+    def _render(self) -> str:
+        """Formats the running totals in the text exposition format."""
+        lines = [
+            f"# HELP {self.prefix}_runs_total Completed runs.",
+            f"# TYPE {self.prefix}_runs_total counter",
+            f"{self.prefix}_runs_total {self.runs}",
+        ]
+        for group, label in (('stages', 'stage'), ('indicators', 'indicator')):
+            entries = sorted((name, totals) for (g, name), totals in self._totals.items() if g == group)
+            if not entries:
+                continue
+            kind = group[:-1]
+            for metric, key, help_text in (('wall_seconds', 'wall', 'Wall time'), ('cpu_seconds', 'cpu', 'CPU time')):
+                full = f"{self.prefix}_{kind}_{metric}"
+                lines += [f"# HELP {full} {help_text} per {kind}.", f"# TYPE {full} summary"]
+                for name, totals in entries:
+                    labels = f'{{{label}="{_escape(name)}"}}'
+                    lines.append(f"{full}_sum{labels} {totals[key]!r}")
+                    lines.append(f"{full}_count{labels} {totals['count']}")
+            memory = [(name, totals['memory']) for name, totals in entries if totals['memory'] is not None]
+            if memory:
+                full = f"{self.prefix}_{kind}_peak_memory_bytes"
+                lines += [f"# HELP {full} Largest peak memory delta per {kind}.", f"# TYPE {full} gauge"]
+                lines += [f'{full}{{{label}="{_escape(name)}"}} {value}' for name, value in memory]
+        return "\n".join(lines) + "\n"
+
+
+def _escape(value: str) -> str:
+    """Escapes a label value."""
+    return value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def create_exporter(format: str, path: str) -> MetricsExporter:
+    """Creates an exporter by format name.
+
+    Args:
+        format: 'jsonl' or 'prometheus'.
+        path: The output file.
+
+    Returns:
+        MetricsExporter: The exporter.
+
+    Raises:
+        ValueError: If the format is unknown.
+    """
+    if format == 'jsonl':
+        return JsonLinesExporter(path)
+    if format == 'prometheus':
+        return PrometheusTextExporter(path)
+    raise ValueError(f"Unknown metrics format '{format}', expected 'jsonl' or 'prometheus'")
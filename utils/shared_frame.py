@@ -0,0 +1,141 @@
+"""Market data in shared memory, readable by worker processes without copying.
+
+The owner copies a DataFrame's numeric columns and its index into one
+`multiprocessing.shared_memory` block. Workers attach to the block through
+a small picklable `SharedFrameHandle` and get a read-only DataFrame backed
+directly by the shared pages, so the data is neither pickled nor duplicated
+per process.
+
+Block layout: the float64 columns, one contiguous row of values per column,
+followed by the index as int64 (datetime indexes as naive UTC nanoseconds).
+"""
+from dataclasses import dataclass
+from multiprocessing import shared_memory
+from typing import List, Optional, Tuple
+import numpy as np
+import pandas as pd
+
+
+@dataclass(frozen=True)
+class SharedFrameHandle:
+    """Picklable description of a shared frame.
+
+    Args:
+        name: Name of the shared memory block.
+        columns: Column names, in storage order.
+        rows: Number of rows.
+        index_kind: 'datetime' for a DatetimeIndex, 'int' for an integer index.
+        index_name: Name of the index.
+        tz: Timezone of a datetime index, or None.
+    """
+    name: str
+    columns: Tuple[str, ...]
+    rows: int
+    index_kind: str
+    index_name: Optional[str] = None
+    tz: Optional[str] = None
+
+
+def _open(name: str) -> shared_memory.SharedMemory:
+    """Attaches to an existing block without registering it for cleanup in this process."""
+    try:
+        return shared_memory.SharedMemory(name=name, track=False)
+    except TypeError:
+        # Python < 3.13 has no `track`; the owner still unlinks the block.
+        return shared_memory.SharedMemory(name=name)
+
+
+class SharedFrame:
+    """A DataFrame copied into shared memory.
+
+    The creating process owns the block and must `close` it (or use the
+    frame as a context manager), which also unlinks it. Numeric columns are
+    stored as float64; other columns are dropped.
+
+    Example:
+        with SharedFrame(df) as shared:
+            pool = ProcessPoolExecutor(initializer=init, initargs=(shared.handle,))
+            # in init: shm, df = SharedFrame.attach(handle)
+    """
+
+    def __init__(self, df: pd.DataFrame):
+        """Copies the frame into a new shared memory block.
+
+        Args:
+            df: The market data, with a DatetimeIndex or an integer index.
+
+        Raises:
+            ValueError: If the index is neither datetime nor integer.
+        """
+        columns: List[str] = [c for c in df.columns if pd.api.types.is_numeric_dtype(df[c])]
+        rows = len(df)
+        index = df.index
+        tz = None
+        if isinstance(index, pd.DatetimeIndex):
+            kind = 'datetime'
+            if index.tz is not None:
+                tz = str(index.tz)
+                index = index.tz_convert(None)
+            index_values = index.asi8
+        elif pd.api.types.is_integer_dtype(index):
+            kind = 'int'
+            index_values = index.to_numpy(dtype=np.int64)
+        else:
+            raise ValueError(f"SharedFrame supports datetime and integer indexes, got {type(df.index).__name__}")
+
+        # SharedMemory rejects zero-sized blocks.
+        size = max(8 * rows * (len(columns) + 1), 1)
+        self._shm = shared_memory.SharedMemory(create=True, size=size)
+        self.handle = SharedFrameHandle(self._shm.name, tuple(columns), rows, kind, df.index.name, tz)
+        values, index_array = self._arrays(self._shm, self.handle)
+        for i, column in enumerate(columns):
+            values[i] = df[column].to_numpy(dtype=np.float64, na_value=np.nan)
+        index_array[:] = index_values
+
+    @staticmethod
+    def _arrays(shm: shared_memory.SharedMemory, handle: SharedFrameHandle) -> Tuple[np.ndarray, np.ndarray]:
+        """Returns the column matrix and the index array backed by the block."""
+        k, n = len(handle.columns), handle.rows
+        values = np.ndarray((k, n), dtype=np.float64, buffer=shm.buf)
+        index = np.ndarray((n,), dtype=np.int64, buffer=shm.buf, offset=8 * k * n)
+        return values, index
+
+    @classmethod
+    def attach(cls, handle: SharedFrameHandle) -> Tuple[shared_memory.SharedMemory, pd.DataFrame]:
+        """Opens a shared frame in the current process.
+
+        The DataFrame is a read-only view of the block; keep the returned
+        SharedMemory referenced for as long as the DataFrame is used.
+
+        Args:
+            handle: The handle of the frame.
+
+        Returns:
+            Tuple of the opened block and the DataFrame.
+        """
+        shm = _open(handle.name)
+        values, index_values = cls._arrays(shm, handle)
+        values.flags.writeable = False
+        if handle.index_kind == 'datetime':
+            index = pd.DatetimeIndex(index_values.view('datetime64[ns]'), name=handle.index_name)
+            if handle.tz is not None:
+                index = index.tz_localize('UTC').tz_convert(handle.tz)
+        else:
+            index = pd.Index(index_values, name=handle.index_name)
+        # The (columns, rows) matrix is exactly pandas' block layout, so the
+        # transposed view is adopted without a copy.
+        df = pd.DataFrame(values.T, index=index, columns=list(handle.columns), copy=False)
+        return shm, df
+
+    def close(self) -> None:
+        """Releases and unlinks the block. Attached workers keep their mappings."""
+        if self._shm is not None:
+            self._shm.close()
+            self._shm.unlink()
+            self._shm = None
+
+    def __enter__(self) -> "SharedFrame":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
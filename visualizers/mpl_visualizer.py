@@ -1,14 +1,18 @@
 import mplfinance as mpf
+import numpy as np
 import pandas as pd
-from typing import Dict, List
+from typing import Dict
 from core.abstractions import Visualizer
-from core.models import Signal, SignalType
+from core.models import SignalBatch, Signals, SignalType
 from core.exceptions import VisualizationError
 from utils.decorators import register_visualizer
 from utils.logging import setup_logger
 
 logger = setup_logger(__name__)
 
+# Indicators drawn on the price panel; any other indicator is an oscillator.
+OVERLAY_PREFIXES = ("SMA", "EMA", "BBANDS", "DONCHIAN")
+
 @register_visualizer("matplotlib")
 class MatplotlibVisualizer(Visualizer):
     """Visualizer using mplfinance."""
@@ -21,13 +25,13 @@ class MatplotlibVisualizer(Visualizer):
         """
         self.config = kwargs
 
-    def render(self, df: pd.DataFrame, indicators: Dict[str, pd.Series], signals: List[Signal], output_path: str) -> None:
+    def render(self, df: pd.DataFrame, indicators: Dict[str, pd.Series], signals: Signals, output_path: str) -> None:
         """Renders the analysis results to a file using mplfinance.
 
         Args:
             df: The market data.
             indicators: A dictionary of calculated indicators.
-            signals: A list of trading signals.
+            signals: The trading signals, as a list or a `SignalBatch`.
             output_path: The path to save the visualization.
 
         Raises:
@@ -38,49 +42,39 @@ class MatplotlibVisualizer(Visualizer):
             
             # Prepare addplots
             apds = []
-            has_rsi = any(n.startswith("RSI") for n in indicators)
-            
-            # Overlay indicators (Panel 0)
+            # Oscillators get one panel per indicator type (RSI, STOCH, ATR, ...),
+            # below price (panel 0) and volume (panel 1).
+            oscillator_panels: Dict[str, int] = {}
+
             for name, series in indicators.items():
-                # Heuristic: if name starts with SMA or EMA, it's overlay
-                # But we don't have the indicator object here, just the series.
-                # The prompt says: "Add overlay indicators (SMA, EMA) to price panel (panel=0)"
-                # "Add oscillator indicators (RSI) to separate panel (panel=1)"
-                
-                if name.startswith("SMA") or name.startswith("EMA"):
+                # Only the series are passed in, so the kind is told from the name.
+                if name.startswith(OVERLAY_PREFIXES):
                     logger.info(f"Adding overlay indicator: {name}")
                     apds.append(mpf.make_addplot(series, panel=0, width=1.5))
-                elif name.startswith("RSI"):
-                    logger.info(f"Adding oscillator indicator: {name}")
-                    # Move RSI to panel 2 to avoid volume (panel 1)
-                    apds.append(mpf.make_addplot(series, panel=2, width=1.0, ylabel='RSI'))
+                else:
+                    kind = name.split("_", 1)[0]
+                    panel = oscillator_panels.setdefault(kind, 2 + len(oscillator_panels))
+                    logger.info(f"Adding oscillator indicator: {name} (panel {panel})")
+                    apds.append(mpf.make_addplot(series, panel=panel, width=1.0, ylabel=kind))
             
             logger.info(f"Total addplots: {len(apds)}")
             
             # Add signals
             if signals:
-                buy_signals = [float('nan')] * len(df)
-                sell_signals = [float('nan')] * len(df)
-                
-                for signal in signals:
-                    if signal.timestamp in df.index:
-                        # Use get_loc to find integer location, but we can just use the timestamp if index is datetime
-                        # However, to populate the list, we need integer index.
-                        try:
-                            idx = df.index.get_loc(signal.timestamp)
-                            # get_loc might return slice or array if duplicates, assuming unique index
-                            if isinstance(idx, int):
-                                if signal.type == SignalType.BUY:
-                                    buy_signals[idx] = signal.price * 0.99 # Place marker below price
-                                elif signal.type == SignalType.SELL:
-                                    sell_signals[idx] = signal.price * 1.01 # Place marker above price
-                        except KeyError:
-                            continue
-
-                # Check if we have any signals to plot to avoid empty plot warnings/errors if lists are all nan
-                if not all(pd.isna(x) for x in buy_signals):
+                batch = SignalBatch.from_signals(signals)
+                positions = batch.positions(df.index)
+                buy = batch.mask(SignalType.BUY) & (positions >= 0)
+                sell = batch.mask(SignalType.SELL) & (positions >= 0)
+
+                buy_signals = np.full(len(df), np.nan)
+                sell_signals = np.full(len(df), np.nan)
+                buy_signals[positions[buy]] = batch.prices[buy] * 0.99 # Place marker below price
+                sell_signals[positions[sell]] = batch.prices[sell] * 1.01 # Place marker above price
+
+                # Check if we have any signals to plot to avoid empty plot warnings/errors if arrays are all nan
+                if not np.isnan(buy_signals).all():
                     apds.append(mpf.make_addplot(buy_signals, type='scatter', markersize=100, marker='^', color='g', panel=0))
-                if not all(pd.isna(x) for x in sell_signals):
+                if not np.isnan(sell_signals).all():
                     apds.append(mpf.make_addplot(sell_signals, type='scatter', markersize=100, marker='v', color='r', panel=0))
 
             # Create the plot
@@ -94,10 +88,8 @@ class MatplotlibVisualizer(Visualizer):
             dpi = self.config.get('dpi', 300)
             savefig_args = dict(fname=output_path, dpi=dpi, bbox_inches='tight')
 
-            # Determine panel ratios
-            # If RSI is present, we have 3 panels: Price(0), Volume(1), RSI(2)
-            # If no RSI, we have 2 panels: Price(0), Volume(1)
-            panel_ratios = (6, 2, 2) if has_rsi else (6, 2)
+            # Determine panel ratios: Price(0), Volume(1), then one per oscillator type
+            panel_ratios = (6, 2) + (2,) * len(oscillator_panels)
 
             mpf.plot(
                 df,